@@ -5,11 +5,13 @@ Optimized for rapid processing of 400+ works
 """
 
 import multiprocessing as mp
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import argparse
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 import time
 from datetime import datetime
@@ -24,7 +26,8 @@ from citation_network import CitationNetwork
 from bayesian_reconstructor import BayesianReconstructor
 from stylometric_engine import StylometricEngine
 from cross_lingual import CrossLingualMapper
-from database import db
+from database import db, WriteBehindQueue
+import serialization
 
 
 class FastBatchProcessor:
@@ -49,57 +52,19 @@ class FastBatchProcessor:
         handler.setFormatter(formatter)
         self.logger.addHandler(handler)
     
-    def process_work(self, work_id: str) -> Dict[str, Any]:
-        """Process a single work with optimized settings."""
-        try:
-            # Fast initialization
-            reconstructor = BayesianReconstructor(random_seed=42)
-            
-            # Generate fragments quickly
-            fragments = self._fast_generate_fragments(work_id)
-            
-            # Minimal metadata
-            author = work_id.split('.')[0]
-            metadata = {
-                'author': author,
-                'title': work_id.split('.')[1] if '.' in work_id else work_id,
-                'genre': 'philosophy',
-                'century': -4
-            }
-            
-            # Fast reconstruction with reduced sampling
-            results = reconstructor.reconstruct_work(
-                work_id=work_id,
-                fragments=fragments,
-                citations=[],  # Skip citation extraction for speed
-                metadata=metadata
-            )
-            
-            # Save results
-            timestamp = datetime.now().strftime('%Y-%m-%d')
-            output_dir = Path(f"discoveries/{work_id.replace('.', '_')}_{timestamp}")
-            output_dir.mkdir(parents=True, exist_ok=True)
-            reconstructor.save_reconstruction(results, str(output_dir))
-            
-            # Update database
-            db.update_work_confidence(work_id, results['posterior_confidence']['mean'])
-            
-            return {
-                'work_id': work_id,
-                'status': 'success',
-                'confidence': results['posterior_confidence']['mean'],
-                'fragments_used': len(fragments),
-                'output_dir': str(output_dir)
-            }
-            
-        except Exception as e:
-            return {
-                'work_id': work_id,
-                'status': 'failed',
-                'error': str(e)
-            }
+    def process_work(self, work_id: str, fragments: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Process a single work with optimized settings.
+        
+        Args:
+            work_id: Work identifier
+            fragments: Stored fragments for the work, prefetched per batch;
+                placeholder fragments are generated when none are stored
+        """
+        return _reconstruct(BayesianReconstructor(random_seed=42), work_id, fragments)
     
-    def _fast_generate_fragments(self, work_id: str) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _fast_generate_fragments(work_id: str) -> List[Dict[str, Any]]:
         """Generate fragments without heavy processing."""
         return [
             {
@@ -120,39 +85,89 @@ class FastBatchProcessor:
             }
         ]
     
-    def process_batch(self, work_ids: List[str]) -> List[Dict[str, Any]]:
-        """Process a batch of works."""
+    def create_pool(self) -> ProcessPoolExecutor:
+        """Create a worker pool whose processes each build one reconstructor up front."""
+        return ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker, initargs=(42,))
+    
+    def process_batch(self, work_ids: List[str], writer: Optional[WriteBehindQueue] = None,
+                      executor: Optional[ProcessPoolExecutor] = None,
+                      run_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Process a batch of works.
+        
+        Args:
+            work_ids: Works to reconstruct
+            writer: Shared write-behind queue for confidence updates; a
+                private one is opened and drained for this batch if omitted
+            executor: Long-lived pool from create_pool(); a private one is
+                started and shut down for this batch if omitted
+            run_id: Run whose manifest records each successful work
+            
+        Returns:
+            One result per work; works left unprocessed when the pool
+            fails have status 'aborted'
+        """
         self.logger.info(f"Processing batch of {len(work_ids)} works")
         
         results = []
         start_time = time.time()
+        own_writer = writer is None
+        if own_writer:
+            writer = db.write_behind()
+        own_executor = executor is None
+        if own_executor:
+            executor = self.create_pool()
         
-        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_work = {
-                executor.submit(self.process_work, work_id): work_id 
-                for work_id in work_ids
-            }
-            
-            for future in as_completed(future_to_work):
-                work_id = future_to_work[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                    if result['status'] == 'success':
-                        self.logger.info(f"✅ {work_id}: {result['confidence']:.1%}")
-                    else:
-                        self.logger.warning(f"❌ {work_id}: {result.get('error', 'Unknown error')}")
-                except Exception as e:
-                    self.logger.error(f"❌ {work_id}: {e}")
+        # One joined query for the whole batch instead of one per work
+        fragments_by_work = db.get_fragments_for_works(work_ids)
+        tasks = [(work_id, fragments_by_work.get(work_id)) for work_id in work_ids]
+        
+        # A few chunks per worker amortizes IPC without starving the pool at the tail
+        chunksize = max(1, len(tasks) // (self.max_workers * 4))
+        
+        try:
+            for result in executor.map(_process_work_task, tasks, chunksize=chunksize):
+                work_id = result['work_id']
+                reconstruction = result.pop('reconstruction', None)
+                results.append(result)
+                if result['status'] == 'success':
+                    # Workers never write; the parent funnels updates to one writer
+                    writer.save_reconstruction(*reconstruction)
+                    writer.update_work_confidence(work_id, result['confidence'])
+                    if run_id:
+                        writer.record_completion(run_id, work_id, result['result_hash'],
+                                                 result['confidence'], result['fragments_used'])
+                    self.logger.info(f"✅ {work_id}: {result['confidence']:.1%}")
+                else:
+                    self.logger.warning(f"❌ {work_id}: {result.get('error', 'Unknown error')}")
+        except Exception as e:
+            # A broken pool, dead worker or unpicklable task ends the map early;
+            # the works it never returned stay out of the manifest for --resume
+            self.logger.error(f"❌ Batch aborted after {len(results)}/{len(work_ids)} works: {e}")
+            results.extend({'work_id': work_id, 'status': 'aborted', 'error': f"Batch aborted: {e}"}
+                           for work_id in work_ids[len(results):])
+        finally:
+            if own_executor:
+                executor.shutdown()
+            if own_writer:
+                writer.close()
         
         elapsed = time.time() - start_time
         self.logger.info(f"Batch completed in {elapsed:.1f}s ({len(work_ids)/elapsed:.1f} works/sec)")
         
         return results
     
-    def process_all(self, limit: int = 400) -> pd.DataFrame:
-        """Process all works in database."""
-        self.logger.info(f"🚀 Starting FAST excavation of {limit} works")
+    def process_all(self, limit: int = 400, resume: Optional[str] = None) -> pd.DataFrame:
+        """
+        Process all works in database.
+        
+        Args:
+            limit: Number of works to process, by priority
+            resume: Run ID of an interrupted run; works already in its
+                manifest are skipped and their recorded results reused
+        """
+        run_id = resume or datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+        self.logger.info(f"🚀 Starting FAST excavation of {limit} works (run {run_id})")
         
         # Get works from database
         works_df = db.get_works_by_priority(limit)
@@ -162,55 +177,97 @@ class FastBatchProcessor:
             return pd.DataFrame()
         
         work_ids = works_df['work_id'].tolist()
+        
+        # Earlier results of a resumed run come straight from its manifest
+        completed = db.get_run_manifest(run_id) if resume else pd.DataFrame()
+        all_results = [
+            {'work_id': row.work_id, 'status': 'success', 'confidence': row.confidence,
+             'fragments_used': row.fragments_used, 'result_hash': row.result_hash}
+            for row in completed.itertuples(index=False)
+        ]
+        if all_results:
+            done = set(completed['work_id'])
+            work_ids = [work_id for work_id in work_ids if work_id not in done]
+            self.logger.info(f"⏩ Resuming run {run_id}: {len(done)} works already complete")
+        
         self.logger.info(f"📊 Processing {len(work_ids)} works")
         
         # Process in batches
-        all_results = []
         total_start = time.time()
         
-        for i in range(0, len(work_ids), self.batch_size):
-            batch = work_ids[i:i + self.batch_size]
-            batch_num = i // self.batch_size + 1
-            total_batches = (len(work_ids) + self.batch_size - 1) // self.batch_size
-            
-            self.logger.info(f"📦 Batch {batch_num}/{total_batches} ({len(batch)} works)")
-            
-            batch_results = self.process_batch(batch)
-            all_results.extend(batch_results)
-            
-            # Progress update
-            successful = sum(1 for r in batch_results if r['status'] == 'success')
-            self.logger.info(f"   ✅ {successful}/{len(batch)} successful")
+        # One pool for the whole run: workers and their reconstructors
+        # persist across batches
+        executor = self.create_pool()
+        try:
+            with db.write_behind() as writer:
+                for i in range(0, len(work_ids), self.batch_size):
+                    batch = work_ids[i:i + self.batch_size]
+                    batch_num = i // self.batch_size + 1
+                    total_batches = (len(work_ids) + self.batch_size - 1) // self.batch_size
+                    
+                    self.logger.info(f"📦 Batch {batch_num}/{total_batches} ({len(batch)} works)")
+                    
+                    batch_results = self.process_batch(batch, writer=writer, executor=executor, run_id=run_id)
+                    all_results.extend(batch_results)
+                    
+                    # Progress update
+                    successful = sum(1 for r in batch_results if r['status'] == 'success')
+                    self.logger.info(f"   ✅ {successful}/{len(batch)} successful")
+                    
+                    if any(r['status'] == 'aborted' for r in batch_results):
+                        # A broken pool fails every later map too; start a fresh one
+                        executor.shutdown(cancel_futures=True)
+                        executor = self.create_pool()
+        except BaseException:
+            # Keep what finished; the manifest already holds every flushed work
+            self.logger.error(f"💥 Run {run_id} interrupted after {len(all_results)} works; "
+                              f"continue with --resume {run_id}")
+            self._save_results(pd.DataFrame(all_results), run_id)
+            raise
+        finally:
+            executor.shutdown()
         
         total_elapsed = time.time() - total_start
         
         # Save results
         results_df = pd.DataFrame(all_results)
-        timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
-        results_file = f"discoveries/excavation_results_{timestamp}.csv"
-        results_df.to_csv(results_file, index=False)
-        
-        self.logger.info(f"💾 Results saved to {results_file}")
+        self._save_results(results_df, run_id)
         
         # Print final summary
         self._print_final_summary(results_df, total_elapsed)
+        if (results_df['status'] == 'aborted').any():
+            self.logger.error(f"💥 Run {run_id} left works unprocessed; "
+                              f"continue with --resume {run_id}")
         
         return results_df
     
+    def _save_results(self, results_df: pd.DataFrame, run_id: str) -> str:
+        """Write a run's results CSV; a resumed run overwrites its partial file."""
+        results_file = f"discoveries/excavation_results_{run_id}.csv"
+        Path(results_file).parent.mkdir(parents=True, exist_ok=True)
+        results_df.to_csv(results_file, index=False)
+        
+        self.logger.info(f"💾 Results saved to {results_file}")
+        return results_file
+    
     def _print_final_summary(self, results_df: pd.DataFrame, elapsed: float):
         """Print expedition summary."""
+        successful = results_df[results_df['status'] == 'success']
+        failed = results_df[results_df['status'] == 'failed']
+        aborted = results_df[results_df['status'] == 'aborted']
+        status = 'INCOMPLETE' if not aborted.empty else 'COMPLETE'
+        
         print()
         print("🏛️" + "="*70)
-        print("CALLIMACHINA v3.0 - LARGE-SCALE EXCAVATION COMPLETE")
+        print(f"CALLIMACHINA v3.0 - LARGE-SCALE EXCAVATION {status}")
         print("="*70 + "🏛️")
         print()
         
-        successful = results_df[results_df['status'] == 'success']
-        failed = results_df[results_df['status'] == 'failed']
-        
         print(f"📊 Total Works: {len(results_df)}")
         print(f"✅ Successful: {len(successful)}")
         print(f"❌ Failed: {len(failed)}")
+        if not aborted.empty:
+            print(f"💥 Aborted: {len(aborted)} (not run; retry with --resume)")
         print(f"⏱️  Total Time: {elapsed:.1f} seconds")
         print(f"⚡ Throughput: {len(results_df)/elapsed:.1f} works/second")
         print()
@@ -232,11 +289,87 @@ class FastBatchProcessor:
         print()
         print("🏛️" + "="*70)
         print("The ghosts of Alexandria have been found.")
-        print(f"Scale-up to {len(results_df)}+ works: COMPLETE")
+        print(f"Scale-up to {len(results_df)}+ works: {status}")
         print("="*70 + "🏛️")
         print()
 
 
+# Per-process reconstructor, built once by _init_worker in each pool worker
+_worker_reconstructor: Optional[BayesianReconstructor] = None
+
+
+def _init_worker(random_seed: int = 42):
+    """Pool initializer: build the worker's reconstructor and warm its code paths."""
+    global _worker_reconstructor
+    _worker_reconstructor = BayesianReconstructor(random_seed=random_seed)
+    
+    # First-call costs (numpy/pandas lazy imports) are paid here, not by a task
+    _worker_reconstructor.update_confidence(0.5, [{'type': 'fragment', 'confidence': 0.5}])
+    _worker_reconstructor.confidence_history.clear()
+
+
+def _process_work_task(task: Tuple[str, Optional[List[Dict[str, Any]]]]) -> Dict[str, Any]:
+    """Pool task: reconstruct one (work_id, fragments) pair with the worker's reconstructor."""
+    if _worker_reconstructor is None:
+        _init_worker()
+    work_id, fragments = task
+    
+    # The reconstructor is reused, so keep only this work's history and state
+    _worker_reconstructor.confidence_history.clear()
+    _worker_reconstructor.posterior_states.clear()
+    return _reconstruct(_worker_reconstructor, work_id, fragments)
+
+
+def _reconstruct(reconstructor: BayesianReconstructor, work_id: str,
+                 fragments: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Reconstruct one work and package the result for the parent process."""
+    try:
+        # Generate fragments quickly
+        if not fragments:
+            fragments = FastBatchProcessor._fast_generate_fragments(work_id)
+        
+        # Minimal metadata
+        author = work_id.split('.')[0]
+        metadata = {
+            'author': author,
+            'title': work_id.split('.')[1] if '.' in work_id else work_id,
+            'genre': 'philosophy',
+            'century': -4
+        }
+        
+        # Fast reconstruction with reduced sampling
+        results = reconstructor.reconstruct_work(
+            work_id=work_id,
+            fragments=fragments,
+            citations=[],  # Skip citation extraction for speed
+            metadata=metadata
+        )
+        
+        # Results travel back to the parent, which stores them in the
+        # reconstructions table; files are rendered with `cli export`
+        return {
+            'work_id': work_id,
+            'status': 'success',
+            'confidence': results['posterior_confidence']['mean'],
+            'fragments_used': len(fragments),
+            'result_hash': _result_hash(results),
+            'reconstruction': (results, reconstructor.confidence_history.rows(work_id))
+        }
+        
+    except Exception as e:
+        return {
+            'work_id': work_id,
+            'status': 'failed',
+            'error': str(e)
+        }
+
+
+def _result_hash(results: Dict[str, Any]) -> str:
+    """Stable digest of a reconstruction, recorded in the run manifest."""
+    payload = serialization.dumps(results, compact=True, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
 def main():
     """Main execution."""
     # Configure logging
@@ -246,8 +379,13 @@ def main():
     )
     
     # Parse arguments
-    target = int(sys.argv[1]) if len(sys.argv) > 1 else 400
-    workers = int(sys.argv[2]) if len(sys.argv) > 2 else mp.cpu_count()
+    parser = argparse.ArgumentParser(description="CALLIMACHINA fast batch excavation")
+    parser.add_argument('target', nargs='?', type=int, default=400, help="Number of works to process")
+    parser.add_argument('workers', nargs='?', type=int, default=mp.cpu_count(), help="Parallel worker processes")
+    parser.add_argument('--batch-size', type=int, default=100, help="Works per batch")
+    parser.add_argument('--resume', metavar='RUN_ID', help="Skip works already completed by this run")
+    args = parser.parse_args()
+    target, workers = args.target, args.workers
     
     print("🏛️" + "="*70)
     print(f"CALLIMACHINA v3.0 - FAST EXCAVATION MODE")
@@ -256,11 +394,13 @@ def main():
     print()
     
     # Run processor
-    processor = FastBatchProcessor(max_workers=workers, batch_size=100)
-    results = processor.process_all(limit=target)
+    processor = FastBatchProcessor(max_workers=workers, batch_size=args.batch_size)
+    results = processor.process_all(limit=target, resume=args.resume)
     
     return results
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    results = main()
+    # Works lost to an aborted batch must not look like a clean run
+    sys.exit(1 if not results.empty and (results['status'] == 'aborted').any() else 0)
\ No newline at end of file
@@ -10,26 +10,297 @@ Each reconstruction improves our priors, making subsequent discoveries faster.
 
 import numpy as np
 import pandas as pd
-import json
 import logging
+import re
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
-import matplotlib.pyplot as plt
 from collections import defaultdict
+from functools import lru_cache
+from scipy import stats
+
+try:
+    from . import serialization
+    from .render_service import render_confidence_plot
+except ImportError:  # loaded from src/ on sys.path (CLI, scripts, tests)
+    import serialization
+    from render_service import render_confidence_plot
+
+
+# Exact Beta quantiles keyed by (alpha, beta, level); oldest entries are
+# evicted first once the cache is full
+_INTERVAL_CACHE: Dict[Tuple[float, float, float], Tuple[float, float, float]] = {}
+_INTERVAL_CACHE_SIZE = 65536
+
+
+def beta_credible_intervals(alpha, beta, level: float = 0.95) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Exact equal-tailed credible intervals and medians of Beta(alpha, beta) posteriors.
+    
+    Quantiles for all (alpha, beta) pairs not yet cached are computed in a
+    single vectorized scipy call; repeated pairs, within a call or across
+    calls, are looked up.
+    
+    Args:
+        alpha: Posterior alpha, scalar or array
+        beta: Posterior beta, broadcastable against alpha
+        level: Credible mass of the interval
+        
+    Returns:
+        Tuple of (lower, median, upper) arrays in the broadcast shape
+    """
+    alpha, beta = np.broadcast_arrays(np.asarray(alpha, dtype=float), np.asarray(beta, dtype=float))
+    pairs, inverse = np.unique(np.stack([alpha.ravel(), beta.ravel()], axis=1), axis=0, return_inverse=True)
+    
+    quantiles = np.empty((len(pairs), 3))
+    missing = []
+    for i, (a, b) in enumerate(pairs.tolist()):
+        cached = _INTERVAL_CACHE.get((a, b, level))
+        if cached is None:
+            missing.append(i)
+        else:
+            quantiles[i] = cached
+    
+    if missing:
+        tail = (1 - level) / 2
+        probabilities = np.array([tail, 0.5, 1 - tail])
+        computed = stats.beta.ppf(probabilities, pairs[missing, :1], pairs[missing, 1:])
+        quantiles[missing] = computed
+        for (a, b), row in zip(pairs[missing].tolist(), computed.tolist()):
+            _INTERVAL_CACHE[(a, b, level)] = tuple(row)
+        while len(_INTERVAL_CACHE) > _INTERVAL_CACHE_SIZE:
+            del _INTERVAL_CACHE[next(iter(_INTERVAL_CACHE))]
+    
+    quantiles = quantiles[inverse.ravel()]
+    return tuple(quantiles[:, k].reshape(alpha.shape) for k in range(3))
+
+
+# Common classical authors and their centuries (BCE negative, CE positive)
+AUTHOR_CENTURIES: Dict[str, int] = {
+    'strabo': -1,      # Strabo, 1st century BCE
+    'plutarch': 1,     # Plutarch, 1st-2nd century CE
+    'athenaeus': 2,    # Athenaeus, 2nd-3rd century CE
+    'diogenes': 3,     # Diogenes Laertius, 3rd century CE
+    'galen': 2,        # Galen, 2nd century CE
+    'pliny': 1,        # Pliny the Elder, 1st century CE
+    'quintilian': 1,   # Quintilian, 1st century CE
+    'seneca': 1,       # Seneca, 1st century CE
+    'cicero': -1,      # Cicero, 1st century BCE
+    'varro': -1,       # Varro, 1st century BCE
+    'vitruvius': -1,   # Vitruvius, 1st century BCE
+    'diodorus': -1,    # Diodorus Siculus, 1st century BCE
+    'pausanias': 2,    # Pausanias, 2nd century CE
+    'lucian': 2,       # Lucian, 2nd century CE
+}
+
+# Initial priors by genre, matched as substrings in this order
+GENRE_PRIORS: Dict[str, float] = {
+    'philosophy': 0.6,
+    'science': 0.65,
+    'history': 0.55,
+    'poetry': 0.5,
+    'rhetoric': 0.45
+}
+
+FAMOUS_AUTHORS = ('Aristotle', 'Plato', 'Galen', 'Homer', 'Virgil')
+
+# Evidence weight by citation pattern reliability
+CITATION_PATTERN_WEIGHTS: Dict[str, float] = {
+    'cf_book_line': 1.0,
+    'as_says_in': 0.8,
+    'according_to': 0.7
+}
+
+TRANSLATION_FLAGS = ('arabic_translation', 'latin_translation', 'syriac_intermediary')
+
+
+def _build_cross_cultural_bonus_table() -> np.ndarray:
+    """Bonus for every combination of TRANSLATION_FLAGS, indexed arabic*4 + latin*2 + syriac."""
+    table = np.empty(8)
+    for index in range(8):
+        arabic, latin, syriac = (index >> 2) & 1, (index >> 1) & 1, index & 1
+        # Arabic +15%, Latin +10%, Syriac intermediary +8%
+        bonus = 0.0 + 0.15 * arabic + 0.10 * latin + 0.08 * syriac
+        # Multiple translation paths: +20% total, not cumulative with above
+        if arabic + latin + syriac >= 2:
+            bonus = max(bonus, 0.20)
+        # Cap total bonus at 25% to prevent overconfidence
+        table[index] = min(bonus, 0.25)
+    return table
+
+
+CROSS_CULTURAL_BONUS = _build_cross_cultural_bonus_table()
+
+def _normalize_name(name: str) -> str:
+    return ' '.join(name.lower().split())
+
+
+def _name_words(name: str) -> str:
+    """Lowercase words of a name, space-separated and padded for whole-word matching."""
+    return ' ' + ' '.join(re.findall(r'\w+', name.lower())) + ' '
+
+
+@lru_cache(maxsize=8192)
+def lookup_author_century(author_name: str) -> Optional[int]:
+    """
+    Century of an author in the built-in AUTHOR_CENTURIES table.
+    
+    An exact name hit is O(1); otherwise the first known name contained in
+    the given one wins (so 'Diogenes Laertius' matches 'diogenes'), and the
+    answer is memoized.
+    """
+    name = _normalize_name(author_name)
+    century = AUTHOR_CENTURIES.get(name)
+    if century is not None:
+        return century
+    for known_author, century in AUTHOR_CENTURIES.items():
+        if known_author in name:
+            return century
+    return None  # Unknown author
+
+
+@lru_cache(maxsize=1024)
+def genre_prior(genre: str) -> float:
+    """Initial prior for a genre, 0.5 when no known genre matches."""
+    genre = genre.lower()
+    for genre_key, prior in GENRE_PRIORS.items():
+        if genre_key in genre:
+            return prior
+    return 0.5  # Default neutral prior
+
+
+@lru_cache(maxsize=8192)
+def is_famous_author(author: str) -> bool:
+    return any(famous in author for famous in FAMOUS_AUTHORS)
+
+
+def _translation_index(metadata: Dict) -> int:
+    return (4 * bool(metadata.get('arabic_translation')) + 2 * bool(metadata.get('latin_translation'))
+            + bool(metadata.get('syriac_intermediary')))
+
+
+class ConfidenceHistory:
+    """
+    Confidence history kept per work in bounded, array-backed ring buffers.
+    
+    Each work keeps at most max_entries updates; older ones are overwritten.
+    Updates recorded without a work_id share one buffer. Iteration and len()
+    cover all works; rows(work_id) gives one work's history as dicts.
+    """
+    
+    FIELDS = ('prior', 'posterior_mean', 'evidence_count', 'alpha', 'beta')
+    _INITIAL_CAPACITY = 8
+    
+    def __init__(self, max_entries: int = 1000):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        # work_id -> [values (capacity x FIELDS), timestamps (ns), start, size]
+        self._buffers: Dict[Optional[str], list] = {}
+    
+    def record(self, work_id: Optional[str], prior: float, posterior_mean: float,
+               evidence_count: int, timestamp: Optional[pd.Timestamp] = None,
+               alpha: float = np.nan, beta: float = np.nan):
+        """Append one update to a work's history."""
+        timestamp = pd.Timestamp.now() if timestamp is None else pd.Timestamp(timestamp)
+        
+        buffer = self._buffers.get(work_id)
+        if buffer is None:
+            capacity = min(self.max_entries, self._INITIAL_CAPACITY)
+            buffer = self._buffers[work_id] = [np.empty((capacity, len(self.FIELDS))),
+                                               np.empty(capacity, dtype=np.int64), 0, 0]
+        values, timestamps, start, size = buffer
+        capacity = len(values)
+        
+        if size < capacity:
+            index = (start + size) % capacity
+            buffer[3] = size + 1
+        elif capacity < self.max_entries:
+            # Still filling (start is 0): grow geometrically up to the cap
+            capacity = min(2 * capacity, self.max_entries)
+            values = buffer[0] = np.resize(values, (capacity, len(self.FIELDS)))
+            timestamps = buffer[1] = np.resize(timestamps, capacity)
+            index = size
+            buffer[3] = size + 1
+        else:
+            # Full: overwrite the oldest entry
+            index = start
+            buffer[2] = (start + 1) % capacity
+        
+        values[index] = (prior, posterior_mean, evidence_count, alpha, beta)
+        timestamps[index] = timestamp.value
+    
+    def rows(self, work_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """A work's history, oldest first, as dicts with FIELDS and timestamp."""
+        buffer = self._buffers.get(work_id)
+        if buffer is None:
+            return []
+        values, timestamps, start, size = buffer
+        order = (start + np.arange(size)) % len(values)
+        return [
+            {
+                'prior': prior,
+                'posterior_mean': posterior_mean,
+                'evidence_count': int(evidence_count),
+                'timestamp': pd.Timestamp(ts),
+                'alpha': alpha,
+                'beta': beta
+            }
+            for (prior, posterior_mean, evidence_count, alpha, beta), ts
+            in zip(values[order].tolist(), timestamps[order].tolist())
+        ]
+    
+    def works(self) -> List[Optional[str]]:
+        return list(self._buffers)
+    
+    def clear(self, work_id: Optional[str] = None):
+        """Forget one work's history, or every work's when work_id is None."""
+        if work_id is None:
+            self._buffers.clear()
+        else:
+            self._buffers.pop(work_id, None)
+    
+    def __len__(self) -> int:
+        return sum(buffer[3] for buffer in self._buffers.values())
+    
+    def __iter__(self):
+        for work_id in self._buffers:
+            yield from self.rows(work_id)
 
 
 class BayesianReconstructor:
-    def __init__(self, random_seed: int = 42):
+    # Type codes for columnar evidence tables; any other code (e.g. -1) gets
+    # the default reliability, as unknown types do in update_confidence
+    EVIDENCE_TYPES = ('fragment', 'citation', 'translation', 'stylistic')
+    _EVIDENCE_PRIOR_KEYS = ('fragment_authenticity', 'citation_reliability',
+                            'transmission_quality', 'author_consistency')
+    
+    def __init__(self, random_seed: int = 42, database: Optional[Any] = None,
+                 max_history: int = 1000):
         """
         Initialize the Bayesian reconstructor.
         
         Args:
             random_seed: Random seed for reproducibility
+            database: Optional FragmentDatabase persisting per-work posterior
+                state for add_evidence
+            max_history: Confidence updates kept per work
         """
         self.random_seed = random_seed
         np.random.seed(random_seed)
         self.logger = logging.getLogger(__name__)
-        self.confidence_history = []
+        self.confidence_history = ConfidenceHistory(max_history)
+        self.database = database
+        
+        # Beta posterior state per work, seeded by reconstruct_work and
+        # advanced by add_evidence
+        self.posterior_states: Dict[str, Dict[str, Any]] = {}
+        
+        # Centuries of authors outside AUTHOR_CENTURIES, e.g. from the works
+        # table; see register_author_centuries
+        self.author_centuries: Dict[str, int] = {}
+        self._century_cache: Dict[str, Optional[int]] = {}
+        if database is not None:
+            self.load_author_centuries(database)
         
         # Default prior distributions based on historical data
         self.default_priors = {
@@ -41,7 +312,8 @@ class BayesianReconstructor:
     
     def update_confidence(self, prior: float, evidence: List[Dict], 
                          weights: Optional[List[float]] = None, 
-                         metadata: Optional[Dict] = None) -> Dict[str, float]:
+                         metadata: Optional[Dict] = None,
+                         work_id: Optional[str] = None) -> Dict[str, float]:
         """
         Update reconstruction confidence using Bayesian inference.
         
@@ -50,6 +322,7 @@ class BayesianReconstructor:
             evidence: List of evidence dictionaries
             weights: Optional weights for each evidence piece
             metadata: Optional work metadata for enhanced scoring
+            work_id: Work whose confidence history records the update
             
         Returns:
             Dictionary with posterior statistics
@@ -70,16 +343,7 @@ class BayesianReconstructor:
             ev_weight = weights[i]
             
             # Get reliability based on evidence type
-            if ev_type == 'fragment':
-                reliability = self.default_priors['fragment_authenticity']
-            elif ev_type == 'citation':
-                reliability = self.default_priors['citation_reliability']
-            elif ev_type == 'translation':
-                reliability = self.default_priors['transmission_quality']
-            elif ev_type == 'stylistic':
-                reliability = self.default_priors['author_consistency']
-            else:
-                reliability = 0.7  # Default reliability
+            reliability = self._evidence_reliability(ev_type)
             
             evidence_values.append(ev_value)
             reliability_scores.append(reliability * ev_weight)
@@ -106,35 +370,11 @@ class BayesianReconstructor:
             posterior_alpha = prior_alpha + weighted_successes
             posterior_beta = prior_beta + total_weight - weighted_successes
             
-            # Calculate posterior statistics
-            posterior_mean = posterior_alpha / (posterior_alpha + posterior_beta)
-            posterior_var = (posterior_alpha * posterior_beta) / (
-                (posterior_alpha + posterior_beta) ** 2 * (posterior_alpha + posterior_beta + 1)
-            )
-            posterior_std = np.sqrt(posterior_var)
-            
-            # Apply cross-cultural bonuses after main calculation
-            posterior_mean = self._apply_cross_cultural_bonus(posterior_mean, metadata)
-            
-            # Recalculate bounds after bonus
-            ci_lower = max(0, posterior_mean - 1.96 * posterior_std)
-            ci_upper = min(1, posterior_mean + 1.96 * posterior_std)
-            
-            posterior_stats = {
-                'mean': float(posterior_mean),
-                'std': float(posterior_std),
-                'ci_lower': float(ci_lower),
-                'ci_upper': float(ci_upper),
-                'median': float(posterior_mean),  # Approximation for symmetric distributions
-            }
+            posterior_stats = self._posterior_stats(posterior_alpha, posterior_beta, metadata)
             
             # Store in history
-            self.confidence_history.append({
-                'prior': prior,
-                'posterior_mean': posterior_stats['mean'],
-                'evidence_count': len(evidence),
-                'timestamp': pd.Timestamp.now()
-            })
+            self.confidence_history.record(work_id, prior, posterior_stats['mean'], len(evidence),
+                                           alpha=posterior_stats['alpha'], beta=posterior_stats['beta'])
             
             return posterior_stats
             
@@ -142,6 +382,262 @@ class BayesianReconstructor:
             self.logger.error(f"Bayesian update failed: {e}")
             return {'mean': prior, 'std': 0.1, 'ci_lower': prior-0.1, 'ci_upper': min(prior+0.1, 1.0)}
     
+    def _posterior_stats(self, posterior_alpha: float, posterior_beta: float,
+                         metadata: Optional[Dict] = None) -> Dict[str, float]:
+        """Summary statistics of a Beta(alpha, beta) posterior."""
+        # Calculate posterior statistics
+        posterior_mean = posterior_alpha / (posterior_alpha + posterior_beta)
+        posterior_var = (posterior_alpha * posterior_beta) / (
+            (posterior_alpha + posterior_beta) ** 2 * (posterior_alpha + posterior_beta + 1)
+        )
+        posterior_std = np.sqrt(posterior_var)
+        ci_lower, median, ci_upper = (float(q) for q in beta_credible_intervals(posterior_alpha, posterior_beta))
+        
+        # Apply cross-cultural bonuses after main calculation
+        bonus = self._apply_cross_cultural_bonus(posterior_mean, metadata) - posterior_mean
+        
+        # Shift the whole posterior by the bonus, capped at 1
+        posterior_mean, median, ci_lower, ci_upper = (
+            min(value + bonus, 1.0) for value in (posterior_mean, median, ci_lower, ci_upper)
+        )
+        
+        return {
+            'mean': float(posterior_mean),
+            'std': float(posterior_std),
+            'ci_lower': ci_lower,
+            'ci_upper': ci_upper,
+            'median': median,
+            'alpha': float(posterior_alpha),
+            'beta': float(posterior_beta),
+        }
+    
+    def _evidence_reliability(self, ev_type: str) -> float:
+        """Reliability of one piece of evidence, by type."""
+        if ev_type in self.EVIDENCE_TYPES:
+            return self.default_priors[self._EVIDENCE_PRIOR_KEYS[self.EVIDENCE_TYPES.index(ev_type)]]
+        return 0.7  # Default reliability
+    
+    def get_posterior_state(self, work_id: str, metadata: Optional[Dict] = None) -> Dict[str, Any]:
+        """
+        Get the Beta posterior state of a work.
+        
+        Looks in memory, then in the database; a work with no state starts
+        from its initial prior with no evidence.
+        
+        Args:
+            work_id: Work identifier
+            metadata: Work metadata, used for the initial prior of a new work
+            
+        Returns:
+            State dictionary: work_id, prior, alpha, beta, evidence_count,
+            weight_total (sum of raw evidence weights) and last_updated
+        """
+        state = self.posterior_states.get(work_id)
+        if state is None and self.database is not None:
+            state = self.database.get_posterior_state(work_id)
+        if state is None:
+            prior = self._get_initial_prior(metadata or {})
+            state = {
+                'work_id': work_id,
+                'prior': prior,
+                'alpha': prior * 10 + 1,
+                'beta': (1 - prior) * 10 + 1,
+                'evidence_count': 0,
+                'weight_total': 0.0,
+                'last_updated': None,
+            }
+        self.posterior_states[work_id] = state
+        return state
+    
+    def add_evidence(self, work_id: str, evidence, weights: Optional[List[float]] = None,
+                     metadata: Optional[Dict] = None) -> Dict[str, float]:
+        """
+        Fold new evidence into a work's posterior without revisiting old evidence.
+        
+        Gives the same posterior as update_confidence over all of the work's
+        evidence, at a cost proportional to the new evidence only. The updated
+        state and confidence are written to the database, if one is attached.
+        
+        Args:
+            work_id: Work identifier
+            evidence: Evidence dictionary, or list of them
+            weights: Optional raw (unnormalized) weights for each evidence piece
+            metadata: Optional work metadata for temporal decay, bonuses and
+                the initial prior of a new work
+            
+        Returns:
+            Dictionary with posterior statistics and evidence_count
+        """
+        if isinstance(evidence, dict):
+            evidence = [evidence]
+        if weights is None:
+            weights = [1.0] * len(evidence)
+        
+        state = self.get_posterior_state(work_id, metadata)
+        prior_alpha = state['prior'] * 10 + 1
+        prior_beta = (1 - state['prior']) * 10 + 1
+        
+        # Undo the normalization to recover the running weighted sums
+        weight_total = state['weight_total']
+        weighted_successes = (state['alpha'] - prior_alpha) * weight_total
+        total_weight = (state['alpha'] - prior_alpha + state['beta'] - prior_beta) * weight_total
+        
+        values = [ev.get('confidence', 0.5) for ev in evidence]
+        reliabilities = [self._evidence_reliability(ev.get('type', 'fragment')) * w
+                         for ev, w in zip(evidence, weights)]
+        values, reliabilities = self._apply_temporal_decay(evidence, values, reliabilities, metadata)
+        
+        weighted_successes += sum(v * r for v, r in zip(values, reliabilities))
+        total_weight += sum(reliabilities)
+        weight_total += sum(weights)
+        
+        if weight_total > 0:
+            state['alpha'] = prior_alpha + weighted_successes / weight_total
+            state['beta'] = prior_beta + (total_weight - weighted_successes) / weight_total
+        state['evidence_count'] += len(evidence)
+        state['weight_total'] = weight_total
+        state['last_updated'] = pd.Timestamp.now()
+        
+        posterior_stats = self._posterior_stats(state['alpha'], state['beta'], metadata)
+        posterior_stats['evidence_count'] = state['evidence_count']
+        
+        self.confidence_history.record(work_id, state['prior'], posterior_stats['mean'],
+                                       state['evidence_count'], state['last_updated'],
+                                       state['alpha'], state['beta'])
+        
+        if self.database is not None:
+            self.database.save_posterior_states([state])
+            self.database.update_work_confidences([(work_id, posterior_stats['mean'])])
+        
+        return posterior_stats
+    
+    def build_evidence_table(self, evidence_by_work: List[List[Dict]],
+                             weights_by_work: Optional[List[Optional[List[float]]]] = None) -> Dict[str, np.ndarray]:
+        """
+        Flatten per-work evidence lists into the columnar table used by update_confidence_batch.
+        
+        Args:
+            evidence_by_work: One list of evidence dictionaries per work
+            weights_by_work: Optional weights per work, as for update_confidence
+            
+        Returns:
+            Dictionary of equal-length arrays: work (index into evidence_by_work),
+            type (EVIDENCE_TYPES code or -1), confidence, century (citing-author
+            century, NaN when unknown) and weight
+        """
+        type_codes = {ev_type: code for code, ev_type in enumerate(self.EVIDENCE_TYPES)}
+        rows = []
+        for work_idx, evidence in enumerate(evidence_by_work):
+            weights = weights_by_work[work_idx] if weights_by_work is not None else None
+            if weights is None:
+                weights = [1.0] * len(evidence)
+            for ev, weight in zip(evidence, weights):
+                ev_type = ev.get('type', 'fragment')
+                century = None
+                if ev_type == 'citation':
+                    century = self._estimate_author_century(ev.get('citing_author', ''))
+                rows.append((work_idx, type_codes.get(ev_type, -1), ev.get('confidence', 0.5),
+                             np.nan if century is None else century, weight))
+        
+        columns = list(zip(*rows)) if rows else [()] * 5
+        return {
+            'work': np.array(columns[0], dtype=np.intp),
+            'type': np.array(columns[1], dtype=np.intp),
+            'confidence': np.array(columns[2], dtype=float),
+            'century': np.array(columns[3], dtype=float),
+            'weight': np.array(columns[4], dtype=float),
+        }
+    
+    def update_confidence_batch(self, priors, evidence, 
+                                metadata: Optional[List[Optional[Dict]]] = None,
+                                work_ids: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Update the confidence of many works at once.
+        
+        Vectorized equivalent of calling update_confidence once per work.
+        
+        Args:
+            priors: Prior confidence (0-1) per work
+            evidence: Columnar evidence table (dict of arrays or DataFrame) with
+                columns work, type and confidence, and optionally century and
+                weight; see build_evidence_table
+            metadata: Optional metadata per work, for temporal decay and
+                cross-cultural bonuses
+            work_ids: Optional work identifiers, keying each work's history
+            
+        Returns:
+            Dictionary of per-work arrays: alpha, beta, mean, std, ci_lower,
+            ci_upper, median and evidence_count
+        """
+        priors = np.asarray(priors, dtype=float)
+        n_works = len(priors)
+        work = np.asarray(evidence['work'], dtype=np.intp)
+        types = np.asarray(evidence['type'], dtype=np.intp)
+        values = np.asarray(evidence['confidence'], dtype=float)
+        weights = (np.asarray(evidence['weight'], dtype=float) if 'weight' in evidence
+                   else np.ones(len(work)))
+        
+        # Normalize weights within each work
+        weights = weights / np.bincount(work, weights=weights, minlength=n_works)[work]
+        
+        # Reliability by type code; the trailing entry serves unknown codes
+        reliability_table = np.array([self.default_priors[key] for key in self._EVIDENCE_PRIOR_KEYS] + [0.7])
+        types = np.where((types >= 0) & (types < len(self.EVIDENCE_TYPES)), types, -1)
+        reliability = reliability_table[types] * weights
+        
+        if metadata is not None:
+            # Temporal decay, as in _apply_temporal_decay
+            work_century = np.array([(m or {}).get('century', 0) or 0 for m in metadata], dtype=float)[work]
+            citing_century = (np.asarray(evidence['century'], dtype=float) if 'century' in evidence
+                              else np.full(len(work), np.nan))
+            decayed = ((types == 1) & (work_century != 0)
+                       & ~np.isnan(citing_century) & (citing_century != 0))
+            centuries_since = np.abs(citing_century - work_century)
+            temporal_weight = np.select(
+                [centuries_since <= 2, centuries_since <= 5, centuries_since <= 10],
+                [1.5, 1.2, 1.0],
+                np.exp(-0.1 * (centuries_since - 10))
+            )
+            reliability = np.where(decayed, reliability * temporal_weight, reliability)
+        
+        weighted_successes = np.bincount(work, weights=values * reliability, minlength=n_works)
+        total_weight = np.bincount(work, weights=reliability, minlength=n_works)
+        
+        # Same Beta-Binomial update as update_confidence
+        posterior_alpha = priors * 10 + 1 + weighted_successes
+        posterior_beta = (1 - priors) * 10 + 1 + total_weight - weighted_successes
+        total = posterior_alpha + posterior_beta
+        posterior_mean = posterior_alpha / total
+        posterior_std = np.sqrt(posterior_alpha * posterior_beta / (total ** 2 * (total + 1)))
+        
+        ci_lower, median, ci_upper = beta_credible_intervals(posterior_alpha, posterior_beta)
+        
+        if metadata is not None:
+            bonus = np.minimum(posterior_mean + self._cross_cultural_bonuses(metadata), 1.0) - posterior_mean
+            posterior_mean, median, ci_lower, ci_upper = (
+                np.minimum(value + bonus, 1.0) for value in (posterior_mean, median, ci_lower, ci_upper)
+            )
+        
+        evidence_count = np.bincount(work, minlength=n_works)
+        timestamp = pd.Timestamp.now()
+        if work_ids is None:
+            work_ids = [None] * n_works
+        for work_id, prior, mean, count, a, b in zip(work_ids, priors.tolist(),
+                                                     posterior_mean.tolist(), evidence_count.tolist(),
+                                                     posterior_alpha.tolist(), posterior_beta.tolist()):
+            self.confidence_history.record(work_id, prior, mean, count, timestamp, a, b)
+        
+        return {
+            'alpha': posterior_alpha,
+            'beta': posterior_beta,
+            'mean': posterior_mean,
+            'std': posterior_std,
+            'ci_lower': ci_lower,
+            'ci_upper': ci_upper,
+            'median': median,
+            'evidence_count': evidence_count,
+        }
+    
     def reconstruct_work(self, work_id: str, fragments: List[Dict], 
                         citations: List[Dict], metadata: Dict) -> Dict[str, Any]:
         """
@@ -165,37 +661,25 @@ class BayesianReconstructor:
         evidence = []
         weights = []
         
-        # Add fragment evidence
-        for fragment in fragments:
-            evidence.append({
-                'type': 'fragment',
-                'confidence': fragment.get('confidence', 0.5),
-                'source': fragment.get('source', 'unknown'),
-                'text_length': len(fragment.get('text', ''))
-            })
-            # Weight by text length and source reliability
-            weight = min(len(fragment.get('text', '')) / 100, 2.0) * 0.8
-            weights.append(weight)
-        
-        # Add citation evidence
-        for citation in citations:
-            evidence.append({
-                'type': 'citation',
-                'confidence': citation.get('confidence', 0.6),
-                'citing_author': citation.get('citing_author', 'unknown'),
-                'pattern': citation.get('pattern', 'unknown')
-            })
-            # Weight by citation pattern reliability
-            pattern_weights = {
-                'cf_book_line': 1.0,
-                'as_says_in': 0.8,
-                'according_to': 0.7
-            }
-            weight = pattern_weights.get(citation.get('pattern'), 0.6)
+        # Add fragment and citation evidence
+        for ev, weight in ([self.fragment_evidence(f) for f in fragments] +
+                           [self.citation_evidence(c) for c in citations]):
+            evidence.append(ev)
             weights.append(weight)
         
         # Update confidence
-        posterior_stats = self.update_confidence(initial_prior, evidence, weights)
+        posterior_stats = self.update_confidence(initial_prior, evidence, weights, work_id=work_id)
+        
+        # Seed the posterior state so later evidence can be added incrementally
+        self.posterior_states[work_id] = {
+            'work_id': work_id,
+            'prior': initial_prior,
+            'alpha': posterior_stats.get('alpha', initial_prior * 10 + 1),
+            'beta': posterior_stats.get('beta', (1 - initial_prior) * 10 + 1),
+            'evidence_count': len(evidence),
+            'weight_total': float(sum(weights)),
+            'last_updated': pd.Timestamp.now(),
+        }
         
         # Generate reconstruction
         reconstruction = self._generate_reconstruction_text(fragments, metadata)
@@ -223,24 +707,36 @@ class BayesianReconstructor:
         
         return results
     
+    @staticmethod
+    def fragment_evidence(fragment: Dict) -> Tuple[Dict, float]:
+        """Evidence dictionary and weight contributed by one fragment."""
+        evidence = {
+            'type': 'fragment',
+            'confidence': fragment.get('confidence', 0.5),
+            'source': fragment.get('source', 'unknown'),
+            'text_length': len(fragment.get('text', ''))
+        }
+        # Weight by text length and source reliability
+        weight = min(len(fragment.get('text', '')) / 100, 2.0) * 0.8
+        return evidence, weight
+    
+    @staticmethod
+    def citation_evidence(citation: Dict) -> Tuple[Dict, float]:
+        """Evidence dictionary and weight contributed by one citation."""
+        evidence = {
+            'type': 'citation',
+            'confidence': citation.get('confidence', 0.6),
+            'citing_author': citation.get('citing_author', 'unknown'),
+            'pattern': citation.get('pattern', 'unknown')
+        }
+        # Weight by citation pattern reliability
+        weight = CITATION_PATTERN_WEIGHTS.get(citation.get('pattern'), 0.6)
+        return evidence, weight
+    
     def _get_initial_prior(self, metadata: Dict) -> float:
         """Get initial prior based on work metadata."""
-        base_prior = 0.5  # Default neutral prior
-        
         # Adjust based on genre
-        genre_priors = {
-            'philosophy': 0.6,
-            'science': 0.65,
-            'history': 0.55,
-            'poetry': 0.5,
-            'rhetoric': 0.45
-        }
-        
-        genre = metadata.get('genre', 'unknown').lower()
-        for genre_key, prior in genre_priors.items():
-            if genre_key in genre:
-                base_prior = prior
-                break
+        base_prior = genre_prior(metadata.get('genre', 'unknown'))
         
         # Adjust based on century (earlier works are less likely to survive)
         century = metadata.get('century', 0)
@@ -251,9 +747,7 @@ class BayesianReconstructor:
                 base_prior *= 0.9  # Later works have better survival
         
         # Adjust based on author fame
-        famous_authors = {'Aristotle', 'Plato', 'Galen', 'Homer', 'Virgil'}
-        author = metadata.get('author', '')
-        if any(famous in author for famous in famous_authors):
+        if is_famous_author(metadata.get('author', '')):
             base_prior *= 1.2
         
         return min(base_prior, 0.9)  # Cap at 0.9
@@ -314,32 +808,48 @@ class BayesianReconstructor:
         
         return updated_values, updated_reliabilities
     
-    def _estimate_author_century(self, author_name: str) -> Optional[int]:
-        """Estimate the century for a citing author."""
-        # Common classical authors and their centuries (BCE negative, CE positive)
-        author_centuries = {
-            'strabo': -1,      # Strabo, 1st century BCE
-            'plutarch': 1,     # Plutarch, 1st-2nd century CE
-            'athenaeus': 2,    # Athenaeus, 2nd-3rd century CE
-            'diogenes': 3,     # Diogenes Laertius, 3rd century CE
-            'galen': 2,        # Galen, 2nd century CE
-            'pliny': 1,        # Pliny the Elder, 1st century CE
-            'quintilian': 1,   # Quintilian, 1st century CE
-            'seneca': 1,       # Seneca, 1st century CE
-            'cicero': -1,      # Cicero, 1st century BCE
-            'varro': -1,       # Varro, 1st century BCE
-            'vitruvius': -1,   # Vitruvius, 1st century BCE
-            'diodorus': -1,    # Diodorus Siculus, 1st century BCE
-            'pausanias': 2,    # Pausanias, 2nd century CE
-            'lucian': 2,       # Lucian, 2nd century CE
-        }
+    def register_author_centuries(self, centuries: Dict[str, int]) -> int:
+        """
+        Add author centuries for this reconstructor; built-in authors keep their century.
         
-        author_lower = author_name.lower().strip()
-        for known_author, century in author_centuries.items():
-            if known_author in author_lower:
-                return century
+        Returns:
+            Number of authors added
+        """
+        added = 0
+        for name, century in centuries.items():
+            key = _normalize_name(name or '')
+            if key and century and key not in AUTHOR_CENTURIES and key not in self.author_centuries:
+                self.author_centuries[key] = int(century)
+                added += 1
+        if added:
+            self._century_cache.clear()
+        return added
+    
+    def load_author_centuries(self, database: Any) -> int:
+        """Register the century of every author in a FragmentDatabase's works table."""
+        return self.register_author_centuries(database.get_author_centuries())
+    
+    def _estimate_author_century(self, author_name: str) -> Optional[int]:
+        """
+        Estimate the century for a citing author.
         
-        return None  # Unknown author
+        Built-in authors match as in lookup_author_century. Registered authors
+        match by exact name or as whole words, so 'Hesychius' covers
+        'Hesychius of Alexandria' but 'Ion' does not cover 'Dion Chrysostom'.
+        """
+        if author_name in self._century_cache:
+            return self._century_cache[author_name]
+        century = lookup_author_century(author_name)
+        if century is None and self.author_centuries:
+            century = self.author_centuries.get(_normalize_name(author_name))
+            if century is None:
+                words = _name_words(author_name)
+                for known_author, known_century in self.author_centuries.items():
+                    if _name_words(known_author) in words:
+                        century = known_century
+                        break
+        self._century_cache[author_name] = century
+        return century
     
     def _apply_cross_cultural_bonus(self, confidence: float, metadata: Optional[Dict] = None) -> float:
         """
@@ -355,37 +865,8 @@ class BayesianReconstructor:
         if not metadata:
             return confidence
         
-        bonus = 0.0
-        
-        # Check for Arabic translations (+15%)
-        if metadata.get('arabic_translation'):
-            bonus += 0.15
-            self.logger.debug("Applied +15% Arabic translation bonus")
-        
-        # Check for Latin translations (+10%)
-        if metadata.get('latin_translation'):
-            bonus += 0.10
-            self.logger.debug("Applied +10% Latin translation bonus")
-        
-        # Check for Syriac intermediary (often indicates important transmission)
-        if metadata.get('syriac_intermediary'):
-            bonus += 0.08
-            self.logger.debug("Applied +8% Syriac intermediary bonus")
-        
-        # Check for multiple translation paths (+20% total, not cumulative with above)
-        translation_count = sum([
-            bool(metadata.get('arabic_translation')),
-            bool(metadata.get('latin_translation')),
-            bool(metadata.get('syriac_intermediary'))
-        ])
-        
-        if translation_count >= 2:
-            # If we have multiple paths, use the higher bonus instead of cumulative
-            bonus = max(bonus, 0.20)
-            self.logger.debug("Applied +20% multiple translation paths bonus")
-        
-        # Cap total bonus at 25% to prevent overconfidence
-        bonus = min(bonus, 0.25)
+        # Arabic, Latin and Syriac paths, precombined in CROSS_CULTURAL_BONUS
+        bonus = float(CROSS_CULTURAL_BONUS[_translation_index(metadata)])
         
         updated_confidence = min(confidence + bonus, 1.0)  # Cap at 1.0
         
@@ -394,6 +875,10 @@ class BayesianReconstructor:
         
         return updated_confidence
     
+    def _cross_cultural_bonuses(self, metadata: List[Optional[Dict]]) -> np.ndarray:
+        """Per-work confidence bonuses, as _apply_cross_cultural_bonus computes them."""
+        return CROSS_CULTURAL_BONUS[np.array([_translation_index(m or {}) for m in metadata], dtype=np.intp)]
+    
     def _generate_reconstruction_text(self, fragments: List[Dict], metadata: Dict) -> Dict[str, str]:
         """Generate reconstructed text from fragments."""
         # Group fragments by suspected position
@@ -482,57 +967,38 @@ class BayesianReconstructor:
         """
         Plot the evolution of confidence over time.
         
+        Rendered headlessly; use RenderService to plot many works at once.
+        
         Args:
             work_id: Work identifier
             save_path: Optional path to save the plot
+            
+        Returns:
+            save_path, or the matplotlib Figure when no path is given
         """
-        if not self.confidence_history:
+        # Updates recorded without a work stand in for an unknown one
+        history = self.confidence_history.rows(work_id) or self.confidence_history.rows(None)
+        if not history:
             self.logger.warning("No confidence history to plot")
             return
         
-        df = pd.DataFrame(self.confidence_history)
-        
-        plt.figure(figsize=(10, 6))
-        
-        # Plot prior vs posterior
-        plt.plot(df.index, df['prior'], 'b--', label='Prior Confidence', alpha=0.7)
-        plt.plot(df.index, df['posterior_mean'], 'r-', label='Posterior Confidence', linewidth=2)
-        
-        # Add confidence intervals
-        ci_lower = [max(0, mean - 0.1) for mean in df['posterior_mean']]
-        ci_upper = [min(1, mean + 0.1) for mean in df['posterior_mean']]
-        plt.fill_between(df.index, ci_lower, ci_upper, alpha=0.2, color='red')
-        
-        # Add evidence count as scatter plot
-        scatter = plt.scatter(df.index, df['posterior_mean'], 
-                            s=df['evidence_count']*50, 
-                            c=df['evidence_count'], 
-                            cmap='viridis', 
-                            alpha=0.6,
-                            label='Evidence Count')
-        
-        plt.colorbar(scatter, label='Number of Evidence Pieces')
-        
-        plt.xlabel('Update Iteration')
-        plt.ylabel('Confidence')
-        plt.title(f'Confidence Evolution for {work_id}')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        plt.ylim(0, 1)
-        
+        result = render_confidence_plot(history, work_id, save_path)
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
             self.logger.info(f"Saved confidence plot to {save_path}")
-        
-        plt.show()
+        return result
     
-    def save_reconstruction(self, results: Dict, output_dir: str):
+    def save_reconstruction(self, results: Dict, output_dir: str,
+                            confidence_history: Optional[List[Dict]] = None,
+                            compact: bool = False):
         """
         Save reconstruction results to disk.
         
         Args:
             results: Reconstruction results dictionary
             output_dir: Output directory path
+            confidence_history: History rows to write (default: this
+                reconstructor's history of the work), e.g. as loaded from the database
+            compact: Write the JSON without indentation
         """
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
@@ -541,9 +1007,7 @@ class BayesianReconstructor:
         
         # Save main results as JSON
         with open(output_path / f"{work_id}_reconstruction.json", 'w') as f:
-            # Convert numpy types to native Python types for JSON serialization
-            json_results = self._convert_numpy_types(results)
-            json.dump(json_results, f, indent=2, default=str)
+            serialization.dump(results, f, compact=compact)
         
         # Save reconstruction text
         with open(output_path / f"{work_id}_text.md", 'w') as f:
@@ -559,27 +1023,14 @@ class BayesianReconstructor:
         metrics_df.to_csv(output_path / f"{work_id}_metrics.csv", index=False)
         
         # Save confidence history
-        if self.confidence_history:
-            history_df = pd.DataFrame(self.confidence_history)
+        if confidence_history is None:
+            confidence_history = self.confidence_history.rows(work_id)
+        if confidence_history:
+            history_df = pd.DataFrame(confidence_history)
             history_df.to_csv(output_path / f"{work_id}_confidence_history.csv", index=False)
         
         self.logger.info(f"Saved reconstruction for {work_id} to {output_dir}")
     
-    def _convert_numpy_types(self, obj):
-        """Convert numpy types to native Python types for JSON serialization."""
-        if isinstance(obj, np.integer):
-            return int(obj)
-        elif isinstance(obj, np.floating):
-            return float(obj)
-        elif isinstance(obj, np.ndarray):
-            return obj.tolist()
-        elif isinstance(obj, dict):
-            return {key: self._convert_numpy_types(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [self._convert_numpy_types(item) for item in obj]
-        else:
-            return obj
-    
     def compare_reconstructions(self, reconstructions: List[Dict]) -> pd.DataFrame:
         """
         Compare multiple reconstructions.
@@ -11,22 +11,238 @@ Identifies:
 import networkx as nx
 import pandas as pd
 import numpy as np
-import json
 import logging
-from typing import Dict, List, Tuple, Optional, Set
-from collections import defaultdict
-import matplotlib.pyplot as plt
-import seaborn as sns
-from pathlib import Path
+import math
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Tuple, Optional, Set
+from collections import Counter, defaultdict
+
+try:
+    from . import serialization
+    from .graph_snapshot import write_snapshot
+    from .reachability import ReachabilityIndex
+    from .render_service import render_network
+    from .sparse_graph import SparseGraph
+except ImportError:  # loaded from src/ on sys.path (CLI, scripts, tests)
+    import serialization
+    from graph_snapshot import write_snapshot
+    from reachability import ReachabilityIndex
+    from render_service import render_network
+    from sparse_graph import SparseGraph
+
+
+# Authors with a documented translation, by target language
+KNOWN_TRANSLATIONS = {
+    'syriac': {'Aristotle', 'Galen', 'Porphyry', 'Nemesius', 'Sergius of Reshaina'},
+    'arabic': {'Aristotle', 'Galen', 'Ptolemy', 'Euclid', 'Hippocrates',
+               'Plotinus', 'Proclus', 'Alexander of Aphrodisias'},
+}
+
+# Authors with known translation chains
+KNOWN_TRANSLATION_CHAINS = frozenset({
+    'Aristotle', 'Galen', 'Ptolemy', 'Euclid', 'Hippocrates',
+    'Plato', 'Plotinus', 'Theophrastus'
+})
+
+# Greek→Syriac→Arabic→Latin, after the Greek original
+TRANSLATION_LANGUAGES = ('syriac', 'arabic', 'latin')
+
+
+class VersionedDiGraph(nx.DiGraph):
+    """
+    DiGraph that counts changes to its nodes and edges.
+    
+    Measures derived from the graph structure can be cached against
+    `version`. Attribute updates (e.g. edge weights) do not count.
+    """
+    
+    version = 0
+    
+    def _changed(self):
+        self.version += 1
+    
+    def add_node(self, node_for_adding, **attr):
+        super().add_node(node_for_adding, **attr)
+        self._changed()
+    
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        super().add_nodes_from(nodes_for_adding, **attr)
+        self._changed()
+    
+    def remove_node(self, n):
+        super().remove_node(n)
+        self._changed()
+    
+    def remove_nodes_from(self, nodes):
+        super().remove_nodes_from(nodes)
+        self._changed()
+    
+    def add_edge(self, u_of_edge, v_of_edge, **attr):
+        super().add_edge(u_of_edge, v_of_edge, **attr)
+        self._changed()
+    
+    def add_edges_from(self, ebunch_to_add, **attr):
+        super().add_edges_from(ebunch_to_add, **attr)
+        self._changed()
+    
+    def remove_edge(self, u, v):
+        super().remove_edge(u, v)
+        self._changed()
+    
+    def remove_edges_from(self, ebunch):
+        super().remove_edges_from(ebunch)
+        self._changed()
+    
+    def clear(self):
+        super().clear()
+        self._changed()
+    
+    def clear_edges(self):
+        super().clear_edges()
+        self._changed()
+
+
+def pairs_for_error_bound(epsilon: float, delta: float) -> int:
+    """Sample size for which a sampled fraction is within epsilon w.p. 1 - delta (Hoeffding)."""
+    return math.ceil(math.log(2 / delta) / (2 * epsilon ** 2))
+
+
+def sample_reachable_pairs(successors: Dict[Any, List[Any]], n_pairs: int,
+                           seed: int = 42) -> Dict[Any, Dict[Any, int]]:
+    """
+    Draw (source, target) pairs uniformly from the pairs joined by a path.
+    
+    When the graph has no more ordered pairs than requested, every reachable
+    pair is returned once instead, so impacts computed from it are exact.
+    
+    Args:
+        successors: Adjacency lists of the graph
+        n_pairs: Pairs to draw (with replacement)
+        seed: Random seed
+    
+    Returns:
+        {source: {target: times drawn}}
+    """
+    nodes = list(successors)
+    n = len(nodes)
+    reach = {}
+    
+    def descendants(source):
+        if source not in reach:
+            seen = {source}
+            stack = [source]
+            while stack:
+                for nbr in successors[stack.pop()]:
+                    if nbr not in seen:
+                        seen.add(nbr)
+                        stack.append(nbr)
+            seen.discard(source)
+            reach[source] = list(seen)
+        return reach[source]
+    
+    pairs = defaultdict(dict)
+    if n * (n - 1) <= n_pairs:
+        for source in nodes:
+            for target in descendants(source):
+                pairs[source][target] = 1
+        return dict(pairs)
+    
+    if not any(successors.values()):
+        return {}
+    
+    # Uniform source, kept with probability |reach| / (n - 1), then a uniform
+    # reachable target: together a uniform draw from the reachable pairs
+    rng = np.random.default_rng(seed)
+    drawn = 0
+    for _ in range(50 * n_pairs):
+        source = nodes[rng.integers(n)]
+        targets = descendants(source)
+        if targets and rng.random() * (n - 1) < len(targets):
+            target = targets[rng.integers(len(targets))]
+            pairs[source][target] = pairs[source].get(target, 0) + 1
+            drawn += 1
+            if drawn == n_pairs:
+                break
+    return dict(pairs)
+
+
+def dominated_pair_counts(graph: nx.DiGraph, source: Any, targets: Dict[Any, int]) -> Dict[Any, int]:
+    """
+    Count, for every node, the sampled pairs from source that lose all paths without it.
+    
+    A node cuts every path from the source to a target exactly when it
+    dominates the target in the dominator tree rooted at the source, so one
+    tree answers the question for all nodes at once.
+    
+    Args:
+        graph: Citation graph
+        source: Source of the sampled pairs
+        targets: {target: times drawn}
+    """
+    idom = nx.immediate_dominators(graph, source)
+    counts = defaultdict(int)
+    for target, drawn in targets.items():
+        dominator = idom[target]
+        while dominator != source:
+            counts[dominator] += drawn
+            dominator = idom[dominator]
+    return counts
+
+
+# Graph of the impact worker process
+_IMPACT_GRAPH: Optional[nx.DiGraph] = None
+
+
+def _init_impact_worker(successors: Dict[Any, List[Any]]):
+    # Workers get bare successor lists, not the attributed graph
+    global _IMPACT_GRAPH
+    _IMPACT_GRAPH = nx.DiGraph(successors)
+
+
+def _impact_task(task: Tuple[Any, Dict[Any, int]]) -> Dict[Any, int]:
+    source, targets = task
+    return dominated_pair_counts(_IMPACT_GRAPH, source, targets)
 
 
 class CitationNetwork:
-    def __init__(self):
-        """Initialize the citation network analyzer."""
-        self.G = nx.DiGraph()  # Directed graph for citations
+    BACKENDS = ('networkx', 'sparse')
+    
+    # Sampled sources x edges below which node impacts are computed in
+    # process: about a second of dominator-tree work, less than it costs
+    # to start a pool and ship it the graph
+    IMPACT_POOL_MIN_WORK = 250_000
+    
+    def __init__(self, backend: str = 'networkx', betweenness_samples: Optional[int] = None):
+        """
+        Initialize the citation network analyzer.
+        
+        Args:
+            backend: 'networkx', or 'sparse' to compute centralities on a
+                SciPy CSR snapshot of the graph (for very large networks)
+            betweenness_samples: Estimate betweenness from this many sampled
+                source authors instead of all of them
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unsupported backend: {backend}")
+        self.backend = backend
+        self.betweenness_samples = betweenness_samples
+        self.G = VersionedDiGraph()  # Directed graph for citations
         self.logger = logging.getLogger(__name__)
         self.author_metadata = {}
+        self.author_languages = defaultdict(Counter)  # author -> fragment languages
         self.translation_chains = []
+        self._centrality_cache = None
+        self._centrality_key = None
+        self._sparse_cache = None
+        self._sparse_key = None
+        self._reach_index = None
+        self._reach_key = None
+        self._fragments = {}  # fragment id -> (source author, edge citations, language)
+        self._gap_cache = None  # gap author -> (in-degree, citing authors, genre)
+        self._gap_min_citations = None
+        self._gap_dirty = set()
+        self._synced_key = self._graph_key()
         
     def build_network(self, fragments: List[Dict]) -> nx.DiGraph:
         """
@@ -40,15 +256,88 @@ class CitationNetwork:
         """
         self.G.clear()
         self.author_metadata.clear()
+        self.author_languages.clear()
+        self._fragments.clear()
+        self._gap_cache = None
         
         for fragment in fragments:
-            self._add_fragment_to_network(fragment)
+            self._register_fragment(fragment)
+        self._synced_key = self._graph_key()
         
         self.logger.info(f"Built network with {len(self.G.nodes())} nodes and {len(self.G.edges())} edges")
         return self.G
     
-    def _add_fragment_to_network(self, fragment: Dict):
-        """Add a single fragment to the network."""
+    def add_fragments(self, fragments: List[Dict]) -> Set[str]:
+        """
+        Add fragments to the network in place.
+        
+        A fragment whose 'id' is already in the network replaces the earlier
+        version. Cached centralities and gaps are refreshed on next use, with
+        gap analysis redone only for the changed authors.
+        
+        Args:
+            fragments: Fragment dictionaries with citation data
+            
+        Returns:
+            Authors whose node or edges changed
+        """
+        changed = set()
+        for fragment in fragments:
+            fragment_id = fragment.get('id')
+            if fragment_id is not None and fragment_id in self._fragments:
+                changed |= self._remove_fragment_from_network(*self._fragments.pop(fragment_id))
+            changed |= self._register_fragment(fragment)
+        self._synced_key = self._graph_key()
+        
+        self.logger.info(f"Added {len(fragments)} fragments; {len(changed)} authors changed")
+        return changed
+    
+    def remove_fragments(self, ids: Iterable[str]) -> Set[str]:
+        """
+        Remove fragments from the network in place.
+        
+        Edges lose the removed citations and disappear when none are left;
+        authors left without fragments or edges are dropped.
+        
+        Args:
+            ids: Fragment 'id' values; unknown ids are ignored
+            
+        Returns:
+            Authors whose node or edges changed
+        """
+        changed = set()
+        removed = 0
+        for fragment_id in ids:
+            entry = self._fragments.pop(fragment_id, None)
+            if entry is not None:
+                changed |= self._remove_fragment_from_network(*entry)
+                removed += 1
+        self._synced_key = self._graph_key()
+        
+        self.logger.info(f"Removed {removed} fragments; {len(changed)} authors changed")
+        return changed
+    
+    def _graph_key(self) -> Tuple[int, Optional[int]]:
+        return id(self.G), getattr(self.G, 'version', None)
+    
+    def _register_fragment(self, fragment: Dict) -> Set[str]:
+        """Add a fragment and remember what it contributed, so it can be removed by id."""
+        source_author, citations, changed = self._add_fragment_to_network(fragment)
+        fragment_id = fragment.get('id')
+        if fragment_id is not None:
+            self._fragments[fragment_id] = (source_author, citations, fragment.get('language', 'greek'))
+        return changed
+    
+    def _add_fragment_to_network(self, fragment: Dict) -> Tuple[str, List[Dict], Set[str]]:
+        """
+        Add a single fragment to the network.
+        
+        Returns:
+            (source author, citations that became edges, changed authors)
+        """
+        # Keep an existing reachability index in step as the graph grows
+        index = self._reach_index if self._reach_key == self._graph_key() else None
+        
         # Add source author node
         source_author = fragment.get('source_author', 'Unknown')
         if source_author not in self.G:
@@ -57,8 +346,15 @@ class CitationNetwork:
                           fragments=0,
                           confidence=fragment.get('confidence', 0.5))
         
-        # Update fragment count
+        # Update fragment count and languages
         self.G.nodes[source_author]['fragments'] += 1
+        language = fragment.get('language', 'greek')
+        self.author_languages[source_author][language] += 1
+        if index is not None:
+            index.add_node(source_author)
+            index.tag(source_author, language)
+        changed = {source_author}
+        added = []
         
         # Add cited authors and edges
         citations = fragment.get('citations', [])
@@ -73,35 +369,86 @@ class CitationNetwork:
                                   fragments=0,
                                   confidence=citation.get('confidence', 0.5))
                 
-                # Add or update edge
+                # Add or update edge; citations stay a list until export
                 if self.G.has_edge(source_author, cited_author):
-                    self.G[source_author][cited_author]['weight'] += 1
-                    # Append citation to existing JSON string
-                    existing = self.G[source_author][cited_author].get('citations', '[]')
-                    citations_list = json.loads(existing) if existing else []
-                    citations_list.append(citation)
-                    self.G[source_author][cited_author]['citations'] = json.dumps(citations_list)
+                    edge = self.G[source_author][cited_author]
+                    edge['weight'] += 1
+                    edge['citations'].append(citation)
                 else:
                     self.G.add_edge(source_author, cited_author,
                                   weight=1,
-                                  citations=json.dumps([citation]))
+                                  citations=[citation])
+                    if index is not None:
+                        index.add_edge(source_author, cited_author)
+                changed.add(cited_author)
+                added.append(citation)
+        
+        if index is not None:
+            self._reach_key = self._graph_key()
+        self._gap_dirty |= changed
+        self._sparse_cache = None  # edge weights changed
+        return source_author, added, changed
+    
+    def _remove_fragment_from_network(self, source_author: str, citations: List[Dict],
+                                      language: str) -> Set[str]:
+        """Undo _add_fragment_to_network for a fragment's source author, edge citations and language."""
+        self.G.nodes[source_author]['fragments'] -= 1
+        languages = self.author_languages[source_author]
+        languages[language] -= 1
+        if languages[language] <= 0:
+            del languages[language]
+        changed = {source_author}
+        
+        for citation in citations:
+            cited_author = citation['cited_author']
+            edge = self.G[source_author][cited_author]
+            edge['weight'] -= 1
+            edge_citations = edge['citations']
+            # Drop this very citation, not an equal one from another fragment
+            for i, existing in enumerate(edge_citations):
+                if existing is citation:
+                    del edge_citations[i]
+                    break
+            if edge['weight'] == 0:
+                self.G.remove_edge(source_author, cited_author)
+            changed.add(cited_author)
+        
+        for author in changed:
+            if self.G.degree(author) == 0 and self.G.nodes[author]['fragments'] == 0:
+                self.G.remove_node(author)
+        
+        self._gap_dirty |= changed
+        self._sparse_cache = None  # edge weights changed
+        self._reach_index = None  # removals can split reachability; rebuilt on next use
+        return changed
     
     def identify_citation_gaps(self, min_citations: int = 3) -> List[Dict]:
         """
         Identify "ghost genres" - works that must have existed based on citation patterns.
         
+        After add_fragments/remove_fragments only the changed authors are
+        re-examined; recoverability is rescored from the cached centralities.
+        
         Args:
             min_citations: Minimum number of citations to consider a gap
             
         Returns:
             List of gap analysis dictionaries
         """
-        gaps = []
+        # Rescan everything unless the graph has only changed through this class
+        if (self._gap_cache is None or self._gap_min_citations != min_citations
+                or self._synced_key != self._graph_key() or self._synced_key[1] is None):
+            self._gap_cache = {}
+            candidates = list(self.G.nodes())
+        else:
+            candidates = self._gap_dirty
         
         # Find authors who are cited frequently but have no fragments
-        for node in self.G.nodes():
+        for node in candidates:
+            self._gap_cache.pop(node, None)
+            if node not in self.G:
+                continue
             in_degree = self.G.in_degree(node)
-            out_degree = self.G.out_degree(node)
             node_data = self.G.nodes[node]
             
             # Check if this is a "ghost" - cited but no fragments
@@ -112,20 +459,28 @@ class CitationNetwork:
                 # Determine likely genre based on citing authors
                 genre = self._infer_genre(citing_authors)
                 
-                # Calculate recoverability score
-                recoverability = self._calculate_recoverability_score(node, citing_authors)
-                
-                gap = {
-                    'author': node,
-                    'citations': in_degree,
-                    'citing_authors': citing_authors,
-                    'genre': genre,
-                    'recoverability_score': recoverability,
-                    'reason': f"{in_degree} authors cite '{node}' but no extant fragments found",
-                    'predicted_works': max(1, in_degree // 2),  # Heuristic
-                    'search_strategy': self._generate_search_strategy(node, genre, citing_authors)
-                }
-                gaps.append(gap)
+                self._gap_cache[node] = (in_degree, citing_authors, genre)
+        
+        self._gap_dirty = set()
+        self._gap_min_citations = min_citations
+        self._synced_key = self._graph_key()
+        
+        gaps = []
+        for node, (in_degree, citing_authors, genre) in self._gap_cache.items():
+            # Calculate recoverability score
+            recoverability = self._calculate_recoverability_score(node, citing_authors)
+            
+            gap = {
+                'author': node,
+                'citations': in_degree,
+                'citing_authors': citing_authors,
+                'genre': genre,
+                'recoverability_score': recoverability,
+                'reason': f"{in_degree} authors cite '{node}' but no extant fragments found",
+                'predicted_works': max(1, in_degree // 2),  # Heuristic
+                'search_strategy': self._generate_search_strategy(node, genre, citing_authors)
+            }
+            gaps.append(gap)
         
         # Sort by recoverability score
         gaps.sort(key=lambda x: x['recoverability_score'], reverse=True)
@@ -154,6 +509,91 @@ class CitationNetwork:
         
         return "Unknown"
     
+    def reachability_index(self) -> ReachabilityIndex:
+        """
+        Transitive-closure index of the citation graph, tagged with author languages.
+        
+        Languages come from fragment 'language' fields plus KNOWN_TRANSLATIONS.
+        add_fragments updates the index in place; other changes rebuild it on
+        next use.
+        """
+        if self._reach_index is None or self._reach_key != self._graph_key() or self._reach_key[1] is None:
+            languages = {author: set(counts) for author, counts in self.author_languages.items()}
+            for language, authors in KNOWN_TRANSLATIONS.items():
+                for author in authors:
+                    languages.setdefault(author, set()).add(language)
+            self._reach_index = ReachabilityIndex(self.G, languages)
+            self._reach_key = self._graph_key()
+        return self._reach_index
+    
+    def has_path(self, a: str, b: str) -> bool:
+        """Whether author a reaches author b through citations (a cites ... cites b)."""
+        return self.reachability_index().has_path(a, b)
+    
+    def paths_via(self, *languages: str) -> Set[str]:
+        """
+        Authors transmitted through authors of the given languages, in order.
+        
+        E.g. paths_via('syriac', 'arabic', 'latin') is every author with a
+        Greek→Syriac→Arabic→Latin route; see ReachabilityIndex.paths_via.
+        """
+        return self.reachability_index().paths_via(*languages)
+    
+    def neighborhood(self, author: str, k: int = 1, reverse: bool = False) -> Set[str]:
+        """Authors within k citation hops (cited by author, or citing it with reverse=True)."""
+        return self.reachability_index().neighborhood(author, k, reverse=reverse)
+    
+    def sparse_snapshot(self) -> SparseGraph:
+        """CSR snapshot of the graph with integer node ids, cached per graph version."""
+        key = self._graph_key()
+        if self._sparse_cache is None or key[1] is None or key != self._sparse_key:
+            self._sparse_cache = SparseGraph.from_networkx(self.G)
+            self._sparse_key = key
+        return self._sparse_cache
+    
+    def centralities(self) -> Dict[str, Optional[Dict[str, float]]]:
+        """
+        Betweenness and eigenvector centrality of every node.
+        
+        Computed once per graph version with the configured backend and shared
+        by gap detection, load-bearing node analysis and the priority queue.
+        A measure that cannot be computed (e.g. eigenvector centrality failing
+        to converge) is None.
+        
+        Returns:
+            {'betweenness': {node: value}, 'eigenvector': {node: value}}
+        """
+        key = self._graph_key()
+        if self._centrality_cache is not None and key[1] is not None and key == self._centrality_key:
+            return self._centrality_cache
+        
+        graph = self.sparse_snapshot() if self.backend == 'sparse' else self.G
+        k = self.betweenness_samples
+        if k is not None and k >= len(self.G):
+            k = None
+        try:
+            if self.backend == 'sparse':
+                betweenness = graph.betweenness_centrality(k=k)
+            else:
+                betweenness = nx.betweenness_centrality(graph, k=k, seed=42)
+        except Exception:
+            betweenness = None
+        
+        # Always a cold start: citation graphs are rarely strongly connected,
+        # so the limit depends on the start vector and a warm start would tie
+        # scores to update history
+        try:
+            if self.backend == 'sparse':
+                eigenvector = graph.eigenvector_centrality(max_iter=1000)
+            else:
+                eigenvector = nx.eigenvector_centrality(graph, max_iter=1000)
+        except Exception:
+            eigenvector = None
+        
+        self._centrality_cache = {'betweenness': betweenness, 'eigenvector': eigenvector}
+        self._centrality_key = key
+        return self._centrality_cache
+    
     def _calculate_recoverability_score(self, author: str, citing_authors: List[str]) -> float:
         """Calculate recoverability score (0-1)."""
         score = 0.0
@@ -161,24 +601,22 @@ class CitationNetwork:
         # Base score from number of citations
         score += min(len(citing_authors) * 0.1, 0.4)
         
+        centralities = self.centralities()
+        
         # Bonus for citing author centrality
-        for citing_author in citing_authors:
-            try:
-                centrality = nx.eigenvector_centrality(self.G)[citing_author]
-                score += centrality * 0.05
-            except:
-                pass
+        eigenvector = centralities['eigenvector']
+        if eigenvector:
+            for citing_author in citing_authors:
+                score += eigenvector.get(citing_author, 0) * 0.05
         
         # Bonus for transmission paths
         transmission_paths = self._count_transmission_paths(author, citing_authors)
         score += min(transmission_paths * 0.1, 0.2)
         
         # Bonus for network position
-        try:
-            betweenness = nx.betweenness_centrality(self.G).get(author, 0)
-            score += betweenness * 0.1
-        except:
-            pass
+        betweenness = centralities['betweenness']
+        if betweenness:
+            score += betweenness.get(author, 0) * 0.1
         
         return min(score, 1.0)
     
@@ -194,14 +632,9 @@ class CitationNetwork:
         return paths
     
     def _has_translation_chain(self, author: str) -> bool:
-        """Check if author has known translation chains."""
-        # This would query a database of known translation chains
-        # For now, use some known examples
-        known_chains = {
-            'Aristotle', 'Galen', 'Ptolemy', 'Euclid', 'Hippocrates',
-            'Plato', 'Plotinus', 'Theophrastus'
-        }
-        return author in known_chains
+        """Check if author has known translation chains or is transmitted by a translated author."""
+        return (author in KNOWN_TRANSLATION_CHAINS or
+                author in self.reachability_index().paths_via_any(*TRANSLATION_LANGUAGES))
     
     def _generate_search_strategy(self, author: str, genre: str, citing_authors: List[str]) -> str:
         """Generate search strategy for finding the lost work."""
@@ -232,38 +665,37 @@ class CitationNetwork:
         return " + ".join(strategies[:2])  # Return top 2 strategies
     
     def _has_arabic_transmission(self, author: str) -> bool:
-        """Check if author has known Arabic transmission."""
-        arabic_authors = {
-            'Aristotle', 'Galen', 'Ptolemy', 'Euclid', 'Hippocrates',
-            'Plotinus', 'Proclus', 'Alexander of Aphrodisias'
-        }
-        return author in arabic_authors
+        """Check if author has known Arabic transmission, directly or through citing authors."""
+        return author in self.reachability_index().paths_via('arabic')
     
     def _has_syriac_intermediary(self, author: str) -> bool:
-        """Check if author has known Syriac intermediaries."""
-        syriac_authors = {
-            'Aristotle', 'Galen', 'Porphyry', 'Nemesius', 'Sergius of Reshaina'
-        }
-        return author in syriac_authors
+        """Check if author has known Syriac intermediaries, directly or through citing authors."""
+        return author in self.reachability_index().paths_via('syriac')
     
-    def identify_load_bearing_nodes(self, threshold: float = 0.1) -> List[Dict]:
+    def identify_load_bearing_nodes(self, threshold: float = 0.1, epsilon: float = 0.05,
+                                    delta: float = 0.05, max_workers: Optional[int] = None,
+                                    seed: int = 42) -> List[Dict]:
         """
         Identify "load-bearing" nodes whose loss would collapse citation chains.
         
         Args:
             threshold: Centrality threshold for load-bearing nodes
+            epsilon: Error bound of the impact scores
+            delta: Probability of exceeding the error bound
+            max_workers: Processes estimating impacts (default: CPU count)
+            seed: Random seed for pair sampling
             
         Returns:
             List of critical node dictionaries
         """
-        try:
-            betweenness = nx.betweenness_centrality(self.G)
-            eigenvector = nx.eigenvector_centrality(self.G, max_iter=1000)
-        except:
+        centralities = self.centralities()
+        betweenness = centralities['betweenness']
+        eigenvector = centralities['eigenvector']
+        if betweenness is None or eigenvector is None:
             self.logger.warning("Failed to calculate centrality measures")
             return []
         
-        critical_nodes = []
+        candidates = []
         
         for node in self.G.nodes():
             b_cent = betweenness.get(node, 0)
@@ -273,20 +705,27 @@ class CitationNetwork:
             combined_score = (b_cent + e_cent) / 2
             
             if combined_score > threshold:
-                # Calculate impact of removing this node
-                impact = self._calculate_node_impact(node)
-                
-                critical_nodes.append({
-                    'node': node,
-                    'betweenness_centrality': b_cent,
-                    'eigenvector_centrality': e_cent,
-                    'combined_score': combined_score,
-                    'impact_score': impact,
-                    'fragments': self.G.nodes[node].get('fragments', 0),
-                    'citations_in': self.G.in_degree(node),
-                    'citations_out': self.G.out_degree(node),
-                    'risk_level': 'HIGH' if impact > 0.5 else 'MEDIUM'
-                })
+                candidates.append((node, b_cent, e_cent, combined_score))
+        
+        # Calculate impact of removing each candidate
+        impacts = self.estimate_node_impacts([node for node, *_ in candidates], epsilon=epsilon,
+                                             delta=delta, max_workers=max_workers, seed=seed)
+        
+        critical_nodes = []
+        
+        for node, b_cent, e_cent, combined_score in candidates:
+            impact = impacts[node]
+            critical_nodes.append({
+                'node': node,
+                'betweenness_centrality': b_cent,
+                'eigenvector_centrality': e_cent,
+                'combined_score': combined_score,
+                'impact_score': impact,
+                'fragments': self.G.nodes[node].get('fragments', 0),
+                'citations_in': self.G.in_degree(node),
+                'citations_out': self.G.out_degree(node),
+                'risk_level': 'HIGH' if impact > 0.5 else 'MEDIUM'
+            })
         
         # Sort by impact score
         critical_nodes.sort(key=lambda x: x['impact_score'], reverse=True)
@@ -294,22 +733,68 @@ class CitationNetwork:
         self.logger.info(f"Identified {len(critical_nodes)} load-bearing nodes")
         return critical_nodes
     
-    def _calculate_node_impact(self, node: str) -> float:
-        """Calculate the impact of removing a node from the network."""
-        # Create a copy of the graph without the node
-        G_copy = self.G.copy()
-        G_copy.remove_node(node)
-        
-        # Calculate connectivity loss
-        original_connectivity = nx.average_node_connectivity(self.G)
-        new_connectivity = nx.average_node_connectivity(G_copy)
-        
-        connectivity_loss = original_connectivity - new_connectivity
+    def estimate_node_impacts(self, nodes: List[str], epsilon: float = 0.05, delta: float = 0.05,
+                              max_workers: Optional[int] = None, seed: int = 42) -> Dict[str, float]:
+        """
+        Estimate the impact of removing each node from the network.
         
-        # Normalize to 0-1 range
-        impact = min(connectivity_loss / original_connectivity if original_connectivity > 0 else 0, 1.0)
+        The impact is the fraction of connected (source, target) author pairs,
+        not involving the node, that lose every citation path when it is
+        removed. It is estimated on pairs sampled uniformly from the connected
+        pairs and is within epsilon of the exact value with probability
+        1 - delta. Small networks are evaluated exactly.
         
-        return impact
+        Args:
+            nodes: Nodes to evaluate
+            epsilon: Error bound
+            delta: Probability of exceeding the error bound
+            max_workers: Processes to spread the sampled sources over (default:
+                CPU count); jobs under IMPACT_POOL_MIN_WORK run in process
+            seed: Random seed for pair sampling
+            
+        Returns:
+            Impact score (0-1) by node
+        """
+        if not nodes:
+            return {}
+        
+        successors = {node: list(self.G.successors(node)) for node in self.G.nodes()}
+        n_pairs = pairs_for_error_bound(epsilon, delta)
+        pairs = sample_reachable_pairs(successors, n_pairs, seed=seed)
+        
+        drawn = sum(sum(targets.values()) for targets in pairs.values())
+        if drawn and drawn < n_pairs and len(successors) * (len(successors) - 1) > n_pairs:
+            self.logger.warning(f"Sampled only {drawn} of {n_pairs} connected pairs; "
+                                f"impact error bound is {math.sqrt(math.log(2 / delta) / (2 * drawn)):.3f}")
+        
+        # One dominator tree per sampled source covers every node
+        tasks = list(pairs.items())
+        max_workers = min(max_workers or mp.cpu_count(), len(tasks))
+        if max_workers <= 1 or len(tasks) * self.G.number_of_edges() < self.IMPACT_POOL_MIN_WORK:
+            results = [dominated_pair_counts(self.G, source, targets) for source, targets in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_impact_worker,
+                                     initargs=(successors,)) as executor:
+                chunksize = max(1, len(tasks) // (max_workers * 4))
+                results = list(executor.map(_impact_task, tasks, chunksize=chunksize))
+        
+        lost = defaultdict(int)
+        for counts in results:
+            for node, count in counts.items():
+                lost[node] += count
+        
+        # Pairs that start or end at a node do not count towards its impact
+        as_endpoint = defaultdict(int)
+        for source, targets in pairs.items():
+            for target, count in targets.items():
+                as_endpoint[source] += count
+                as_endpoint[target] += count
+        
+        impacts = {}
+        for node in nodes:
+            total = drawn - as_endpoint[node]
+            impacts[node] = lost[node] / total if total > 0 else 0.0
+        return impacts
     
     def map_translation_chains(self) -> List[Dict]:
         """
@@ -383,11 +868,14 @@ class CitationNetwork:
         if len(predecessors) < 2:
             return None
         
+        index = self.reachability_index()
         return {
             'greek_original': f"{node}.OriginalWork",
             'syriac_intermediary': None,
             'arabic_translation': None,
             'latin_translation': None,
+            'transmission_languages': [language for language in TRANSLATION_LANGUAGES
+                                       if node in index.paths_via(language)],
             'confidence': 0.3,  # Low confidence for predicted chains
             'note': 'Predicted from network analysis'
         }
@@ -404,15 +892,19 @@ class CitationNetwork:
             DataFrame with ranked targets
         """
         priorities = []
+        centralities = self.centralities()
+        betweenness = centralities['betweenness'] or {}
+        eigenvector = centralities['eigenvector'] or {}
         
         # Add citation gaps to priority queue
         for gap in gaps:
+            author = gap['author']
             priorities.append({
-                'target': gap['author'],
+                'target': author,
                 'type': 'citation_gap',
                 'recoverability_score': gap['recoverability_score'],
                 'fragments_found': 0,
-                'network_centrality': 0.5,  # Placeholder
+                'network_centrality': (betweenness.get(author, 0) + eigenvector.get(author, 0)) / 2,
                 'translation_paths': len(gap.get('search_strategy', '').split(' + ')),
                 'imaging_feasibility': 0.3,  # Default low feasibility
                 'priority_score': gap['recoverability_score'],
@@ -456,57 +948,44 @@ class CitationNetwork:
         
         Args:
             filepath: Output file path
-            format: Export format ('graphml', 'gexf', 'json')
+            format: Export format ('graphml', 'gexf', 'json', or 'snapshot' for
+                the binary, memory-mappable GraphSnapshot format)
         """
         if format == 'graphml':
-            nx.write_graphml(self.G, filepath)
+            nx.write_graphml(self._export_graph(), filepath)
         elif format == 'gexf':
-            nx.write_gexf(self.G, filepath)
+            nx.write_gexf(self._export_graph(), filepath)
         elif format == 'json':
             data = nx.node_link_data(self.G)
             with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+                serialization.dump(data, f)
+        elif format == 'snapshot':
+            write_snapshot(self.G, filepath)
         else:
             raise ValueError(f"Unsupported format: {format}")
         
         self.logger.info(f"Exported network to {filepath}")
     
+    def _export_graph(self) -> nx.DiGraph:
+        """Copy of the graph with edge citation lists encoded as JSON strings, as GraphML/GEXF need scalars."""
+        export = nx.DiGraph()
+        export.add_nodes_from(self.G.nodes(data=True))
+        export.add_edges_from(
+            (u, v, {**data, 'citations': serialization.dumps(data.get('citations', []), compact=True)})
+            for u, v, data in self.G.edges(data=True)
+        )
+        return export
+    
     def visualize_network(self, filepath: str, figsize: Tuple[int, int] = (12, 8)):
         """
         Create network visualization.
         
+        Rendered headlessly; use RenderService to draw many graphs at once.
+        
         Args:
             filepath: Output image file path
             figsize: Figure size (width, height)
         """
-        plt.figure(figsize=figsize)
-        
-        # Use spring layout for better visualization
-        pos = nx.spring_layout(self.G, k=1, iterations=50)
-        
-        # Draw nodes
-        node_sizes = [self.G.nodes[node].get('fragments', 1) * 50 + 20 for node in self.G.nodes()]
-        node_colors = [self.G.nodes[node].get('confidence', 0.5) for node in self.G.nodes()]
-        
-        nx.draw_networkx_nodes(self.G, pos, node_size=node_sizes, 
-                             node_color=node_colors, cmap=plt.cm.viridis,
-                             alpha=0.7)
-        
-        # Draw edges
-        edge_weights = [self.G[u][v].get('weight', 1) for u, v in self.G.edges()]
-        nx.draw_networkx_edges(self.G, pos, width=edge_weights, alpha=0.5,
-                             edge_color='gray')
-        
-        # Draw labels
-        nx.draw_networkx_labels(self.G, pos, font_size=8)
-        
-        plt.title("Classical Text Citation Network")
-        plt.axis('off')
-        plt.colorbar(plt.cm.ScalarMappable(cmap=plt.cm.viridis), 
-                    label='Confidence Score')
-        
-        plt.tight_layout()
-        plt.savefig(filepath, dpi=300, bbox_inches='tight')
-        plt.close()
+        render_network(self.G, filepath, figsize)
         
         self.logger.info(f"Saved network visualization to {filepath}")
\ No newline at end of file
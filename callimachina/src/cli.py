@@ -5,13 +5,17 @@ Usage:
     python -m src.cli reconstruct --work "Apollodorus.Chronicle"
     python -m src.cli network --mode excavation --output discoveries/priority_queue.csv
     python -m src.cli stylometry --author "TestAuthor" --texts path/to/texts/
+    python -m src.cli ingest --input fragments.jsonl
+    python -m src.cli export --work "Apollodorus.Chronicle" --output-dir discoveries/
+    python -m src.cli export --jsonl discoveries/reconstructions.jsonl
+    python -m src.cli render --output-dir discoveries/plots/ --workers 8
 """
 
 import click
 import sys
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 import pandas as pd
 
 # Add src to path for imports
@@ -22,13 +26,19 @@ from citation_network import CitationNetwork
 from bayesian_reconstructor import BayesianReconstructor
 from stylometric_engine import StylometricEngine
 from cross_lingual import CrossLingualMapper
+from database import configure_database, get_database, iter_fragments_jsonl
+from render_service import RenderService
+from serialization import JSONLWriter
 
 
 @click.group()
 @click.version_option(version="3.0.0")
-def callimachina():
+@click.option('--db-path', envvar='CALLIMACHINA_DB', default=None,
+              help='SQLite corpus database (default: callimachina_corpus.db, env: CALLIMACHINA_DB)')
+def callimachina(db_path: Optional[str]):
     """Autonomous digital archaeology for classical texts."""
-    pass
+    if db_path:
+        configure_database(db_path)
 
 
 @callimachina.command()
@@ -306,12 +316,58 @@ def translate_chain(work: str, output: Optional[str], verbose: bool):
         sys.exit(1)
 
 
+@callimachina.command()
+@click.option('--input', 'input_path', required=True, help='JSONL file with one fragment object per line')
+@click.option('--chunk-size', default=5000, help='Fragments written per transaction')
+@click.option('--update-posteriors', is_flag=True,
+              help='Fold fragments not already in the database into their works\' stored posteriors')
+def ingest(input_path: str, chunk_size: int, update_posteriors: bool):
+    """Stream a JSONL fragment dump into the corpus database."""
+    if not Path(input_path).is_file():
+        click.echo(f"❌ Input file not found: {input_path}", err=True)
+        sys.exit(1)
+    
+    try:
+        database = get_database()
+        stats = database.ingest_jsonl(input_path, chunk_size=chunk_size, track_new=update_posteriors)
+        
+        click.echo(f"✅ Ingested {stats['fragments']} fragments and {stats['citations']} citations")
+        click.echo(f"⚡ {stats['rows_per_sec']:.0f} rows/sec ({stats['elapsed']:.1f}s)")
+        if stats['skipped']:
+            click.echo(f"⚠️  Skipped {stats['skipped']} malformed fragments")
+        
+        if update_posteriors:
+            # Only fragments not stored before count as evidence, once each,
+            # so re-ingesting a file does not fold it in twice
+            new_ids = stats['new_ids']
+            evidence_by_work = {}
+            for fragment in iter_fragments_jsonl(input_path):
+                if fragment.get('id') not in new_ids:
+                    continue
+                new_ids.discard(fragment['id'])
+                if fragment.get('work_id') and fragment.get('text') is not None:
+                    evidence_by_work.setdefault(fragment['work_id'], []).append(
+                        BayesianReconstructor.fragment_evidence(fragment)
+                    )
+            
+            reconstructor = BayesianReconstructor(database=database)
+            for work_id, items in evidence_by_work.items():
+                evidence, weights = zip(*items)
+                reconstructor.add_evidence(work_id, list(evidence), list(weights))
+            click.echo(f"📈 Updated posteriors for {len(evidence_by_work)} works")
+        
+    except Exception as e:
+        click.echo(f"❌ Ingest failed: {e}", err=True)
+        sys.exit(1)
+
+
 @callimachina.command()
 @click.option('--target', help='Specific work to excavate')
-@click.option('--output-dir', default='discoveries/', help='Output directory')
+@click.option('--output-dir', default='discoveries/', help='Output directory (with --write-files)')
 @click.option('--priority-file', default='discoveries/priority_queue.csv', help='Priority queue file')
+@click.option('--write-files', is_flag=True, help='Also render per-work JSON/Markdown/CSV files')
 @click.option('--verbose', is_flag=True, help='Enable verbose output')
-def excavate(target: Optional[str], output_dir: str, priority_file: str, verbose: bool):
+def excavate(target: Optional[str], output_dir: str, priority_file: str, write_files: bool, verbose: bool):
     """Run full excavation pipeline."""
     if verbose:
         click.echo("🏛️ Starting autonomous excavation pipeline")
@@ -348,15 +404,13 @@ def excavate(target: Optional[str], output_dir: str, priority_file: str, verbose
         
         click.echo(f"🎯 Excavating {len(works)} work(s)")
         
+        # Results are stored in one batch once every work is done
+        records = []
+        
         # Process each work
         for i, work in enumerate(works, 1):
             click.echo(f"\n[{i}/{len(works)}] Processing {work}...")
             
-            # Reconstruct
-            work_safe = work.replace('.', '_').replace(' ', '_')
-            work_output = Path(output_dir) / f"{work_safe}_{pd.Timestamp.now().strftime('%Y-%m-%d')}"
-            work_output.mkdir(parents=True, exist_ok=True)
-            
             # Mock fragments
             fragments = [
                 {
@@ -380,14 +434,14 @@ def excavate(target: Optional[str], output_dir: str, priority_file: str, verbose
                 "century": -1
             }
             
+            # Reconstruct
             results = reconstructor.reconstruct_work(
                 work_id=work,
                 fragments=fragments,
                 citations=[c for f in fragments for c in f.get('citations', [])],
                 metadata=metadata
             )
-            
-            reconstructor.save_reconstruction(results, str(work_output))
+            records.append((results, reconstructor.confidence_history.rows(work)))
             
             confidence = results['posterior_confidence']['mean']
             click.echo(f"   ✅ {work}: {confidence:.1%} confidence")
@@ -399,7 +453,16 @@ def excavate(target: Optional[str], output_dir: str, priority_file: str, verbose
             except:
                 pass
         
-        click.echo(f"\n🏛️ Excavation complete! Results in {output_dir}")
+        get_database().save_reconstructions(records)
+        
+        if write_files:
+            for results, history in records:
+                work_output = _work_output_path(output_dir, results['work_id'])
+                reconstructor.save_reconstruction(results, str(work_output), confidence_history=history)
+            click.echo(f"\n🏛️ Excavation complete! Results in {output_dir}")
+        else:
+            click.echo(f"\n🏛️ Excavation complete! Results stored in {get_database().db_path} "
+                       f"(render files with 'export')")
         
     except Exception as e:
         click.echo(f"❌ Excavation failed: {e}", err=True)
@@ -408,5 +471,66 @@ def excavate(target: Optional[str], output_dir: str, priority_file: str, verbose
         sys.exit(1)
 
 
+@callimachina.command()
+@click.option('--work', 'works', multiple=True, help='Work to export (repeatable; default: all reconstructed works)')
+@click.option('--output-dir', default='discoveries/', help='Output directory')
+@click.option('--compact', is_flag=True, help='Write JSON without indentation')
+@click.option('--jsonl', 'jsonl_path', default=None, help='Stream all reconstructions to one JSON Lines file instead')
+@click.option('--verbose', is_flag=True, help='Enable verbose output')
+def export(works: Tuple[str, ...], output_dir: str, compact: bool, jsonl_path: Optional[str], verbose: bool):
+    """Render the latest stored reconstructions as JSON/Markdown/CSV files."""
+    try:
+        latest = get_database().get_latest_reconstructions(list(works) or None)
+        
+        missing = [work for work in works if work not in latest]
+        for work in missing:
+            click.echo(f"⚠️  No stored reconstruction for {work}", err=True)
+        
+        if jsonl_path:
+            with JSONLWriter(jsonl_path) as writer:
+                writer.write_many(latest.values())
+            click.echo(f"✅ Exported {writer.written} reconstruction(s) to {jsonl_path}")
+            return
+        
+        renderer = BayesianReconstructor()
+        for work_id, results in latest.items():
+            history = results.pop('confidence_history')
+            work_output = _work_output_path(output_dir, work_id)
+            renderer.save_reconstruction(results, str(work_output), confidence_history=history,
+                                         compact=compact)
+            if verbose:
+                click.echo(f"   📁 {work_id} → {work_output}")
+        
+        click.echo(f"✅ Exported {len(latest)} reconstruction(s) to {output_dir}")
+        
+    except Exception as e:
+        click.echo(f"❌ Export failed: {e}", err=True)
+        sys.exit(1)
+
+
+@callimachina.command()
+@click.option('--work', 'works', multiple=True, help='Work to render (repeatable; default: all stored)')
+@click.option('--output-dir', default='discoveries/plots/', help='Directory for the PNG files')
+@click.option('--workers', default=None, type=int, help='Rendering processes (default: CPU count)')
+@click.option('--dpi', default=300, help='Output resolution')
+def render(works: Tuple[str, ...], output_dir: str, workers: Optional[int], dpi: int):
+    """Render confidence plots for stored reconstructions in parallel."""
+    try:
+        with RenderService(max_workers=workers, dpi=dpi) as service:
+            paths = service.render_works(list(works) or None, output_dir, get_database())
+        
+        click.echo(f"✅ Rendered {len(paths)} confidence plot(s) to {output_dir}")
+        
+    except Exception as e:
+        click.echo(f"❌ Render failed: {e}", err=True)
+        sys.exit(1)
+
+
+def _work_output_path(output_dir: str, work: str) -> Path:
+    """Dated per-work output directory, e.g. discoveries/Apollodorus_Chronicle_2025-11-06."""
+    work_safe = work.replace('.', '_').replace(' ', '_')
+    return Path(output_dir) / f"{work_safe}_{pd.Timestamp.now().strftime('%Y-%m-%d')}"
+
+
 if __name__ == '__main__':
     callimachina()
\ No newline at end of file
@@ -6,102 +6,358 @@ Enables scale-up to 400+ works with efficient querying
 
 import sqlite3
 import json
+import os
+import queue
+import threading
+import time
 import pandas as pd
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Iterable, Iterator, Set, Tuple
 import logging
 from datetime import datetime
 
+try:
+    from . import serialization
+except ImportError:  # loaded from src/ on sys.path (CLI, scripts, tests)
+    import serialization
+
 
 class FragmentDatabase:
     """SQLite database for managing fragment corpus at scale."""
     
-    def __init__(self, db_path: str = "callimachina_corpus.db"):
-        """Initialize database connection."""
+    # Connection pragmas: WAL lets readers proceed while another process
+    # writes, and NORMAL sync is durable under WAL except on power loss.
+    DEFAULT_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'cache_size': -64000,       # 64 MB page cache (negative = KiB)
+        'mmap_size': 268435456,     # 256 MB memory-mapped I/O
+        'temp_store': 'MEMORY',
+        # INSERT OR REPLACE only fires the FTS delete trigger with this on
+        'recursive_triggers': 'ON',
+    }
+    
+    # Bump when _create_schema changes; stored in PRAGMA user_version so the
+    # DDL only runs against databases created by an older release.
+    SCHEMA_VERSION = 6
+    
+    # Upper bound on bound parameters per IN (...) clause; SQLite builds
+    # before 3.32 cap a statement at 999 host parameters.
+    _IN_CHUNK_SIZE = 500
+    
+    # Fragment fields returned to callers (docid is internal to the FTS index)
+    _FRAGMENT_COLUMNS = ("f.id, f.text, f.source, f.source_author, f.confidence, f.position, "
+                         "f.work_id, f.language, f.date_added, f.metadata")
+    
+    def __init__(self, db_path: str = "callimachina_corpus.db",
+                 timeout: float = 30.0, pragmas: Optional[Dict[str, Any]] = None):
+        """
+        Initialize database connection pool.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            timeout: Seconds to wait on a locked database before failing
+            pragmas: Overrides for DEFAULT_PRAGMAS
+        """
         self.db_path = Path(db_path)
+        self.timeout = timeout
+        self.pragmas = {**self.DEFAULT_PRAGMAS, **(pragmas or {})}
         self.logger = logging.getLogger(__name__)
+        
+        # One connection per (process, thread); see _get_connection
+        self._local = threading.local()
+        self._pool_lock = threading.Lock()
+        self._pool: List[sqlite3.Connection] = []
+        self._pool_pid = os.getpid()
+        
         self._init_database()
     
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Return the pooled connection for the calling thread.
+        
+        Connections are created lazily, configured once with the tuned
+        pragmas and reused for every subsequent call on the same thread.
+        A forked worker never reuses its parent's connections.
+        
+        Each connection is only used by the thread that opened it, but
+        check_same_thread is off so close() can release connections of
+        threads (e.g. the write-behind writer) that have already exited.
+        """
+        pid = os.getpid()
+        if pid != self._pool_pid:
+            # Forked child: inherited handles belong to the parent process
+            self._local = threading.local()
+            self._pool = []
+            self._pool_pid = pid
+        
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False)
+            for pragma, value in self.pragmas.items():
+                conn.execute(f"PRAGMA {pragma} = {value}")
+            self._local.conn = conn
+            with self._pool_lock:
+                self._pool.append(conn)
+        return conn
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Yield the pooled connection, committing on success and rolling back on error."""
+        conn = self._get_connection()
+        with conn:
+            yield conn
+    
+    def close(self):
+        """Close every pooled connection owned by this process."""
+        if os.getpid() != self._pool_pid:
+            return
+        with self._pool_lock:
+            for conn in self._pool:
+                try:
+                    conn.close()
+                except sqlite3.Error as e:
+                    self.logger.warning(f"Failed to close a pooled connection to {self.db_path}: {e}")
+            self._pool.clear()
+        self._local = threading.local()
+    
     def _init_database(self):
-        """Create database tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
-            # Fragments table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS fragments (
-                    id TEXT PRIMARY KEY,
-                    text TEXT NOT NULL,
-                    source TEXT,
-                    source_author TEXT,
-                    confidence REAL,
-                    position INTEGER,
-                    work_id TEXT,
-                    language TEXT DEFAULT 'greek',
-                    date_added TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    metadata TEXT  -- JSON string for additional data
-                )
-            """)
-            
-            # Citations table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS citations (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    fragment_id TEXT,
-                    cited_author TEXT,
-                    cited_work TEXT,
-                    pattern TEXT,
-                    confidence REAL,
-                    FOREIGN KEY (fragment_id) REFERENCES fragments (id)
-                )
-            """)
+        """Create the schema once; later opens only check PRAGMA user_version."""
+        with self._connect() as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= self.SCHEMA_VERSION:
+                self.fts_enabled = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'fragments_fts'"
+                ).fetchone() is not None
+                self.logger.debug(f"Database schema v{version} already current at {self.db_path}")
+                return
             
-            # Works table
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS works (
-                    work_id TEXT PRIMARY KEY,
-                    author TEXT,
-                    title TEXT,
-                    genre TEXT,
-                    century INTEGER,
-                    status TEXT DEFAULT 'lost',
-                    priority_score REAL,
-                    recoverability_score REAL,
-                    reconstruction_confidence REAL,
-                    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    metadata TEXT  -- JSON string
-                )
-            """)
-            
-            # Translation chains table
+            self._migrate(conn)
+            self._create_schema(conn)
+            conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        
+        self.logger.info(f"Database initialized at {self.db_path} (schema v{self.SCHEMA_VERSION})")
+    
+    def _create_schema(self, conn: sqlite3.Connection):
+        """Create database tables if they don't exist."""
+        # Fragments table
+        self._create_fragments_table(conn, 'fragments')
+        
+        # Citations table
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS citations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                fragment_id TEXT,
+                cited_author TEXT,
+                cited_work TEXT,
+                pattern TEXT,
+                confidence REAL,
+                FOREIGN KEY (fragment_id) REFERENCES fragments (id)
+            )
+        """)
+        
+        # Works table
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS works (
+                work_id TEXT PRIMARY KEY,
+                author TEXT,
+                title TEXT,
+                genre TEXT,
+                century INTEGER,
+                status TEXT DEFAULT 'lost',
+                priority_score REAL,
+                recoverability_score REAL,
+                reconstruction_confidence REAL,
+                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                metadata TEXT  -- JSON string
+            )
+        """)
+        
+        # Translation chains table
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS translation_chains (
+                work_id TEXT PRIMARY KEY,
+                greek_original TEXT,
+                syriac_intermediary TEXT,
+                arabic_translation TEXT,
+                latin_translation TEXT,
+                transmission_score REAL,
+                confidence REAL,
+                FOREIGN KEY (work_id) REFERENCES works (work_id)
+            )
+        """)
+        
+        # Reconstruction results (one row per run per work)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS reconstructions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                work_id TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                prior_confidence REAL,
+                posterior_mean REAL,
+                ci_lower REAL,
+                ci_upper REAL,
+                fragments_used INTEGER,
+                citations_used INTEGER,
+                results TEXT  -- full results dict as JSON
+            )
+        """)
+        
+        # Confidence history rows belonging to one reconstruction
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS confidence_history (
+                reconstruction_id INTEGER NOT NULL,
+                step INTEGER NOT NULL,
+                prior REAL,
+                posterior_mean REAL,
+                evidence_count INTEGER,
+                timestamp TEXT,
+                alpha REAL,
+                beta REAL,
+                PRIMARY KEY (reconstruction_id, step),
+                FOREIGN KEY (reconstruction_id) REFERENCES reconstructions (id)
+            )
+        """)
+        
+        # Beta posterior per work, advanced incrementally as evidence arrives
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS posterior_state (
+                work_id TEXT PRIMARY KEY,
+                prior REAL,
+                alpha REAL,
+                beta REAL,
+                evidence_count INTEGER,
+                weight_total REAL,
+                last_updated TIMESTAMP
+            )
+        """)
+        
+        # Append-only journal of works completed by each batch run (for resume)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS run_manifest (
+                run_id TEXT NOT NULL,
+                work_id TEXT NOT NULL,
+                result_hash TEXT,
+                confidence REAL,
+                fragments_used INTEGER,
+                completed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (run_id, work_id)
+            )
+        """)
+        
+        # Create indexes for performance
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_fragments_work ON fragments(work_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_fragments_source ON fragments(source)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_citations_fragment ON citations(fragment_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_citations_author ON citations(cited_author)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_works_author ON works(author)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_works_genre ON works(genre)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_works_priority ON works(priority_score DESC)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_reconstructions_work ON reconstructions(work_id, id DESC)")
+        
+        self.fts_enabled = self._init_fulltext_index(conn)
+    
+    @staticmethod
+    def _create_fragments_table(conn: sqlite3.Connection, table: str):
+        """Create the fragments table under the given name."""
+        conn.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                docid INTEGER PRIMARY KEY,  -- rowid alias; stable across VACUUM, keys the FTS index
+                id TEXT NOT NULL UNIQUE,
+                text TEXT NOT NULL,
+                source TEXT,
+                source_author TEXT,
+                confidence REAL,
+                position INTEGER,
+                work_id TEXT,
+                language TEXT DEFAULT 'greek',
+                date_added TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                metadata TEXT  -- JSON string for additional data
+            )
+        """)
+    
+    def _migrate(self, conn: sqlite3.Connection):
+        """
+        Update tables made by an older schema, which CREATE TABLE IF NOT EXISTS skips.
+        
+        Runs before _create_schema, which then adds any missing indexes,
+        the FTS table and its triggers.
+        """
+        history_columns = {row[1] for row in conn.execute("PRAGMA table_info(confidence_history)")}
+        if history_columns:
+            # v5: Beta parameters, so plots of stored histories can draw credible bands
+            for column in ('alpha', 'beta'):
+                if column not in history_columns:
+                    conn.execute(f"ALTER TABLE confidence_history ADD COLUMN {column} REAL")
+        
+        fragment_columns = {row[1] for row in conn.execute("PRAGMA table_info(fragments)")}
+        if fragment_columns and 'docid' not in fragment_columns:
+            # v6: the FTS index was keyed on the implicit rowid, which VACUUM
+            # may renumber; copy the rows into a table with an explicit alias
+            # and let _create_schema rebuild the index over it
+            for trigger in ('insert', 'delete', 'update'):
+                conn.execute(f"DROP TRIGGER IF EXISTS fragments_fts_{trigger}")
+            conn.execute("DROP TABLE IF EXISTS fragments_fts")
+            self._create_fragments_table(conn, 'fragments_v6')
+            columns = "id, text, source, source_author, confidence, position, work_id, language, date_added, metadata"
+            conn.execute(f"INSERT INTO fragments_v6 ({columns}) SELECT {columns} FROM fragments ORDER BY rowid")
+            conn.execute("DROP TABLE fragments")
+            conn.execute("ALTER TABLE fragments_v6 RENAME TO fragments")
+    
+    def _init_fulltext_index(self, conn: sqlite3.Connection) -> bool:
+        """
+        Create the FTS5 index over fragments.text and the triggers that keep it in sync.
+        
+        Returns:
+            False if this SQLite build lacks FTS5 (search_text then falls back to LIKE)
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'fragments_fts'"
+        ).fetchone()
+        
+        try:
+            # External-content table: the index stores tokens only, text stays in fragments
             conn.execute("""
-                CREATE TABLE IF NOT EXISTS translation_chains (
-                    work_id TEXT PRIMARY KEY,
-                    greek_original TEXT,
-                    syriac_intermediary TEXT,
-                    arabic_translation TEXT,
-                    latin_translation TEXT,
-                    transmission_score REAL,
-                    confidence REAL,
-                    FOREIGN KEY (work_id) REFERENCES works (work_id)
+                CREATE VIRTUAL TABLE IF NOT EXISTS fragments_fts USING fts5(
+                    text,
+                    content='fragments',
+                    content_rowid='docid',
+                    tokenize='unicode61 remove_diacritics 2'
                 )
             """)
-            
-            # Create indexes for performance
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_fragments_work ON fragments(work_id)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_fragments_source ON fragments(source)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_citations_fragment ON citations(fragment_id)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_citations_author ON citations(cited_author)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_works_author ON works(author)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_works_genre ON works(genre)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_works_priority ON works(priority_score DESC)")
-            
-            conn.commit()
+        except sqlite3.OperationalError as e:
+            self.logger.warning(f"FTS5 unavailable, text search will scan fragments: {e}")
+            return False
         
-        self.logger.info(f"Database initialized at {self.db_path}")
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS fragments_fts_insert AFTER INSERT ON fragments BEGIN
+                INSERT INTO fragments_fts(rowid, text) VALUES (new.docid, new.text);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS fragments_fts_delete AFTER DELETE ON fragments BEGIN
+                INSERT INTO fragments_fts(fragments_fts, rowid, text) VALUES ('delete', old.docid, old.text);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS fragments_fts_update AFTER UPDATE OF text ON fragments BEGIN
+                INSERT INTO fragments_fts(fragments_fts, rowid, text) VALUES ('delete', old.docid, old.text);
+                INSERT INTO fragments_fts(rowid, text) VALUES (new.docid, new.text);
+            END
+        """)
+        
+        if not exists:
+            # Index fragments stored before the FTS table existed
+            conn.execute("INSERT INTO fragments_fts(fragments_fts) VALUES ('rebuild')")
+        
+        return True
     
     def insert_fragment(self, fragment: Dict[str, Any]) -> bool:
         """Insert a fragment into the database."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 # Insert fragment
                 metadata = fragment.get('metadata', {})
                 conn.execute("""
@@ -143,7 +399,7 @@ class FragmentDatabase:
     def insert_work(self, work: Dict[str, Any]) -> bool:
         """Insert or update a work in the database."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 metadata = work.get('metadata', {})
                 conn.execute("""
                     INSERT OR REPLACE INTO works 
@@ -170,27 +426,125 @@ class FragmentDatabase:
     
     def get_fragments_by_work(self, work_id: str) -> List[Dict[str, Any]]:
         """Get all fragments for a specific work."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM fragments WHERE work_id = ?", (work_id,))
-            fragments = []
-            for row in cursor.fetchall():
-                fragment = dict(row)
-                if fragment['metadata']:
-                    fragment['metadata'] = json.loads(fragment['metadata'])
+        return self.get_fragments_for_works([work_id]).get(work_id, [])
+    
+    def get_fragments_for_works(self, work_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get fragments with their citations for many works at once.
+        
+        Fragments and citations are fetched with one LEFT JOIN per chunk of
+        work ids rather than one citation query per fragment.
+        
+        Args:
+            work_ids: Work identifiers to load
+            
+        Returns:
+            Dictionary mapping each requested work_id to its fragment list
+            (works without fragments map to an empty list)
+        """
+        work_ids = list(dict.fromkeys(work_ids))
+        results: Dict[str, List[Dict[str, Any]]] = {work_id: [] for work_id in work_ids}
+        
+        with self._connect() as conn:
+            for i in range(0, len(work_ids), self._IN_CHUNK_SIZE):
+                chunk = work_ids[i:i + self._IN_CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                cursor = conn.execute(f"""
+                    SELECT {self._FRAGMENT_COLUMNS},
+                           c.id AS c_id,
+                           c.cited_author AS c_cited_author,
+                           c.cited_work AS c_cited_work,
+                           c.pattern AS c_pattern,
+                           c.confidence AS c_confidence
+                    FROM fragments f
+                    LEFT JOIN citations c ON c.fragment_id = f.id
+                    WHERE f.work_id IN ({placeholders})
+                    ORDER BY f.docid, c.id
+                """, chunk)
                 
-                # Get citations for this fragment
-                cit_cursor = conn.execute(
-                    "SELECT cited_author, cited_work, pattern, confidence FROM citations WHERE fragment_id = ?",
-                    (fragment['id'],)
-                )
-                fragment['citations'] = [dict(cit) for cit in cit_cursor.fetchall()]
-                fragments.append(fragment)
-            return fragments
+                columns = [col[0] for col in cursor.description]
+                n_fragment_cols = columns.index('c_id')
+                fragment_cols = columns[:n_fragment_cols]
+                
+                current = None
+                for row in cursor:
+                    if current is None or current['id'] != row[0]:
+                        current = dict(zip(fragment_cols, row[:n_fragment_cols]))
+                        if current['metadata']:
+                            current['metadata'] = json.loads(current['metadata'])
+                        current['citations'] = []
+                        results[current['work_id']].append(current)
+                    
+                    if row[n_fragment_cols] is not None:
+                        current['citations'].append({
+                            'cited_author': row[n_fragment_cols + 1],
+                            'cited_work': row[n_fragment_cols + 2],
+                            'pattern': row[n_fragment_cols + 3],
+                            'confidence': row[n_fragment_cols + 4],
+                        })
+        
+        return results
+    
+    def search_text(self, query: str, work_id: Optional[str] = None,
+                    limit: int = 50, raw: bool = False) -> List[Dict[str, Any]]:
+        """
+        Full-text search over fragment text, best matches first.
+        
+        Args:
+            query: Words or phrase to find (e.g. an author or work name)
+            work_id: Restrict results to one work
+            limit: Maximum number of fragments to return
+            raw: Pass query through as an FTS5 expression (AND/OR/NEAR, prefix*)
+                instead of matching it as a literal phrase
+            
+        Returns:
+            Fragment dictionaries with a 'rank' key (lower is more relevant)
+        """
+        columns = self._FRAGMENT_COLUMNS
+        work_filter = " AND f.work_id = ?" if work_id is not None else ""
+        
+        if self.fts_enabled:
+            match = query if raw else '"' + query.replace('"', '""') + '"'
+            sql = f"""
+                SELECT {columns}, bm25(fragments_fts) AS rank
+                FROM fragments_fts
+                JOIN fragments f ON f.docid = fragments_fts.rowid
+                WHERE fragments_fts MATCH ?{work_filter}
+                ORDER BY rank
+                LIMIT ?
+            """
+            params = [match]
+        else:
+            sql = f"""
+                SELECT {columns}, 0.0 AS rank
+                FROM fragments f
+                WHERE f.text LIKE ?{work_filter}
+                LIMIT ?
+            """
+            params = [f"%{query}%"]
+        
+        if work_id is not None:
+            params.append(work_id)
+        params.append(limit)
+        
+        try:
+            with self._connect() as conn:
+                cursor = conn.execute(sql, params)
+                cursor.row_factory = sqlite3.Row
+                results = []
+                for row in cursor.fetchall():
+                    fragment = dict(row)
+                    if fragment['metadata']:
+                        fragment['metadata'] = json.loads(fragment['metadata'])
+                    results.append(fragment)
+                return results
+        except sqlite3.OperationalError as e:
+            self.logger.error(f"Text search for '{query}' failed: {e}")
+            return []
     
     def get_works_by_priority(self, limit: int = 400) -> pd.DataFrame:
         """Get top N works by priority score."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             df = pd.read_sql_query("""
                 SELECT work_id, author, title, genre, century, status, 
                        priority_score, recoverability_score, reconstruction_confidence
@@ -201,9 +555,19 @@ class FragmentDatabase:
             """, conn, params=(limit,))
             return df
     
+    def get_author_centuries(self) -> Dict[str, int]:
+        """Get each author's earliest recorded century from the works table."""
+        with self._connect() as conn:
+            return dict(conn.execute("""
+                SELECT author, MIN(century)
+                FROM works
+                WHERE author IS NOT NULL AND century IS NOT NULL AND century != 0
+                GROUP BY author
+            """).fetchall())
+    
     def get_network_data(self) -> pd.DataFrame:
         """Get data for building citation network."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             df = pd.read_sql_query("""
                 SELECT f.source_author, c.cited_author, c.cited_work, 
                        c.pattern, c.confidence, f.work_id
@@ -216,7 +580,7 @@ class FragmentDatabase:
     def update_work_confidence(self, work_id: str, confidence: float) -> bool:
         """Update reconstruction confidence for a work."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.execute("""
                     UPDATE works 
                     SET reconstruction_confidence = ?, last_updated = CURRENT_TIMESTAMP
@@ -228,9 +592,269 @@ class FragmentDatabase:
             self.logger.error(f"Failed to update confidence for {work_id}: {e}")
             return False
     
+    def update_work_confidences(self, updates: List[Tuple[str, float]]) -> int:
+        """
+        Update reconstruction confidence for many works in one transaction.
+        
+        Args:
+            updates: (work_id, confidence) pairs
+            
+        Returns:
+            Number of updates written (0 on failure)
+        """
+        if not updates:
+            return 0
+        try:
+            with self._connect() as conn:
+                conn.executemany("""
+                    UPDATE works 
+                    SET reconstruction_confidence = ?, last_updated = CURRENT_TIMESTAMP
+                    WHERE work_id = ?
+                """, [(confidence, work_id) for work_id, confidence in updates])
+            return len(updates)
+        except Exception as e:
+            self.logger.error(f"Failed to update confidence for {len(updates)} works: {e}")
+            return 0
+    
+    def write_behind(self, flush_interval: float = 1.0, max_batch: int = 500) -> 'WriteBehindQueue':
+        """Start a single-writer queue that batches confidence updates for this database."""
+        return WriteBehindQueue(self, flush_interval=flush_interval, max_batch=max_batch).start()
+    
+    def save_reconstructions(self, records: List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]) -> List[int]:
+        """
+        Store reconstruction results and their confidence histories in one transaction.
+        
+        Args:
+            records: (results, confidence_history) pairs as produced by
+                BayesianReconstructor.reconstruct_work and its history
+            
+        Returns:
+            Row ids of the stored reconstructions (empty on failure)
+        """
+        if not records:
+            return []
+        ids = []
+        try:
+            with self._connect() as conn:
+                history_rows = []
+                state_rows = []
+                for results, history in records:
+                    posterior = results.get('posterior_confidence', {})
+                    cursor = conn.execute("""
+                        INSERT INTO reconstructions 
+                        (work_id, prior_confidence, posterior_mean, ci_lower, ci_upper,
+                         fragments_used, citations_used, results)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (
+                        results['work_id'],
+                        _to_builtin(results.get('prior_confidence')),
+                        _to_builtin(posterior.get('mean')),
+                        _to_builtin(posterior.get('ci_lower')),
+                        _to_builtin(posterior.get('ci_upper')),
+                        results.get('fragments_used'),
+                        results.get('citations_used'),
+                        serialization.dumps(results, compact=True)
+                    ))
+                    reconstruction_id = cursor.lastrowid
+                    ids.append(reconstruction_id)
+                    
+                    if 'alpha' in posterior:
+                        evidence_summary = results.get('evidence_summary', {})
+                        state_rows.append(self._posterior_state_row({
+                            'work_id': results['work_id'],
+                            'prior': results.get('prior_confidence'),
+                            'alpha': posterior['alpha'],
+                            'beta': posterior['beta'],
+                            'evidence_count': (evidence_summary.get('fragment_evidence', 0) +
+                                               evidence_summary.get('citation_evidence', 0)),
+                            'weight_total': evidence_summary.get('total_weight', 0.0),
+                            'last_updated': history[-1].get('timestamp') if history else None,
+                        }))
+                    
+                    for step, entry in enumerate(history or []):
+                        history_rows.append((
+                            reconstruction_id,
+                            step,
+                            _to_builtin(entry.get('prior')),
+                            _to_builtin(entry.get('posterior_mean')),
+                            entry.get('evidence_count'),
+                            str(entry.get('timestamp')) if entry.get('timestamp') is not None else None,
+                            # SQLite stores NaN (no Beta recorded) as NULL
+                            _to_builtin(entry.get('alpha')),
+                            _to_builtin(entry.get('beta'))
+                        ))
+                
+                conn.executemany("""
+                    INSERT INTO confidence_history 
+                    (reconstruction_id, step, prior, posterior_mean, evidence_count, timestamp, alpha, beta)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, history_rows)
+                self._write_posterior_states(conn, state_rows)
+            return ids
+        except Exception as e:
+            self.logger.error(f"Failed to save {len(records)} reconstructions: {e}")
+            return []
+    
+    def get_latest_reconstruction(self, work_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the most recent stored reconstruction of a work.
+        
+        Returns:
+            The results dict with an added 'confidence_history' list, or None
+        """
+        latest = self.get_latest_reconstructions([work_id])
+        return latest.get(work_id)
+    
+    def get_latest_reconstructions(self, work_ids: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the most recent stored reconstruction for each work.
+        
+        Args:
+            work_ids: Works to load (default: every reconstructed work)
+            
+        Returns:
+            Dictionary mapping work_id to its latest results dict, each with
+            an added 'confidence_history' list (alpha and beta are None for
+            rows stored without Beta parameters)
+        """
+        latest_sql = """
+            SELECT r.id, r.work_id, r.results
+            FROM reconstructions r
+            WHERE r.id = (SELECT MAX(id) FROM reconstructions WHERE work_id = r.work_id)
+        """
+        with self._connect() as conn:
+            if work_ids is None:
+                rows = conn.execute(latest_sql).fetchall()
+            else:
+                rows = []
+                work_ids = list(dict.fromkeys(work_ids))
+                for i in range(0, len(work_ids), self._IN_CHUNK_SIZE):
+                    chunk = work_ids[i:i + self._IN_CHUNK_SIZE]
+                    placeholders = ','.join('?' * len(chunk))
+                    rows.extend(conn.execute(
+                        latest_sql + f" AND r.work_id IN ({placeholders})", chunk
+                    ).fetchall())
+            
+            by_id = {}
+            for reconstruction_id, work_id, results_json in rows:
+                results = json.loads(results_json)
+                # JSON object keys are strings; restore numeric text positions
+                results['reconstruction'] = {
+                    (float(k) if '.' in k else int(k)): v
+                    for k, v in results.get('reconstruction', {}).items()
+                }
+                results['confidence_history'] = []
+                by_id[reconstruction_id] = results
+            
+            ids = list(by_id)
+            for i in range(0, len(ids), self._IN_CHUNK_SIZE):
+                chunk = ids[i:i + self._IN_CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                cursor = conn.execute(f"""
+                    SELECT reconstruction_id, prior, posterior_mean, evidence_count, timestamp, alpha, beta
+                    FROM confidence_history
+                    WHERE reconstruction_id IN ({placeholders})
+                    ORDER BY reconstruction_id, step
+                """, chunk)
+                for reconstruction_id, prior, posterior_mean, evidence_count, timestamp, alpha, beta in cursor:
+                    by_id[reconstruction_id]['confidence_history'].append({
+                        'prior': prior,
+                        'posterior_mean': posterior_mean,
+                        'evidence_count': evidence_count,
+                        'timestamp': timestamp,
+                        'alpha': alpha,
+                        'beta': beta
+                    })
+        
+        return {results['work_id']: results for results in by_id.values()}
+    
+    def get_posterior_state(self, work_id: str) -> Optional[Dict[str, Any]]:
+        """Get the stored Beta posterior state of a work, or None."""
+        with self._connect() as conn:
+            cursor = conn.execute("SELECT * FROM posterior_state WHERE work_id = ?", (work_id,))
+            cursor.row_factory = sqlite3.Row
+            row = cursor.fetchone()
+        return dict(row) if row else None
+    
+    def save_posterior_states(self, states: List[Dict[str, Any]]) -> int:
+        """
+        Store Beta posterior states, replacing any earlier state per work.
+        
+        Args:
+            states: State dicts as kept by BayesianReconstructor.posterior_states
+            
+        Returns:
+            Number of states written (0 on failure)
+        """
+        if not states:
+            return 0
+        try:
+            with self._connect() as conn:
+                self._write_posterior_states(conn, [self._posterior_state_row(s) for s in states])
+            return len(states)
+        except Exception as e:
+            self.logger.error(f"Failed to save {len(states)} posterior states: {e}")
+            return 0
+    
+    @staticmethod
+    def _posterior_state_row(state: Dict[str, Any]) -> Tuple:
+        last_updated = state.get('last_updated')
+        return (
+            state['work_id'],
+            _to_builtin(state.get('prior')),
+            _to_builtin(state['alpha']),
+            _to_builtin(state['beta']),
+            state.get('evidence_count', 0),
+            _to_builtin(state.get('weight_total', 0.0)),
+            str(last_updated) if last_updated is not None else None
+        )
+    
+    @staticmethod
+    def _write_posterior_states(conn: sqlite3.Connection, rows: List[Tuple]):
+        conn.executemany("""
+            INSERT OR REPLACE INTO posterior_state 
+            (work_id, prior, alpha, beta, evidence_count, weight_total, last_updated)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+    
+    def record_run_completions(self, completions: List[Tuple[str, str, str, float, int]]) -> int:
+        """
+        Append completed works to the run manifest.
+        
+        Args:
+            completions: (run_id, work_id, result_hash, confidence, fragments_used)
+                tuples; works already recorded for the run are left untouched
+            
+        Returns:
+            Number of completions submitted (0 on failure)
+        """
+        if not completions:
+            return 0
+        try:
+            with self._connect() as conn:
+                conn.executemany("""
+                    INSERT OR IGNORE INTO run_manifest 
+                    (run_id, work_id, result_hash, confidence, fragments_used)
+                    VALUES (?, ?, ?, ?, ?)
+                """, completions)
+            return len(completions)
+        except Exception as e:
+            self.logger.error(f"Failed to record {len(completions)} run completions: {e}")
+            return 0
+    
+    def get_run_manifest(self, run_id: str) -> pd.DataFrame:
+        """Get the works completed so far by a run, in completion order."""
+        with self._connect() as conn:
+            return pd.read_sql_query("""
+                SELECT work_id, result_hash, confidence, fragments_used, completed_at
+                FROM run_manifest
+                WHERE run_id = ?
+                ORDER BY rowid
+            """, conn, params=(run_id,))
+    
     def get_reconstruction_stats(self) -> Dict[str, Any]:
         """Get statistics about the corpus."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             stats = {}
             
             # Work counts
@@ -266,42 +890,324 @@ class FragmentDatabase:
             
             return stats
     
-    def bulk_insert_fragments(self, fragments: List[Dict[str, Any]]) -> int:
-        """Bulk insert fragments for performance."""
-        inserted = 0
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                for fragment in fragments:
-                    try:
-                        metadata = fragment.get('metadata', {})
-                        conn.execute("""
-                            INSERT OR REPLACE INTO fragments 
-                            (id, text, source, source_author, confidence, position, work_id, language, metadata)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
+    def bulk_insert_fragments(self, fragments: Iterable[Dict[str, Any]],
+                              chunk_size: int = 5000) -> int:
+        """
+        Bulk insert fragments and their citations for performance.
+        
+        Args:
+            fragments: Any iterable of fragment dictionaries; consumed lazily
+            chunk_size: Fragments written per transaction
+            
+        Returns:
+            Number of fragments inserted
+        """
+        return self._bulk_ingest(fragments, chunk_size)['fragments']
+    
+    def ingest_jsonl(self, filepath: str, chunk_size: int = 5000,
+                     track_new: bool = False) -> Dict[str, Any]:
+        """
+        Stream a JSONL fragment dump into the database in constant memory.
+        
+        Each line holds one fragment object in the same shape as the entries
+        of data/fragments/sample_fragments.json.
+        
+        Args:
+            filepath: Path to the JSONL file
+            chunk_size: Fragments written per transaction
+            track_new: Also return the ids of fragments that were not stored
+                before (re-ingested fragments are replaced, not new)
+            
+        Returns:
+            Ingest statistics (row counts, elapsed seconds, rows/sec, and
+            'new_ids' with track_new)
+        """
+        return self._bulk_ingest(iter_fragments_jsonl(filepath), chunk_size, track_new)
+    
+    def _existing_fragment_ids(self, conn: sqlite3.Connection, ids: List[str]) -> Set[str]:
+        """Which of the ids are already stored, queried in chunks below SQLite's variable limit."""
+        existing = set()
+        for i in range(0, len(ids), self._IN_CHUNK_SIZE):
+            chunk = ids[i:i + self._IN_CHUNK_SIZE]
+            placeholders = ','.join('?' * len(chunk))
+            rows = conn.execute(f"SELECT id FROM fragments WHERE id IN ({placeholders})", chunk).fetchall()
+            existing.update(row[0] for row in rows)
+        return existing
+    
+    def _bulk_ingest(self, fragments: Iterable[Dict[str, Any]], chunk_size: int,
+                     track_new: bool = False) -> Dict[str, Any]:
+        """Write fragments and citations with executemany, one transaction per chunk."""
+        stats = {'fragments': 0, 'citations': 0, 'skipped': 0}
+        new_ids: Set[str] = set()
+        start_time = time.time()
+        iterator = iter(fragments)
+        
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            
+            fragment_rows = []
+            citation_rows = []
+            for fragment in chunk:
+                fragment_id = fragment.get('id') if isinstance(fragment, dict) else None
+                try:
+                    if not isinstance(fragment, dict):
+                        raise TypeError(f"expected a fragment object, got {type(fragment).__name__}")
+                    metadata = fragment.get('metadata', {})
+                    row = (
+                        fragment['id'],
+                        fragment['text'],
+                        fragment.get('source'),
+                        fragment.get('source_author'),
+                        fragment.get('confidence'),
+                        fragment.get('position'),
+                        fragment.get('work_id'),
+                        fragment.get('language', 'greek'),
+                        json.dumps(metadata) if metadata else None
+                    )
+                    # A fragment and its citations are kept or skipped together
+                    citations = [
+                        (
                             fragment['id'],
-                            fragment['text'],
-                            fragment.get('source'),
-                            fragment.get('source_author'),
-                            fragment.get('confidence'),
-                            fragment.get('position'),
-                            fragment.get('work_id'),
-                            fragment.get('language', 'greek'),
-                            json.dumps(metadata) if metadata else None
-                        ))
-                        inserted += 1
-                    except Exception as e:
-                        self.logger.warning(f"Failed to insert fragment {fragment.get('id')}: {e}")
-                conn.commit()
-        except Exception as e:
-            self.logger.error(f"Bulk insert failed: {e}")
+                            citation.get('cited_author'),
+                            citation.get('cited_work'),
+                            citation.get('pattern'),
+                            citation.get('confidence')
+                        )
+                        for citation in fragment.get('citations') or []
+                    ]
+                except (AttributeError, KeyError, TypeError, ValueError) as e:
+                    stats['skipped'] += 1
+                    self.logger.warning(f"Failed to insert fragment {fragment_id!r}: {e}")
+                    continue
+                
+                fragment_rows.append(row)
+                citation_rows.extend(citations)
+            
+            try:
+                with self._connect() as conn:
+                    if track_new:
+                        ids = [row[0] for row in fragment_rows]
+                        chunk_new = set(ids) - self._existing_fragment_ids(conn, ids)
+                    # Replaced fragments drop their old citations
+                    conn.executemany("DELETE FROM citations WHERE fragment_id = ?",
+                                     [(row[0],) for row in fragment_rows])
+                    conn.executemany("""
+                        INSERT OR REPLACE INTO fragments 
+                        (id, text, source, source_author, confidence, position, work_id, language, metadata)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, fragment_rows)
+                    conn.executemany("""
+                        INSERT INTO citations 
+                        (fragment_id, cited_author, cited_work, pattern, confidence)
+                        VALUES (?, ?, ?, ?, ?)
+                    """, citation_rows)
+            except sqlite3.Error as e:
+                stats['skipped'] += len(fragment_rows)
+                self.logger.error(f"Bulk insert of {len(fragment_rows)} fragments failed: {e}")
+                continue
+            
+            stats['fragments'] += len(fragment_rows)
+            stats['citations'] += len(citation_rows)
+            if track_new:
+                new_ids |= chunk_new
+        
+        if track_new:
+            stats['new_ids'] = new_ids
+        elapsed = time.time() - start_time
+        rows = stats['fragments'] + stats['citations']
+        stats['elapsed'] = elapsed
+        stats['rows_per_sec'] = rows / elapsed if elapsed > 0 else float(rows)
         
-        return inserted
+        self.logger.info(
+            f"Bulk ingest: {stats['fragments']} fragments, {stats['citations']} citations "
+            f"in {elapsed:.2f}s ({stats['rows_per_sec']:.0f} rows/sec, {stats['skipped']} skipped)"
+        )
+        return stats
     
     def export_to_dataframe(self) -> pd.DataFrame:
         """Export all works to DataFrame for analysis."""
         return self.get_works_by_priority(limit=10000)  # Large number to get all
 
 
-# Global database instance
-db = FragmentDatabase()
\ No newline at end of file
+class WriteBehindQueue:
+    """
+    Single writer thread that batches confidence updates, reconstruction results
+    and run-manifest entries.
+    
+    Producers (e.g. the parent of a process pool collecting worker results)
+    enqueue writes without touching SQLite. The writer thread commits them
+    in batched transactions whenever max_batch writes are pending or
+    flush_interval seconds have passed, and drains the queue on close().
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, database: FragmentDatabase, flush_interval: float = 1.0, max_batch: int = 500):
+        self.database = database
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.logger = logging.getLogger(__name__)
+        self.written = 0
+        self.reconstructions_written = 0
+        self.completions_written = 0
+        self.failed_works: Set[str] = set()  # works with a failed write; never marked complete
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> 'WriteBehindQueue':
+        """Start the writer thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='callimachina-db-writer', daemon=True)
+            self._thread.start()
+        return self
+    
+    def update_work_confidence(self, work_id: str, confidence: float):
+        """Queue a confidence update; returns immediately."""
+        self._queue.put(('confidence', (work_id, float(confidence))))
+    
+    def save_reconstruction(self, results: Dict[str, Any], confidence_history: List[Dict[str, Any]]):
+        """Queue a reconstruction result and its confidence history; returns immediately."""
+        self._queue.put(('reconstruction', (results, confidence_history)))
+    
+    def record_completion(self, run_id: str, work_id: str, result_hash: str,
+                          confidence: float, fragments_used: int):
+        """Queue a run-manifest entry; written after the work's results."""
+        self._queue.put(('manifest', (run_id, work_id, result_hash, float(confidence), fragments_used)))
+    
+    def flush(self):
+        """Block until every update queued so far has been committed."""
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+    
+    def close(self):
+        """Commit outstanding updates and stop the writer thread."""
+        if self._thread is None:
+            return
+        self._queue.put(self._STOP)
+        self._thread.join()
+        self._thread = None
+    
+    def __enter__(self) -> 'WriteBehindQueue':
+        return self.start()
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _run(self):
+        pending: Dict[str, list] = {'confidence': [], 'reconstruction': [], 'manifest': []}
+        deadline = time.monotonic() + self.flush_interval
+        
+        while True:
+            try:
+                item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                item = None
+            
+            if isinstance(item, tuple):
+                kind, payload = item
+                pending[kind].append(payload)
+                n_pending = sum(len(items) for items in pending.values())
+                if n_pending < self.max_batch and time.monotonic() < deadline:
+                    continue
+            
+            # Batch full, interval elapsed, flush requested or stopping
+            saved = self.database.save_reconstructions(pending['reconstruction'])
+            self.reconstructions_written += len(saved)
+            if len(saved) < len(pending['reconstruction']):
+                self.failed_works.update(results['work_id'] for results, _ in pending['reconstruction'])
+            updated = self.database.update_work_confidences(pending['confidence'])
+            self.written += updated
+            if updated < len(pending['confidence']):
+                self.failed_works.update(work_id for work_id, _ in pending['confidence'])
+            
+            # Manifest last, and only for works whose writes succeeded: a crash
+            # or failed write only causes a redo, never a skip
+            completions = [entry for entry in pending['manifest'] if entry[1] not in self.failed_works]
+            if len(completions) < len(pending['manifest']):
+                self.logger.warning(f"Not recording {len(pending['manifest']) - len(completions)} "
+                                    f"completions whose results were not stored")
+            self.completions_written += self.database.record_run_completions(completions)
+            pending = {'confidence': [], 'reconstruction': [], 'manifest': []}
+            deadline = time.monotonic() + self.flush_interval
+            
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is self._STOP:
+                break
+
+
+def _to_builtin(obj: Any) -> Any:
+    """JSON fallback for numpy scalars/arrays and other non-native values."""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    if hasattr(obj, 'item'):
+        return obj.item()
+    if obj is None or isinstance(obj, (str, int, float, bool, list, dict)):
+        return obj
+    return str(obj)
+
+
+def iter_fragments_jsonl(filepath: str) -> Iterator[Dict[str, Any]]:
+    """Yield fragment dictionaries from a JSONL file, one line at a time."""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+DEFAULT_DB_PATH = "callimachina_corpus.db"
+DB_PATH_ENV_VAR = "CALLIMACHINA_DB"
+
+_database: Optional[FragmentDatabase] = None
+_database_path: Optional[str] = None
+_database_lock = threading.Lock()
+
+
+def configure_database(db_path: str):
+    """
+    Set the path of the shared database (e.g. from a CLI flag).
+    
+    Takes precedence over the CALLIMACHINA_DB environment variable. An already
+    opened shared instance for a different path is closed.
+    """
+    global _database, _database_path
+    with _database_lock:
+        if _database is not None and _database.db_path != Path(db_path):
+            _database.close()
+            _database = None
+        _database_path = db_path
+
+
+def get_database() -> FragmentDatabase:
+    """
+    Return the shared FragmentDatabase, opening it on first use.
+    
+    The path comes from configure_database(), else $CALLIMACHINA_DB, else
+    callimachina_corpus.db in the working directory.
+    """
+    global _database
+    if _database is None:
+        with _database_lock:
+            if _database is None:
+                path = _database_path or os.environ.get(DB_PATH_ENV_VAR) or DEFAULT_DB_PATH
+                _database = FragmentDatabase(path)
+    return _database
+
+
+class _LazyDatabase:
+    """Module-level stand-in that defers opening the database until first use."""
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_database(), name)
+    
+    def __repr__(self) -> str:
+        state = repr(_database) if _database is not None else 'not yet opened'
+        return f"<lazy FragmentDatabase: {state}>"
+
+
+# Global database instance (opened lazily, see get_database)
+db = _LazyDatabase()
\ No newline at end of file
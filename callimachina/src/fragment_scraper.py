@@ -20,16 +20,18 @@ from collections import defaultdict
 
 
 class FragmentScraper:
-    def __init__(self, rate_limit: float = 1.0, timeout: int = 30):
+    def __init__(self, rate_limit: float = 1.0, timeout: int = 30, database: Optional[Any] = None):
         """
         Initialize the fragment scraper.
         
         Args:
             rate_limit: Seconds to wait between requests (default: 1.0)
             timeout: Request timeout in seconds (default: 30)
+            database: Optional FragmentDatabase backing the 'corpus' search source
         """
         self.rate_limit = rate_limit
         self.timeout = timeout
+        self.database = database
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'CALLIMACHINA v3.0 (Digital Archaeology Project)'
@@ -427,7 +429,8 @@ class FragmentScraper:
         
         Args:
             queries: List of search queries
-            source: Source database to search
+            source: Source database to search ('papyri_info', 'oxyrhynchus',
+                or 'corpus' for the local full-text index)
             
         Returns:
             Dictionary mapping queries to fragment lists
@@ -442,6 +445,9 @@ class FragmentScraper:
                 fragments = self.get_oxyrhynchus_fragments()
                 # Filter by query
                 fragments = [f for f in fragments if query.lower() in f.get('text', '').lower()]
+            elif source == 'corpus' and self.database is not None:
+                # Indexed lookup against locally stored fragments
+                fragments = self.database.search_text(query)
             else:
                 fragments = []
             
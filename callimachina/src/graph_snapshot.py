@@ -0,0 +1,270 @@
+"""
+GraphSnapshot: Binary, memory-mappable citation-graph format.
+
+One file holds everything an analytics worker needs to open a citation
+graph without parsing or rebuilding it:
+- an interned UTF-8 string table (author names, node types)
+- a node table (name, type, fragment count, confidence)
+- CSR edge arrays (row = citing author) and edge weights
+
+Every section is a little-endian array at an 8-byte aligned offset, so
+opening a snapshot maps the file and wraps the sections as NumPy views;
+nothing is copied or decoded until it is read. Edge citation lists are
+not stored; export GraphML or JSON to keep them.
+
+Layout (offsets follow from the header):
+    header          64 bytes: magic, version, index width, counts
+    string offsets  uint64[n_strings + 1]
+    string bytes    uint8[string_bytes]
+    nodes           NODE_DTYPE[n_nodes]
+    indptr          int32/int64[n_nodes + 1]
+    indices         int32/int64[n_edges]
+    weights         float64[n_edges]
+"""
+
+import json
+import struct
+from pathlib import Path
+from typing import Any, Dict, Hashable, Iterator, List, Sequence, Tuple, Union
+
+import networkx as nx
+import numpy as np
+from scipy import sparse
+
+try:
+    from .sparse_graph import SparseGraph
+except ImportError:  # loaded from src/ on sys.path (CLI, scripts, tests)
+    from sparse_graph import SparseGraph
+
+
+MAGIC = b'CALLSNAP'
+VERSION = 2
+HEADER = struct.Struct('<8sII4Q')
+HEADER_SIZE = 64
+
+# Confidence is kept at full precision so snapshots round-trip exactly;
+# align pads each 24-byte record so the float64 field stays aligned
+NODE_DTYPE = np.dtype([
+    ('name', '<u4'),
+    ('type', '<u4'),
+    ('fragments', '<i4'),
+    ('confidence', '<f8'),
+], align=True)
+
+
+def _aligned(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+class StringTable(Sequence):
+    """Interned strings, decoded on access."""
+
+    def __init__(self, offsets: np.ndarray, data: np.ndarray):
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return self.data[start:end].tobytes().decode('utf-8')
+
+    def __iter__(self) -> Iterator[str]:
+        data = self.data.tobytes()
+        offsets = self.offsets.tolist()
+        for start, end in zip(offsets, offsets[1:]):
+            yield data[start:end].decode('utf-8')
+
+
+class StringColumn(Sequence):
+    """A column of string ids read through a StringTable."""
+
+    def __init__(self, strings: StringTable, ids: np.ndarray):
+        self.strings = strings
+        self.ids = ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, i: int) -> str:
+        return self.strings[self.ids[i]]
+
+    def __iter__(self) -> Iterator[str]:
+        strings = list(self.strings)
+        return (strings[i] for i in self.ids.tolist())
+
+
+class _Interner:
+    """Assigns each distinct string an id in first-seen order."""
+
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+
+    def __call__(self, value: Any) -> int:
+        value = str(value)
+        if value not in self.ids:
+            self.ids[value] = len(self.ids)
+        return self.ids[value]
+
+    def encode(self) -> Tuple[np.ndarray, bytes]:
+        encoded = [value.encode('utf-8') for value in self.ids]
+        offsets = np.zeros(len(encoded) + 1, dtype='<u8')
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        return offsets, b''.join(encoded)
+
+
+def _write(path: Union[str, Path], interner: _Interner, nodes: np.ndarray, matrix: sparse.csr_matrix):
+    """Write the sections of a snapshot."""
+    matrix.sum_duplicates()
+    matrix.sort_indices()
+    index_dtype = np.dtype('<i4') if max(matrix.nnz, len(nodes)) < 2**31 else np.dtype('<i8')
+    offsets, data = interner.encode()
+
+    with open(path, 'wb') as f:
+        header = HEADER.pack(MAGIC, VERSION, index_dtype.itemsize, len(nodes), matrix.nnz,
+                             len(offsets) - 1, len(data))
+        f.write(header.ljust(HEADER_SIZE, b'\0'))
+        sections = [
+            offsets,
+            np.frombuffer(data, dtype=np.uint8),
+            nodes,
+            matrix.indptr.astype(index_dtype),
+            matrix.indices.astype(index_dtype),
+            matrix.data.astype('<f8'),
+        ]
+        for section in sections:
+            f.write(b'\0' * (_aligned(f.tell()) - f.tell()))
+            f.write(np.ascontiguousarray(section).tobytes())
+
+
+def write_snapshot(graph: nx.DiGraph, path: Union[str, Path], weight: str = 'weight'):
+    """
+    Write a citation graph as a snapshot.
+
+    Node names are stored as strings; missing node attributes default to
+    type 'author', 0 fragments and confidence 0.5, as in CitationNetwork.
+
+    Args:
+        graph: Citation graph
+        path: Output file path
+        weight: Edge attribute holding the weight (1 when missing)
+    """
+    snapshot = SparseGraph.from_networkx(graph, weight=weight)
+    interner = _Interner()
+    nodes = np.empty(len(snapshot), dtype=NODE_DTYPE)
+    for i, (node, data) in enumerate(graph.nodes(data=True)):
+        nodes[i] = (interner(node), interner(data.get('type', 'author')),
+                    data.get('fragments', 0), data.get('confidence', 0.5))
+    _write(path, interner, nodes, snapshot.matrix)
+
+
+def convert_node_link(json_path: Union[str, Path], path: Union[str, Path], weight: str = 'weight'):
+    """
+    Convert a node-link JSON export (e.g. data/networks/citation_network.json) to a snapshot.
+
+    The arrays are filled straight from the parsed JSON, without building
+    a NetworkX graph. Both the 'links' and 'edges' keys are accepted.
+    """
+    with open(json_path) as f:
+        data = json.load(f)
+
+    interner = _Interner()
+    records = data.get('nodes', [])
+    nodes = np.empty(len(records), dtype=NODE_DTYPE)
+    index: Dict[Hashable, int] = {}
+    for i, record in enumerate(records):
+        index[record['id']] = i
+        nodes[i] = (interner(record['id']), interner(record.get('type', 'author')),
+                    record.get('fragments', 0), record.get('confidence', 0.5))
+
+    links = data.get('links', data.get('edges', []))
+    rows = np.fromiter((index[link['source']] for link in links), dtype=np.int64, count=len(links))
+    cols = np.fromiter((index[link['target']] for link in links), dtype=np.int64, count=len(links))
+    weights = np.fromiter((link.get(weight, 1) for link in links), dtype=np.float64, count=len(links))
+    matrix = sparse.csr_matrix((weights, (rows, cols)), shape=(len(nodes), len(nodes)))
+    _write(path, interner, nodes, matrix)
+
+
+class GraphSnapshot:
+    """A snapshot opened for reading; sections are views of the mapped file."""
+
+    def __init__(self, path: Union[str, Path], mmap: bool = True):
+        """
+        Open a snapshot.
+
+        Args:
+            path: Snapshot file
+            mmap: Map the file read-only (default) instead of reading it into memory
+
+        Raises:
+            ValueError: Not a snapshot, or a version this code cannot read
+        """
+        self.path = Path(path)
+        if mmap:
+            buffer = np.memmap(self.path, dtype=np.uint8, mode='r')
+        else:
+            buffer = np.fromfile(self.path, dtype=np.uint8)
+        if len(buffer) < HEADER_SIZE:
+            raise ValueError(f"{self.path} is not a graph snapshot")
+        magic, version, index_width, n_nodes, n_edges, n_strings, string_bytes = \
+            HEADER.unpack_from(buffer[:HEADER.size].tobytes())
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a graph snapshot")
+        if version != VERSION:
+            raise ValueError(f"Unsupported snapshot version {version} in {self.path}")
+        index_dtype = np.dtype(f'<i{index_width}')
+
+        offset = HEADER_SIZE
+        sections: List[np.ndarray] = []
+        for dtype, count in [(np.dtype('<u8'), n_strings + 1),
+                             (np.dtype(np.uint8), string_bytes),
+                             (NODE_DTYPE, n_nodes),
+                             (index_dtype, n_nodes + 1),
+                             (index_dtype, n_edges),
+                             (np.dtype('<f8'), n_edges)]:
+            offset = _aligned(offset)
+            sections.append(np.ndarray((count,), dtype=dtype, buffer=buffer, offset=offset))
+            offset += dtype.itemsize * count
+        string_offsets, string_data, self.node_table, self.indptr, self.indices, self.weights = sections
+
+        self.strings = StringTable(string_offsets, string_data)
+        self.nodes = StringColumn(self.strings, self.node_table['name'])
+        self.types = StringColumn(self.strings, self.node_table['type'])
+
+    def __len__(self) -> int:
+        return len(self.node_table)
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.indices)
+
+    def node_attributes(self, i: int) -> Dict[str, Any]:
+        """Attributes of node i, as CitationNetwork stores them."""
+        record = self.node_table[i]
+        return {
+            'type': self.strings[record['type']],
+            'fragments': int(record['fragments']),
+            'confidence': float(record['confidence']),
+        }
+
+    def matrix(self) -> sparse.csr_matrix:
+        """Weighted CSR adjacency sharing memory with the file."""
+        n = len(self)
+        return sparse.csr_matrix((self.weights, self.indices, self.indptr), shape=(n, n), copy=False)
+
+    def sparse_graph(self) -> SparseGraph:
+        """SparseGraph over the mapped arrays, for centralities without a rebuild."""
+        return SparseGraph(self.nodes, self.matrix())
+
+    def to_networkx(self) -> nx.DiGraph:
+        """Materialize a NetworkX graph (weights only; no edge citation lists)."""
+        graph = nx.DiGraph()
+        names = list(self.nodes)
+        graph.add_nodes_from((names[i], self.node_attributes(i)) for i in range(len(names)))
+        rows = np.repeat(np.arange(len(names)), np.diff(self.indptr))
+        graph.add_edges_from(
+            (names[u], names[v], {'weight': w})
+            for u, v, w in zip(rows.tolist(), self.indices.tolist(), self.weights.tolist())
+        )
+        return graph
@@ -0,0 +1,208 @@
+"""
+ReachabilityIndex: Transitive-closure index over the citation graph.
+
+Answers transmission questions without walking the graph:
+- has_path(a, b): does a reach b through citations (a cites ... cites b)
+- paths_via(*languages): authors transmitted through authors of those languages
+- neighborhood(node, k): authors within k citation hops
+
+Strongly connected components are collapsed and every component keeps a
+bitset row (a Python int) of the components it reaches, so a path query is
+one bit test. New edges and nodes update the rows in place; an edge that
+closes a cycle merges the components on it.
+"""
+
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import networkx as nx
+import numpy as np
+
+
+class ReachabilityIndex:
+    """Bitset transitive closure of a directed graph, with language tags."""
+
+    def __init__(self, graph: nx.DiGraph, languages: Optional[Dict[Hashable, Iterable[str]]] = None):
+        """
+        Build the index.
+
+        Args:
+            graph: Citation graph (edge = citing author -> cited author); kept
+                by reference for neighborhood queries
+            languages: Languages attested for each author
+        """
+        self.graph = graph
+        self.tags: Dict[str, Set[Hashable]] = defaultdict(set)
+        for node, node_languages in (languages or {}).items():
+            for language in node_languages:
+                self.tags[language].add(node)
+        self.rebuild()
+
+    def rebuild(self):
+        """Recompute the closure from the graph."""
+        condensed = nx.condensation(self.graph)
+        order = list(nx.topological_sort(condensed))
+        position = {component: i for i, component in enumerate(order)}
+
+        self.component: Dict[Hashable, int] = {
+            node: position[component] for node, component in condensed.graph['mapping'].items()
+        }
+        self.rows: List[int] = [0] * len(order)
+        for component in reversed(order):
+            row = 1 << position[component]
+            for successor in condensed.successors(component):
+                row |= self.rows[position[successor]]
+            self.rows[position[component]] = row
+        self.members: List[List[Hashable]] = [list(condensed.nodes[component]['members']) for component in order]
+        self._via_cache: Dict[Tuple[str, ...], Set[Hashable]] = {}
+
+    def __len__(self) -> int:
+        return len(self.component)
+
+    def add_node(self, node: Hashable):
+        """Register a new, unconnected node."""
+        if node in self.component:
+            return
+        self.component[node] = len(self.rows)
+        self.rows.append(1 << len(self.rows))
+        self.members.append([node])
+        self._via_cache.clear()
+
+    def add_edge(self, u: Hashable, v: Hashable):
+        """Update the closure for a new edge u -> v (already added to the graph)."""
+        self.add_node(u)
+        self.add_node(v)
+        cu, cv = self.component[u], self.component[v]
+        if (self.rows[cu] >> cv) & 1:
+            return
+
+        if (self.rows[cv] >> cu) & 1:
+            # The edge closes a cycle: merge every component on it into u's
+            cycle = [c for c in self._components(self.rows[cv]) if (self.rows[c] >> cu) & 1]
+            reached = 0
+            for c in cycle:
+                reached |= self.rows[c]
+            for c in cycle:
+                self.rows[c] = reached
+                if c != cu:
+                    for node in self.members[c]:
+                        self.component[node] = cu
+                    self.members[cu].extend(self.members[c])
+                    self.members[c] = []
+            updated = set(cycle)
+        else:
+            reached = self.rows[cv]
+            self.rows[cu] |= reached
+            updated = {cu}
+
+        # Everything that reaches u now reaches all that v reaches. Walk back
+        # from u; components that already reached v (and so their ancestors)
+        # need nothing.
+        seen = {u}
+        stack = [u]
+        while stack:
+            for pred in self.graph.pred[stack.pop()]:
+                if pred in seen:
+                    continue
+                seen.add(pred)
+                c = self.component[pred]
+                if c not in updated:
+                    if (self.rows[c] >> cv) & 1:
+                        continue
+                    self.rows[c] |= reached
+                    updated.add(c)
+                stack.append(pred)
+        self._via_cache.clear()
+
+    def tag(self, node: Hashable, language: str):
+        """Record that an author is attested in a language."""
+        if node not in self.tags[language]:
+            self.tags[language].add(node)
+            self._via_cache.clear()
+
+    def has_path(self, a: Hashable, b: Hashable) -> bool:
+        """Whether a reaches b through citations; every author reaches itself."""
+        if a not in self.component or b not in self.component:
+            return False
+        return bool((self.rows[self.component[a]] >> self.component[b]) & 1)
+
+    def _bits(self, nodes: Iterable[Hashable]) -> int:
+        """Union of the rows of the nodes' components."""
+        bits = 0
+        for node in nodes:
+            component = self.component.get(node)
+            if component is not None:
+                bits |= self.rows[component]
+        return bits
+
+    @staticmethod
+    def _components(bits: int) -> np.ndarray:
+        """Component ids set in a bitset."""
+        if not bits:
+            return np.empty(0, dtype=np.int64)
+        raw = np.frombuffer(bits.to_bytes((bits.bit_length() + 7) // 8, 'little'), dtype=np.uint8)
+        return np.flatnonzero(np.unpackbits(raw, bitorder='little'))
+
+    def _nodes(self, bits: int) -> Set[Hashable]:
+        """Members of the components set in a bitset."""
+        return {node for c in self._components(bits) for node in self.members[c]}
+
+    def reachable(self, node: Hashable) -> Set[Hashable]:
+        """Authors reached from node, including itself."""
+        return self._nodes(self._bits([node]))
+
+    def paths_via(self, *languages: str) -> Set[Hashable]:
+        """
+        Authors with a transmission route through authors of the given languages.
+
+        Languages are listed in transmission order, e.g.
+        paths_via('syriac', 'arabic', 'latin') holds the authors cited by a
+        Syriac author who is cited by an Arabic author who is cited by a
+        Latin one (each step directly or through intermediaries). Tagged
+        authors themselves are included.
+        """
+        if not languages:
+            raise ValueError("paths_via needs at least one language")
+        if languages not in self._via_cache:
+            # Walk back from the latest language to the earliest
+            carriers = set(self.tags.get(languages[-1], ()))
+            for language in reversed(languages[:-1]):
+                reached = self._nodes(self._bits(carriers))
+                carriers = reached & self.tags.get(language, set())
+            self._via_cache[languages] = self._nodes(self._bits(carriers))
+        return self._via_cache[languages]
+
+    def paths_via_any(self, *languages: str) -> Set[Hashable]:
+        """Authors transmitted through an author of at least one of the languages."""
+        key = ('any',) + languages
+        if key not in self._via_cache:
+            carriers = set().union(*(self.tags.get(language, ()) for language in languages))
+            self._via_cache[key] = self._nodes(self._bits(carriers))
+        return self._via_cache[key]
+
+    def neighborhood(self, node: Hashable, k: int, reverse: bool = False) -> Set[Hashable]:
+        """
+        Authors within k citation hops of node, excluding node.
+
+        Args:
+            node: Starting author
+            k: Maximum number of hops
+            reverse: Follow citations backwards (who cites node) instead of forwards
+        """
+        if node not in self.graph:
+            return set()
+        adjacency = self.graph.pred if reverse else self.graph.succ
+        seen = {node}
+        frontier = [node]
+        for _ in range(k):
+            next_frontier = []
+            for current in frontier:
+                for nbr in adjacency[current]:
+                    if nbr not in seen:
+                        seen.add(nbr)
+                        next_frontier.append(nbr)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        seen.discard(node)
+        return seen
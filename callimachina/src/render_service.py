@@ -0,0 +1,293 @@
+"""
+RenderService: Headless figure rendering for CALLIMACHINA.
+
+Draws confidence-evolution plots, citation network images and stylometric
+signature plots on standalone Agg figures:
+- No pyplot global state, so rendering is safe from worker processes
+- Matplotlib is imported here only, and only when a figure is drawn
+- Whole excavation runs render as one batch step in a process pool
+"""
+
+import logging
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _new_figure(figsize: Tuple[float, float]):
+    """Create a Figure bound to the Agg canvas, outside pyplot."""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    figure = Figure(figsize=figsize)
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def _finish(figure, save_path: Optional[str], dpi: int):
+    """
+    Save a figure and release it, or hand it back when there is no path.
+
+    Figures are created outside pyplot, so there is nothing to plt.close;
+    clearing drops the axes and artists even if a caller keeps a reference.
+    """
+    if save_path is None:
+        return figure
+    Path(save_path).parent.mkdir(parents=True, exist_ok=True)
+    figure.savefig(save_path, dpi=dpi, bbox_inches='tight')
+    figure.clear()
+    return save_path
+
+
+def render_confidence_plot(history: List[Dict[str, Any]], work_id: str,
+                           save_path: Optional[str] = None, dpi: int = 300):
+    """
+    Plot the evolution of a work's confidence.
+
+    Args:
+        history: Confidence history rows (prior, posterior_mean,
+            evidence_count and, when known, alpha and beta)
+        work_id: Work identifier, used in the title
+        save_path: PNG path; the Figure is returned instead when omitted
+        dpi: Output resolution
+
+    Returns:
+        save_path, or the Figure
+    """
+    try:
+        from .bayesian_reconstructor import beta_credible_intervals
+    except ImportError:  # loaded from src/ on sys.path
+        from bayesian_reconstructor import beta_credible_intervals
+
+    df = pd.DataFrame(history)
+    figure = _new_figure((10, 6))
+    ax = figure.add_subplot()
+
+    # Plot prior vs posterior
+    ax.plot(df.index, df['prior'], 'b--', label='Prior Confidence', alpha=0.7)
+    ax.plot(df.index, df['posterior_mean'], 'r-', label='Posterior Confidence', linewidth=2)
+
+    # Add 95% credible intervals, shifted like the means by any bonus
+    if {'alpha', 'beta'} <= set(df.columns):
+        known = df.dropna(subset=['alpha', 'beta'])
+        if not known.empty:
+            alpha, beta = known['alpha'].to_numpy(), known['beta'].to_numpy()
+            ci_lower, _, ci_upper = beta_credible_intervals(alpha, beta)
+            shift = known['posterior_mean'].to_numpy() - alpha / (alpha + beta)
+            ax.fill_between(known.index, np.minimum(ci_lower + shift, 1), np.minimum(ci_upper + shift, 1),
+                            alpha=0.2, color='red', label='95% Credible Interval')
+
+    # Add evidence count as scatter plot
+    scatter = ax.scatter(df.index, df['posterior_mean'],
+                         s=df['evidence_count'] * 50,
+                         c=df['evidence_count'],
+                         cmap='viridis',
+                         alpha=0.6,
+                         label='Evidence Count')
+    figure.colorbar(scatter, ax=ax, label='Number of Evidence Pieces')
+
+    ax.set_xlabel('Update Iteration')
+    ax.set_ylabel('Confidence')
+    ax.set_title(f'Confidence Evolution for {work_id}')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    ax.set_ylim(0, 1)
+
+    return _finish(figure, save_path, dpi)
+
+
+def render_network(graph: Any, save_path: Optional[str] = None,
+                   figsize: Tuple[float, float] = (12, 8), dpi: int = 300,
+                   title: str = "Classical Text Citation Network"):
+    """
+    Draw a citation network with a spring layout.
+
+    Args:
+        graph: networkx graph whose nodes may carry 'fragments' and 'confidence'
+        save_path: PNG path; the Figure is returned instead when omitted
+        figsize: Figure size (width, height)
+        dpi: Output resolution
+        title: Figure title
+
+    Returns:
+        save_path, or the Figure
+    """
+    import networkx as nx
+    from matplotlib import colormaps
+    from matplotlib.cm import ScalarMappable
+
+    figure = _new_figure(figsize)
+    ax = figure.add_subplot()
+
+    # Use spring layout for better visualization
+    pos = nx.spring_layout(graph, k=1, iterations=50)
+
+    # Draw nodes
+    node_sizes = [graph.nodes[node].get('fragments', 1) * 50 + 20 for node in graph.nodes()]
+    node_colors = [graph.nodes[node].get('confidence', 0.5) for node in graph.nodes()]
+    nx.draw_networkx_nodes(graph, pos, ax=ax, node_size=node_sizes,
+                           node_color=node_colors, cmap=colormaps['viridis'],
+                           alpha=0.7)
+
+    # Draw edges
+    edge_weights = [graph[u][v].get('weight', 1) for u, v in graph.edges()]
+    nx.draw_networkx_edges(graph, pos, ax=ax, width=edge_weights, alpha=0.5,
+                           edge_color='gray')
+
+    # Draw labels
+    nx.draw_networkx_labels(graph, pos, ax=ax, font_size=8)
+
+    ax.set_title(title)
+    ax.axis('off')
+    figure.colorbar(ScalarMappable(cmap=colormaps['viridis']), ax=ax, label='Confidence Score')
+    figure.tight_layout()
+
+    return _finish(figure, save_path, dpi)
+
+
+def render_author_signatures(pca_result: np.ndarray, labels: Sequence[str],
+                             explained_variance: Sequence[float],
+                             save_path: Optional[str] = None, dpi: int = 300):
+    """
+    Plot author signatures projected onto two principal components.
+
+    Args:
+        pca_result: (n_authors, 2) projected signatures
+        labels: Author names, one per row
+        explained_variance: Variance ratio of the two components
+        save_path: PNG path; the Figure is returned instead when omitted
+        dpi: Output resolution
+
+    Returns:
+        save_path, or the Figure
+    """
+    figure = _new_figure((12, 8))
+    ax = figure.add_subplot()
+
+    # Plot author signatures
+    scatter = ax.scatter(pca_result[:, 0], pca_result[:, 1],
+                         c=range(len(labels)), cmap='tab10', s=100, alpha=0.7)
+
+    # Annotate points
+    for i, label in enumerate(labels):
+        ax.annotate(label, (pca_result[i, 0], pca_result[i, 1]),
+                    xytext=(5, 5), textcoords='offset points', fontsize=9)
+
+    ax.set_xlabel(f'First Principal Component ({explained_variance[0]:.1%} variance)')
+    ax.set_ylabel(f'Second Principal Component ({explained_variance[1]:.1%} variance)')
+    ax.set_title('Author Stylometric Signatures (PCA)')
+    ax.grid(True, alpha=0.3)
+
+    # Add colorbar
+    cbar = figure.colorbar(scatter, ax=ax)
+    cbar.set_label('Author')
+    figure.tight_layout()
+
+    return _finish(figure, save_path, dpi)
+
+
+def _render_confidence_task(task: Tuple[str, List[Dict[str, Any]], str, int]) -> str:
+    work_id, history, save_path, dpi = task
+    return render_confidence_plot(history, work_id, save_path, dpi)
+
+
+def _render_network_task(task: Tuple[Any, str, Tuple[float, float], int]) -> str:
+    graph, save_path, figsize, dpi = task
+    return render_network(graph, save_path, figsize, dpi)
+
+
+class RenderService:
+    """Render batches of figures to PNG files in a process pool."""
+
+    def __init__(self, max_workers: Optional[int] = None, dpi: int = 300):
+        """
+        Initialize the render service.
+
+        Args:
+            max_workers: Rendering processes (default: CPU count)
+            dpi: Output resolution
+        """
+        self.max_workers = max_workers or mp.cpu_count()
+        self.dpi = dpi
+        self.logger = logging.getLogger(__name__)
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _map(self, fn, tasks: List[Tuple]) -> List[str]:
+        if not tasks:
+            return []
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        chunksize = max(1, len(tasks) // (self.max_workers * 4))
+        return list(self._executor.map(fn, tasks, chunksize=chunksize))
+
+    def render_confidence_plots(self, histories: Dict[str, List[Dict[str, Any]]],
+                                output_dir: str) -> List[str]:
+        """
+        Render one confidence plot per work.
+
+        Args:
+            histories: Confidence history rows by work_id
+            output_dir: Directory for the {work_id}_confidence.png files
+
+        Returns:
+            Paths of the rendered files
+        """
+        output_path = Path(output_dir)
+        tasks = [
+            (work_id, history, str(output_path / f"{work_id}_confidence.png"), self.dpi)
+            for work_id, history in histories.items() if history
+        ]
+        paths = self._map(_render_confidence_task, tasks)
+        self.logger.info(f"Rendered {len(paths)} confidence plots to {output_dir}")
+        return paths
+
+    def render_works(self, work_ids: Optional[List[str]], output_dir: str, database: Any) -> List[str]:
+        """
+        Render confidence plots for stored reconstructions.
+
+        Args:
+            work_ids: Works to render (default: every reconstructed work)
+            output_dir: Output directory
+            database: FragmentDatabase holding the reconstructions
+
+        Returns:
+            Paths of the rendered files
+        """
+        latest = database.get_latest_reconstructions(work_ids)
+        return self.render_confidence_plots(
+            {work_id: results['confidence_history'] for work_id, results in latest.items()},
+            output_dir
+        )
+
+    def render_networks(self, graphs: Iterable[Tuple[Any, str]],
+                        figsize: Tuple[float, float] = (12, 8)) -> List[str]:
+        """
+        Render citation networks.
+
+        Args:
+            graphs: (graph, save_path) pairs
+            figsize: Figure size (width, height)
+
+        Returns:
+            Paths of the rendered files
+        """
+        tasks = [(graph, save_path, figsize, self.dpi) for graph, save_path in graphs]
+        paths = self._map(_render_network_task, tasks)
+        self.logger.info(f"Rendered {len(paths)} network images")
+        return paths
+
+    def close(self):
+        """Shut down the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> 'RenderService':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,87 @@
+"""
+Serialization: Shared numpy-aware JSON encoding for CALLIMACHINA output.
+
+Numpy scalars and arrays are encoded as they are met, so results need no
+conversion pass first:
+- dumps/dump: indented (default) or compact JSON
+- JSONLWriter: streams one compact record per line for batch outputs
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, IO, Iterable, Optional, Union
+
+import numpy as np
+
+
+def json_default(obj: Any) -> Any:
+    """Encode numpy values natively and anything else unknown as str."""
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return float(obj)
+    if isinstance(obj, np.bool_):
+        return bool(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
+
+def dumps(obj: Any, compact: bool = False, **kwargs) -> str:
+    """
+    Serialize to a JSON string.
+
+    Args:
+        obj: Object to serialize, possibly holding numpy values
+        compact: Emit no indentation or spaces (and use the C encoder)
+        **kwargs: Passed to json.dumps (e.g. sort_keys)
+    """
+    if compact:
+        return json.dumps(obj, default=json_default, separators=(',', ':'), **kwargs)
+    return json.dumps(obj, default=json_default, indent=2, **kwargs)
+
+
+def dump(obj: Any, fp: IO[str], compact: bool = False, **kwargs):
+    """Serialize to an open text file; encodes in one pass, then writes once."""
+    fp.write(dumps(obj, compact=compact, **kwargs))
+
+
+class JSONLWriter:
+    """Stream records to a JSON Lines file, one compact object per line."""
+
+    def __init__(self, path: Union[str, Path], append: bool = False):
+        """
+        Open a JSONL file for writing.
+
+        Args:
+            path: Output file; parent directories are created
+            append: Add to an existing file instead of replacing it
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: Optional[IO[str]] = open(self.path, 'a' if append else 'w', encoding='utf-8')
+        self.written = 0
+
+    def write(self, record: Dict[str, Any]):
+        """Append one record."""
+        self._file.write(dumps(record, compact=True))
+        self._file.write('\n')
+        self.written += 1
+
+    def write_many(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Append records from any iterable; returns how many were written."""
+        start = self.written
+        for record in records:
+            self.write(record)
+        return self.written - start
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'JSONLWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -24,8 +24,14 @@ import re
 import logging
 from typing import Dict, List, Tuple, Optional, Any
 from collections import Counter, defaultdict
-import matplotlib.pyplot as plt
-import seaborn as sns
+from pathlib import Path
+
+try:
+    from . import serialization
+    from .render_service import render_author_signatures
+except ImportError:  # loaded from src/ on sys.path (CLI, scripts, tests)
+    import serialization
+    from render_service import render_author_signatures
 
 # Download required NLTK data
 try:
@@ -620,41 +626,20 @@ class StylometricEngine:
             return
         
         # Convert to DataFrame for consistency
-        feature_names = [k.replace('_mean', '') for k in signature[0].keys() if k.endswith('_mean')]
+        feature_names = [k.replace('_mean', '') for k in signature.keys() if k.endswith('_mean')]
         df = pd.DataFrame(signature_data, columns=feature_names)
         
         # Perform PCA
         pca = PCA(n_components=2)
         pca_result = pca.fit_transform(df)
         
-        # Create visualization
-        plt.figure(figsize=(12, 8))
-        
-        # Plot author signatures
-        scatter = plt.scatter(pca_result[:, 0], pca_result[:, 1], 
-                            c=range(len(labels)), cmap='tab10', s=100, alpha=0.7)
-        
-        # Annotate points
-        for i, label in enumerate(labels):
-            plt.annotate(label, (pca_result[i, 0], pca_result[i, 1]), 
-                       xytext=(5, 5), textcoords='offset points', fontsize=9)
-        
-        plt.xlabel(f'First Principal Component ({pca.explained_variance_ratio_[0]:.1%} variance)')
-        plt.ylabel(f'Second Principal Component ({pca.explained_variance_ratio_[1]:.1%} variance)')
-        plt.title('Author Stylometric Signatures (PCA)')
-        plt.grid(True, alpha=0.3)
-        
-        # Add colorbar
-        cbar = plt.colorbar(scatter)
-        cbar.set_label('Author')
-        
-        plt.tight_layout()
+        # Create visualization (headless; returns the Figure without a path)
+        result = render_author_signatures(pca_result, labels, pca.explained_variance_ratio_, save_path)
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
             self.logger.info(f"Saved author signature visualization to {save_path}")
         
-        plt.show()
+        return result
     
     def export_profiles(self, output_dir: str):
         """
@@ -663,23 +648,11 @@ class StylometricEngine:
         Args:
             output_dir: Output directory path
         """
-        import json
-        
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
         for author, profile in self.author_profiles.items():
-            # Convert numpy types for JSON serialization
-            json_profile = {}
-            for key, value in profile.items():
-                if isinstance(value, np.ndarray):
-                    json_profile[key] = value.tolist()
-                elif isinstance(value, (np.integer, np.floating)):
-                    json_profile[key] = value.item()
-                else:
-                    json_profile[key] = value
-            
             with open(output_path / f"{author}_profile.json", 'w') as f:
-                json.dump(json_profile, f, indent=2, default=str)
+                serialization.dump(profile, f)
         
         self.logger.info(f"Exported {len(self.author_profiles)} author profiles to {output_dir}")
\ No newline at end of file
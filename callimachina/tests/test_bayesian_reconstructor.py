@@ -0,0 +1,260 @@
+"""
+Test suite for the CALLIMACHINA Bayesian reconstructor.
+
+Tests cover:
+1. Vectorized batch updates matching the scalar path
+2. Incremental evidence against persisted posterior state
+3. Exact Beta credible intervals with cached quantiles
+4. Precompiled author-century, genre and bonus tables
+5. Bounded per-work confidence history
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from scipy import stats
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+try:
+    import bayesian_reconstructor
+    from bayesian_reconstructor import BayesianReconstructor, ConfidenceHistory, beta_credible_intervals
+    from database import FragmentDatabase
+    IMPORT_SUCCESS = True
+except ImportError as e:
+    print(f"Import error: {e}")
+    IMPORT_SUCCESS = False
+
+
+class TestBayesianReconstructor(unittest.TestCase):
+    """Test suite for BayesianReconstructor."""
+
+    def setUp(self):
+        """Create a fresh reconstructor per test."""
+        if not IMPORT_SUCCESS:
+            raise unittest.SkipTest("Failed to import bayesian_reconstructor module")
+
+        self.reconstructor = BayesianReconstructor(random_seed=42)
+
+    def test_01_batch_update_matches_scalar(self):
+        """Test 1: update_confidence_batch reproduces update_confidence work by work."""
+        rng = np.random.default_rng(7)
+        types = ['fragment', 'citation', 'translation', 'stylistic', 'inscription']
+        citing_authors = ['Strabo', 'Plutarch', 'Athenaeus', 'Unknown', 'Lucian']
+
+        priors, evidence_by_work, weights_by_work, metadata = [], [], [], []
+        for i in range(60):
+            n = int(rng.integers(0, 6))
+            evidence_by_work.append([
+                {'type': types[rng.integers(len(types))],
+                 'confidence': float(rng.uniform()),
+                 'citing_author': citing_authors[rng.integers(len(citing_authors))]}
+                for _ in range(n)
+            ])
+            weights_by_work.append(rng.uniform(0.1, 2.0, n).tolist() if i % 2 else None)
+            priors.append(float(rng.uniform(0.2, 0.8)))
+            metadata.append({
+                'century': [-4, -1, 0, 2, 12][i % 5],
+                'arabic_translation': i % 3 == 0,
+                'latin_translation': i % 4 == 0,
+                'syriac_intermediary': i % 7 == 0,
+            })
+        metadata[5] = None
+
+        table = self.reconstructor.build_evidence_table(evidence_by_work, weights_by_work)
+        batch = self.reconstructor.update_confidence_batch(priors, table, metadata)
+        self.assertEqual(batch['evidence_count'].tolist(), [len(e) for e in evidence_by_work])
+
+        scalar = BayesianReconstructor(random_seed=42)
+        for i, evidence in enumerate(evidence_by_work):
+            expected = scalar.update_confidence(priors[i], evidence, weights_by_work[i], metadata[i])
+            for key in ('mean', 'std', 'ci_lower', 'ci_upper', 'median'):
+                self.assertAlmostEqual(batch[key][i], expected[key], places=12, msg=f"work {i} {key}")
+
+        # One history row per work, as with the scalar path
+        self.assertEqual(len(self.reconstructor.confidence_history), len(priors))
+        print(f"✓ Batch update matches scalar path for {len(priors)} works")
+
+        # Without metadata neither decay nor bonuses apply
+        plain = self.reconstructor.update_confidence_batch(priors, table)
+        expected = scalar.update_confidence(priors[1], evidence_by_work[1], weights_by_work[1])
+        self.assertAlmostEqual(plain['mean'][1], expected['mean'], places=12)
+
+        # Work ids may be given as an array, like the other inputs
+        work_ids = np.array([f'Work.{i}' for i in range(len(priors))])
+        keyed = self.reconstructor.update_confidence_batch(priors, table, work_ids=work_ids)
+        self.assertEqual(keyed['mean'].tolist(), plain['mean'].tolist())
+        self.assertEqual(len(self.reconstructor.confidence_history.rows('Work.0')), 1)
+
+    def test_02_add_evidence(self):
+        """Test 2: add_evidence continues a stored posterior exactly as a full rebuild would."""
+        metadata = {'author': 'Eratosthenes', 'genre': 'science', 'century': -3}
+        fragments = [
+            {'id': f'frag_{i}', 'text': 'x' * (40 * i + 30), 'confidence': 0.55 + 0.05 * i, 'position': i}
+            for i in range(1, 6)
+        ]
+        citations = [{'confidence': 0.7, 'pattern': 'as_says_in', 'citing_author': 'Strabo'}]
+
+        temp_dir = tempfile.mkdtemp()
+        database = FragmentDatabase(os.path.join(temp_dir, 'test_corpus.db'))
+        try:
+            # The first reconstruction is stored along with its posterior state
+            first = BayesianReconstructor(random_seed=42)
+            results = first.reconstruct_work('Eratosthenes.Geographika', fragments[:3], citations, metadata)
+            database.save_reconstructions([(results, first.confidence_history.rows('Eratosthenes.Geographika'))])
+            state = database.get_posterior_state('Eratosthenes.Geographika')
+            self.assertEqual(state['evidence_count'], 4)
+            self.assertAlmostEqual(state['alpha'], results['posterior_confidence']['alpha'])
+
+            # A fresh reconstructor picks the state up and adds two fragments, one at a time
+            incremental = BayesianReconstructor(random_seed=42, database=database)
+            for fragment in fragments[3:]:
+                evidence, weight = BayesianReconstructor.fragment_evidence(fragment)
+                posterior = incremental.add_evidence('Eratosthenes.Geographika', evidence, [weight])
+
+            full = BayesianReconstructor(random_seed=42).reconstruct_work(
+                'Eratosthenes.Geographika', fragments, citations, metadata
+            )['posterior_confidence']
+            for key in ('mean', 'std', 'alpha', 'beta'):
+                self.assertAlmostEqual(posterior[key], full[key], places=12)
+            self.assertEqual(posterior['evidence_count'], 6)
+
+            stored = database.get_posterior_state('Eratosthenes.Geographika')
+            self.assertEqual(stored['evidence_count'], 6)
+            self.assertAlmostEqual(stored['alpha'], full['alpha'])
+            print(f"✓ Incremental posterior matches full rebuild: {posterior['mean']:.3f}")
+
+            # A work without state starts from its initial prior
+            posterior = incremental.add_evidence('Unknown.Work', {'type': 'fragment', 'confidence': 0.9})
+            expected = BayesianReconstructor().update_confidence(
+                incremental._get_initial_prior({}), [{'type': 'fragment', 'confidence': 0.9}]
+            )
+            self.assertAlmostEqual(posterior['mean'], expected['mean'], places=12)
+        finally:
+            database.close()
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def test_03_beta_credible_intervals(self):
+        """Test 3: Intervals and medians are exact Beta quantiles, computed once per parameter pair."""
+        alpha = np.array([[6.5, 2.0, 6.5], [30.0, 1.2, 2.0]])
+        beta = np.array([[5.5, 9.0, 5.5], [3.0, 1.1, 9.0]])
+
+        bayesian_reconstructor._INTERVAL_CACHE.clear()
+        lower, median, upper = beta_credible_intervals(alpha, beta)
+        self.assertEqual(lower.shape, alpha.shape)
+        np.testing.assert_allclose(lower, stats.beta.ppf(0.025, alpha, beta))
+        np.testing.assert_allclose(median, stats.beta.median(alpha, beta))
+        np.testing.assert_allclose(upper, stats.beta.ppf(0.975, alpha, beta))
+
+        # Repeated pairs share one cache entry, and later calls hit it
+        self.assertEqual(len(bayesian_reconstructor._INTERVAL_CACHE), 4)
+        cached_lower, _, _ = beta_credible_intervals(2.0, 9.0)
+        self.assertEqual(float(cached_lower), lower[0, 1])
+        self.assertEqual(len(bayesian_reconstructor._INTERVAL_CACHE), 4)
+
+        narrow = beta_credible_intervals(alpha, beta, level=0.5)
+        self.assertTrue(np.all(narrow[0] > lower) and np.all(narrow[2] < upper))
+
+        # update_confidence reports the same exact interval
+        posterior = self.reconstructor.update_confidence(0.5, [{'type': 'fragment', 'confidence': 0.9}])
+        a, b = posterior['alpha'], posterior['beta']
+        self.assertAlmostEqual(posterior['ci_lower'], stats.beta.ppf(0.025, a, b))
+        self.assertAlmostEqual(posterior['ci_upper'], stats.beta.ppf(0.975, a, b))
+        self.assertAlmostEqual(posterior['median'], stats.beta.median(a, b))
+        self.assertLess(posterior['ci_lower'], posterior['median'])
+        self.assertLess(posterior['median'], posterior['ci_upper'])
+
+        # Bonuses shift the whole interval with the mean
+        boosted = self.reconstructor.update_confidence(0.5, [{'type': 'fragment', 'confidence': 0.9}],
+                                                       metadata={'latin_translation': True})
+        self.assertAlmostEqual(boosted['ci_lower'] - posterior['ci_lower'], 0.10)
+        self.assertAlmostEqual(boosted['mean'] - posterior['mean'], 0.10)
+        print(f"✓ Exact 95% interval: [{posterior['ci_lower']:.3f}, {posterior['ci_upper']:.3f}]")
+
+    def test_04_lookup_tables(self):
+        """Test 4: Table lookups keep the substring semantics and extend from the works table."""
+        estimate = self.reconstructor._estimate_author_century
+        self.assertEqual(estimate('Diogenes Laertius'), 3)
+        self.assertEqual(estimate('  PLINY the Elder '), 1)
+        self.assertEqual(estimate('Strabo'), -1)
+        self.assertIsNone(estimate('Unknown'))
+
+        prior = self.reconstructor._get_initial_prior
+        self.assertAlmostEqual(prior({'genre': 'Natural Philosophy', 'century': -4, 'author': 'Aristotle'}),
+                               0.6 * 0.8 * 1.2)
+        self.assertAlmostEqual(prior({'genre': 'epigram', 'century': 9}), 0.5 * 0.9)
+
+        # Every flag combination gets the documented bonus
+        bonus = self.reconstructor._apply_cross_cultural_bonus
+        self.assertAlmostEqual(bonus(0.5, {'arabic_translation': True}), 0.65)
+        self.assertAlmostEqual(bonus(0.5, {'latin_translation': True, 'syriac_intermediary': True}), 0.70)
+        self.assertAlmostEqual(bonus(0.5, {'arabic_translation': True, 'latin_translation': True,
+                                           'syriac_intermediary': True}), 0.75)
+        self.assertAlmostEqual(bonus(0.9, {'arabic_translation': True}), 1.0)
+
+        # Authors from the works table become known citing authors
+        temp_dir = tempfile.mkdtemp()
+        database = FragmentDatabase(os.path.join(temp_dir, 'test_corpus.db'))
+        try:
+            database.insert_work({'work_id': 'Hesychius.Lexicon', 'author': 'Hesychius', 'century': 5})
+            database.insert_work({'work_id': 'Strabo.Other', 'author': 'Strabo', 'century': 4})
+            self.assertIsNone(estimate('Hesychius of Alexandria'))
+
+            loaded = BayesianReconstructor(database=database)._estimate_author_century
+            self.assertEqual(loaded('Hesychius of Alexandria'), 5)
+            self.assertEqual(loaded('Strabo'), -1)  # Built-in centuries win
+            self.assertIsNone(estimate('Hesychius of Alexandria'))  # Other instances are unaffected
+        finally:
+            database.close()
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        # Registered names only match whole words
+        self.reconstructor.register_author_centuries({'Ion': -5, 'Ps': 3})
+        self.assertEqual(estimate('Ion of Chios'), -5)
+        for name in ('Dion Chrysostom', 'Marcion', 'Pseudo-Apollodorus'):
+            self.assertIsNone(estimate(name), name)
+        print("✓ Lookup tables consistent")
+
+    def test_05_confidence_history(self):
+        """Test 5: History is kept per work, capped, and saved one work at a time."""
+        history = ConfidenceHistory(max_entries=20)
+        for i in range(50):
+            history.record('Plato.Lost', 0.5, i / 100, i, alpha=float(i), beta=1.0)
+        history.record('Aristotle.Protrepticus', 0.6, 0.7, 3)
+
+        rows = history.rows('Plato.Lost')
+        self.assertEqual(len(rows), 20)
+        self.assertEqual([r['evidence_count'] for r in rows], list(range(30, 50)))
+        self.assertAlmostEqual(rows[-1]['posterior_mean'], 0.49)
+        self.assertEqual(len(history), 21)
+        self.assertTrue(np.isnan(history.rows('Aristotle.Protrepticus')[0]['alpha']))
+
+        history.clear('Plato.Lost')
+        self.assertEqual(history.works(), ['Aristotle.Protrepticus'])
+        self.assertEqual(history.rows('Plato.Lost'), [])
+
+        # A reused reconstructor writes only the saved work's history
+        reconstructor = BayesianReconstructor(random_seed=42, max_history=5)
+        fragments = [{'id': 'f1', 'text': 'Fragment text of some length', 'confidence': 0.8, 'position': 1}]
+        for _ in range(8):
+            reconstructor.reconstruct_work('Plato.Lost', fragments, [], {'genre': 'philosophy'})
+        results = reconstructor.reconstruct_work('Aristotle.Protrepticus', fragments, [], {'genre': 'philosophy'})
+        self.assertEqual(len(reconstructor.confidence_history.rows('Plato.Lost')), 5)
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            reconstructor.save_reconstruction(results, temp_dir)
+            with open(os.path.join(temp_dir, 'Aristotle.Protrepticus_confidence_history.csv')) as f:
+                self.assertEqual(len(f.readlines()), 2)  # header + one update
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        print("✓ Confidence history bounded per work")
+
+
+if __name__ == '__main__':
+    unittest.main()
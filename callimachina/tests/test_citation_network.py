@@ -0,0 +1,344 @@
+"""
+Test suite for the CALLIMACHINA citation network analyzer.
+
+Tests cover:
+1. Centralities cached per graph version
+2. Sampled, pooled node-impact estimation
+3. Native edge citation lists, encoded only at export
+4. Incremental add_fragments/remove_fragments
+5. Sparse CSR centrality backend
+6. Reachability index and transmission-path queries
+7. Binary, memory-mapped graph snapshots
+"""
+
+import unittest
+import sys
+import os
+import json
+import logging
+import shutil
+import tempfile
+
+import networkx as nx
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+try:
+    from citation_network import CitationNetwork, VersionedDiGraph
+    from sparse_graph import SparseGraph
+    from reachability import ReachabilityIndex
+    from graph_snapshot import GraphSnapshot, convert_node_link
+    IMPORT_SUCCESS = True
+except ImportError as e:
+    print(f"Import error: {e}")
+    IMPORT_SUCCESS = False
+
+
+def _fragment(source, *cited):
+    return {
+        'source_author': source,
+        'citations': [{'cited_author': author, 'confidence': 0.6} for author in cited],
+    }
+
+
+class TestCitationNetwork(unittest.TestCase):
+    """Test suite for CitationNetwork."""
+
+    def setUp(self):
+        """Build a small network with one citation gap."""
+        if not IMPORT_SUCCESS:
+            raise unittest.SkipTest("Failed to import citation_network module")
+
+        logging.disable(logging.CRITICAL)
+        self.fragments = [
+            _fragment('Strabo', 'Eratosthenes', 'Hipparchus'),
+            _fragment('Plutarch', 'Eratosthenes', 'Strabo'),
+            _fragment('Athenaeus', 'Eratosthenes', 'Plutarch'),
+            _fragment('Galen', 'Hipparchus', 'Athenaeus'),
+        ]
+        self.network = CitationNetwork()
+        self.network.build_network(self.fragments)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_01_centrality_cache(self):
+        """Test 1: Centralities are computed once per graph version and shared."""
+        network = self.network
+        first = network.centralities()
+        self.assertIs(network.centralities(), first)
+        self.assertEqual(first['betweenness'], nx.betweenness_centrality(network.G))
+
+        gaps = network.identify_citation_gaps(min_citations=3)
+        self.assertEqual([gap['author'] for gap in gaps], ['Eratosthenes'])
+        network.identify_load_bearing_nodes(threshold=0.0)
+        queue = network.calculate_priority_queue(gaps, [])
+        self.assertIs(network.centralities(), first)
+
+        expected = (first['betweenness']['Eratosthenes'] + first['eigenvector']['Eratosthenes']) / 2
+        self.assertAlmostEqual(queue.loc[0, 'network_centrality'], expected)
+
+        # Weight-only updates keep the cache; structural changes invalidate it
+        network._add_fragment_to_network(_fragment('Strabo', 'Eratosthenes'))
+        self.assertIs(network.centralities(), first)
+        network.G.add_edge('Eratosthenes', 'Galen')
+        second = network.centralities()
+        self.assertIsNot(second, first)
+        self.assertEqual(second['betweenness'], nx.betweenness_centrality(network.G))
+        network.G.remove_node('Galen')
+        self.assertNotIn('Galen', network.centralities()['betweenness'])
+        print(f"✓ Cached centralities for {network.G.number_of_nodes()} authors")
+
+    def test_02_node_impact(self):
+        """Test 2: Node impacts are exact on small networks and within the bound when sampled."""
+        # Chain Plutarch -> Strabo -> Eratosthenes -> Hipparchus plus Galen -> Eratosthenes:
+        # removing Strabo disconnects 2 of the 5 other connected pairs, Eratosthenes 3 of 4
+        network = CitationNetwork()
+        network.build_network([
+            _fragment('Plutarch', 'Strabo'),
+            _fragment('Strabo', 'Eratosthenes'),
+            _fragment('Eratosthenes', 'Hipparchus'),
+            _fragment('Galen', 'Eratosthenes'),
+        ])
+        impacts = network.estimate_node_impacts(['Strabo', 'Eratosthenes', 'Galen'], max_workers=2)
+        self.assertAlmostEqual(impacts['Strabo'], 2 / 5)
+        self.assertAlmostEqual(impacts['Eratosthenes'], 3 / 4)
+        self.assertEqual(impacts['Galen'], 0.0)
+
+        critical = network.identify_load_bearing_nodes(threshold=0.0, max_workers=1)
+        self.assertEqual(critical[0]['node'], 'Eratosthenes')
+        self.assertEqual(critical[0]['impact_score'], impacts['Eratosthenes'])
+
+        # A larger network: exact (every pair) vs the default bound of 0.05
+        network.G = nx.gnp_random_graph(120, 0.015, directed=True, seed=4, create_using=VersionedDiGraph)
+        nodes = list(network.G)
+        exact = network.estimate_node_impacts(nodes, epsilon=0.01, max_workers=1)
+        sampled = network.estimate_node_impacts(nodes, max_workers=2, seed=7)
+        errors = [abs(exact[node] - sampled[node]) for node in nodes]
+        self.assertGreater(max(exact.values()), 0.05)
+        self.assertLess(max(errors), 0.05)
+
+        # Forced through the pool, workers see the same graph as the parent
+        network.IMPACT_POOL_MIN_WORK = 0
+        self.assertEqual(network.estimate_node_impacts(nodes, max_workers=2, seed=7), sampled)
+        print(f"✓ Estimated node impacts (max sampling error {max(errors):.3f})")
+
+    def test_03_edge_citations(self):
+        """Test 3: Edge citations are kept as lists and encoded as JSON only on export."""
+        edge = self.network.G['Strabo']['Eratosthenes']
+        self.network._add_fragment_to_network(_fragment('Strabo', 'Eratosthenes'))
+        self.assertEqual(edge['weight'], 2)
+        self.assertEqual(edge['citations'], [{'cited_author': 'Eratosthenes', 'confidence': 0.6}] * 2)
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            for format in ('graphml', 'gexf', 'json'):
+                self.network.export_network(os.path.join(temp_dir, f'network.{format}'), format=format)
+
+            graph = nx.read_graphml(os.path.join(temp_dir, 'network.graphml'))
+            self.assertEqual(json.loads(graph['Strabo']['Eratosthenes']['citations']), edge['citations'])
+            with open(os.path.join(temp_dir, 'network.json')) as f:
+                data = json.load(f)
+            links = data['links'] if 'links' in data else data['edges']  # key renamed in networkx 3.4
+            exported = [link for link in links if link['source'] == 'Strabo' and link['target'] == 'Eratosthenes']
+            self.assertEqual(exported[0]['citations'], edge['citations'])
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        # Exporting leaves the working graph untouched
+        self.assertIsInstance(edge['citations'], list)
+        print(f"✓ Exported {self.network.G.number_of_edges()} edges with native citation lists")
+
+    def test_04_incremental_updates(self):
+        """Test 4: Adding and removing fragments in place matches a full rebuild."""
+        network = self.network
+        network.identify_citation_gaps(min_citations=3)
+
+        new = [
+            dict(_fragment('Diodorus', 'Hipparchus', 'Strabo'), id='diod-1'),
+            dict(_fragment('Ptolemy', 'Hipparchus'), id='ptol-1'),
+        ]
+        changed = network.add_fragments(new)
+        self.assertEqual(changed, {'Diodorus', 'Ptolemy', 'Hipparchus', 'Strabo'})
+
+        rebuilt = CitationNetwork()
+        rebuilt.build_network(self.fragments + new)
+        self.assertEqual(sorted(network.G.edges(data='weight')), sorted(rebuilt.G.edges(data='weight')))
+        gaps = network.identify_citation_gaps(min_citations=3)
+        expected = rebuilt.identify_citation_gaps(min_citations=3)
+        # Node order differs from the rebuild, so sums may differ in the last bits
+        for gap, other in zip(gaps, expected):
+            self.assertAlmostEqual(gap.pop('recoverability_score'), other.pop('recoverability_score'), places=12)
+        self.assertEqual(gaps, expected)
+        self.assertEqual({gap['author'] for gap in gaps}, {'Eratosthenes', 'Hipparchus'})
+
+        # Replacing a fragment by id, then removing fragments, undoes their edges and nodes
+        network.add_fragments([dict(_fragment('Ptolemy', 'Eratosthenes'), id='ptol-1')])
+        self.assertFalse(network.G.has_edge('Ptolemy', 'Hipparchus'))
+        changed = network.remove_fragments(['diod-1', 'ptol-1', 'unknown'])
+        self.assertEqual(changed, {'Diodorus', 'Ptolemy', 'Hipparchus', 'Strabo', 'Eratosthenes'})
+        self.assertNotIn('Diodorus', network.G)
+        self.assertEqual(network.G['Strabo']['Eratosthenes']['citations'],
+                         [{'cited_author': 'Eratosthenes', 'confidence': 0.6}])
+        self.assertEqual([gap['author'] for gap in network.identify_citation_gaps(min_citations=3)],
+                         ['Eratosthenes'])
+
+        rebuilt.build_network(self.fragments)
+        self.assertEqual(sorted(network.G.edges(data='weight')), sorted(rebuilt.G.edges(data='weight')))
+
+        # Centralities of a reducible graph do not depend on its update history
+        base = [dict(_fragment('A', 'B'), id='a'), dict(_fragment('C', 'D'), id='c')]
+        extra = [dict(_fragment('E', 'B'), id='e')]
+        for backend in CitationNetwork.BACKENDS:
+            incremental = CitationNetwork(backend=backend)
+            incremental.build_network(base)
+            incremental.centralities()
+            incremental.add_fragments(extra)
+            fresh = CitationNetwork(backend=backend)
+            fresh.build_network(base + extra)
+            for measure, values in fresh.centralities().items():
+                for node, value in values.items():
+                    self.assertAlmostEqual(incremental.centralities()[measure][node], value, places=12,
+                                           msg=f"{backend} {measure} {node}")
+        for measure in ('betweenness', 'eigenvector'):
+            for node, value in rebuilt.centralities()[measure].items():
+                self.assertAlmostEqual(network.centralities()[measure][node], value, places=4)
+        print(f"✓ Updated network in place ({network.G.number_of_nodes()} authors)")
+
+    def test_05_sparse_backend(self):
+        """Test 5: The CSR backend matches NetworkX measures and drives the same analysis."""
+        graph = nx.gnp_random_graph(150, 0.02, directed=True, seed=2)
+        for u, v in graph.edges():
+            graph[u][v]['weight'] = 1 + (u + v) % 3
+        snapshot = SparseGraph.from_networkx(graph)
+
+        self.assertEqual(snapshot.in_degree(), dict(graph.in_degree()))
+        self.assertEqual(snapshot.out_degree(), dict(graph.out_degree()))
+        expected = {
+            'betweenness': nx.betweenness_centrality(graph),
+            'eigenvector': nx.eigenvector_centrality(graph, max_iter=1000),
+            'pagerank': nx.pagerank(graph),
+        }
+        actual = {
+            'betweenness': snapshot.betweenness_centrality(batch_size=16),
+            'eigenvector': snapshot.eigenvector_centrality(max_iter=1000),
+            'pagerank': snapshot.pagerank(),
+        }
+        for measure, values in expected.items():
+            for node, value in values.items():
+                self.assertAlmostEqual(actual[measure][node], value, places=6, msg=measure)
+
+        # Sampled betweenness is rescaled like NetworkX's k-sample estimate
+        sampled = snapshot.betweenness_centrality(k=75)
+        error = sum(abs(sampled[node] - value) for node, value in expected['betweenness'].items()) / len(graph)
+        self.assertLess(error, 0.01)
+
+        sparse_network = CitationNetwork(backend='sparse')
+        sparse_network.build_network(self.fragments)
+        sparse_gaps = sparse_network.identify_citation_gaps(min_citations=3)
+        gaps = self.network.identify_citation_gaps(min_citations=3)
+        self.assertEqual([gap['author'] for gap in sparse_gaps], [gap['author'] for gap in gaps])
+        self.assertAlmostEqual(sparse_gaps[0]['recoverability_score'], gaps[0]['recoverability_score'])
+        self.assertEqual(len(sparse_network.identify_load_bearing_nodes(threshold=0.0, max_workers=1)),
+                         len(self.network.identify_load_bearing_nodes(threshold=0.0, max_workers=1)))
+        with self.assertRaises(ValueError):
+            CitationNetwork(backend='igraph')
+        print(f"✓ Sparse backend matches NetworkX on {len(graph)} nodes (sampled error {error:.4f})")
+
+    def test_06_reachability_index(self):
+        """Test 6: Path, language-route and k-hop queries, kept current as edges are added."""
+        graph = nx.gnp_random_graph(80, 0.02, directed=True, seed=5)
+        index = ReachabilityIndex(graph)
+        for a in graph:
+            for b in graph:
+                self.assertEqual(index.has_path(a, b), a == b or nx.has_path(graph, a, b))
+
+        # New edges, including ones that close cycles, update the closure in place
+        for u, v in [(0, 40), (40, 0), (79, 81), (12, 3), (3, 12)]:
+            graph.add_edge(u, v)
+            index.add_edge(u, v)
+        for a in graph:
+            self.assertEqual(index.reachable(a), nx.descendants(graph, a) | {a})
+        self.assertEqual(index.neighborhood(0, 1), set(graph.successors(0)))
+        self.assertEqual(index.neighborhood(0, 2, reverse=True),
+                         set(nx.single_source_shortest_path_length(graph.reverse(), 0, cutoff=2)) - {0})
+
+        # A Latin reader of an Arabic commentator of a Syriac translator of a lost Greek work
+        network = self.network
+        network.add_fragments([
+            {'id': 'syr', 'source_author': 'Sergius', 'language': 'syriac', 'citations': [{'cited_author': 'Eratosthenes'}]},
+            {'id': 'ara', 'source_author': 'Hunayn', 'language': 'arabic', 'citations': [{'cited_author': 'Sergius'}]},
+        ])
+        self.assertTrue(network.has_path('Hunayn', 'Eratosthenes'))
+        self.assertFalse(network.has_path('Eratosthenes', 'Hunayn'))
+        self.assertIn('Eratosthenes', network.paths_via('syriac', 'arabic'))
+        self.assertNotIn('Eratosthenes', network.paths_via('syriac', 'arabic', 'latin'))
+        index = network.reachability_index()
+        network.add_fragments([
+            {'id': 'lat', 'source_author': 'Gerard', 'language': 'latin', 'citations': [{'cited_author': 'Hunayn'}]},
+        ])
+        self.assertIs(network.reachability_index(), index)
+        self.assertIn('Eratosthenes', network.paths_via('syriac', 'arabic', 'latin'))
+        self.assertNotIn('Gerard', network.paths_via('syriac'))
+        self.assertEqual(network.neighborhood('Eratosthenes', 2, reverse=True),
+                         {'Strabo', 'Plutarch', 'Athenaeus', 'Sergius', 'Galen', 'Hunayn'})
+
+        # Removals rebuild the index on next use
+        network.remove_fragments(['ara'])
+        self.assertFalse(network.has_path('Gerard', 'Eratosthenes'))
+        self.assertTrue(network._has_translation_chain('Eratosthenes'))
+        print(f"✓ Answered reachability queries over {len(index)} authors")
+
+    def test_07_graph_snapshot(self):
+        """Test 7: Snapshots round-trip the graph and open as zero-copy views."""
+        self.network.add_fragments([
+            {'id': 'ara', 'source_author': 'Ḥunayn ibn Isḥāq', 'citations': [{'cited_author': 'Galen'}]},
+        ])
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, 'network.snap')
+            self.network.export_network(path, format='snapshot')
+            snapshot = GraphSnapshot(path)
+
+            self.assertEqual(list(snapshot.nodes), list(self.network.G.nodes()))
+            self.assertEqual(snapshot.nodes[len(snapshot) - 1], 'Ḥunayn ibn Isḥāq')
+            self.assertEqual([snapshot.node_attributes(i)['confidence'] for i in range(len(snapshot))],
+                             [data.get('confidence', 0.5) for _, data in self.network.G.nodes(data=True)])
+            self.assertEqual(len(snapshot.strings), len(snapshot) + 1)  # one interned 'author' type
+            self.assertEqual(snapshot.node_attributes(0)['fragments'], self.network.G.nodes['Strabo']['fragments'])
+            graph = snapshot.to_networkx()
+            self.assertEqual(set(graph.edges()), set(self.network.G.edges()))
+            self.assertEqual(graph['Strabo']['Eratosthenes']['weight'], self.network.G['Strabo']['Eratosthenes']['weight'])
+
+            # Centralities run straight on the mapped arrays
+            sparse_graph = snapshot.sparse_graph()
+            self.assertTrue(np.shares_memory(sparse_graph.matrix.indices, snapshot.indices))
+            expected = self.network.sparse_snapshot().pagerank()
+            for node, value in sparse_graph.pagerank().items():
+                self.assertAlmostEqual(value, expected[node])
+
+            # The shipped node-link export converts without a NetworkX rebuild
+            source = os.path.join(os.path.dirname(__file__), '../data/networks/citation_network.json')
+            path = os.path.join(temp_dir, 'shipped.snap')
+            convert_node_link(source, path)
+            with open(source) as f:
+                data = json.load(f)
+            snapshot = GraphSnapshot(path, mmap=False)
+            self.assertEqual(list(snapshot.nodes), [node['id'] for node in data['nodes']])
+            self.assertEqual(snapshot.node_table['confidence'].tolist(),
+                             [node.get('confidence', 0.5) for node in data['nodes']])
+            self.assertEqual(snapshot.n_edges, len(data['links']))
+
+            path = os.path.join(temp_dir, 'network.json')
+            self.network.export_network(path, format='json')
+            with self.assertRaises(ValueError):
+                GraphSnapshot(path)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        print(f"✓ Round-tripped {len(graph)} authors through a graph snapshot")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,345 @@
+"""
+Test suite for the CALLIMACHINA SQLite backend.
+
+Tests cover:
+1. Pooled WAL-mode connections
+2. Joined multi-work fragment loading
+3. Chunked bulk ingest from iterators and JSONL
+4. Write-behind confidence updates
+5. FTS5 full-text search kept in sync by triggers
+6. Lazy shared instance and versioned schema creation
+7. Stored reconstructions and latest-per-work lookup
+8. Append-only run manifest for resumable batch runs
+"""
+
+import unittest
+import sys
+import os
+import sqlite3
+import tempfile
+import threading
+import json
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+try:
+    import database
+    from database import FragmentDatabase
+    IMPORT_SUCCESS = True
+except ImportError as e:
+    print(f"Import error: {e}")
+    IMPORT_SUCCESS = False
+
+
+class TestFragmentDatabase(unittest.TestCase):
+    """Test suite for FragmentDatabase."""
+
+    def setUp(self):
+        """Create a fresh database per test."""
+        if not IMPORT_SUCCESS:
+            raise unittest.SkipTest("Failed to import database module")
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = FragmentDatabase(os.path.join(self.temp_dir, "test_corpus.db"))
+
+        self.sample_fragment = {
+            'id': 'test_fragment_1',
+            'text': 'As Aristotle says in his Physics, the natural motion of elements follows their nature.',
+            'source': 'papyri.info',
+            'source_author': 'Unknown1',
+            'confidence': 0.8,
+            'work_id': 'Aristotle.Physics',
+            'citations': [
+                {
+                    'cited_author': 'Aristotle',
+                    'cited_work': 'Physics',
+                    'pattern': 'as_says_in',
+                    'confidence': 0.85
+                }
+            ]
+        }
+
+    def tearDown(self):
+        """Close pooled connections and remove the database."""
+        import shutil
+        self.db.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_01_connection_pool(self):
+        """Test 1: Connections are reused per thread and run in WAL mode."""
+        conn = self.db._get_connection()
+        self.assertIs(conn, self.db._get_connection())
+
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(journal_mode.lower(), 'wal')
+
+        # A second thread gets its own connection
+        other = []
+        thread = threading.Thread(target=lambda: other.append(self.db._get_connection()))
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], conn)
+
+        # close() releases connections opened by other threads too
+        self.db.close()
+        for pooled in (conn, other[0]):
+            with self.assertRaisesRegex(sqlite3.ProgrammingError, 'closed database'):
+                pooled.execute("SELECT 1")
+
+        # Pooled connection still round-trips data
+        self.assertTrue(self.db.insert_fragment(self.sample_fragment))
+        fragments = self.db.get_fragments_by_work('Aristotle.Physics')
+        self.assertEqual(len(fragments), 1)
+        self.assertEqual(fragments[0]['citations'][0]['cited_author'], 'Aristotle')
+
+    def test_02_get_fragments_for_works(self):
+        """Test 2: Fragments and citations for many works load in one pass."""
+        second = dict(self.sample_fragment, id='test_fragment_2', citations=[
+            {'cited_author': 'Plato', 'cited_work': 'Timaeus', 'pattern': 'according_to', 'confidence': 0.7},
+            {'cited_author': 'Democritus', 'cited_work': None, 'pattern': 'as_says_in', 'confidence': 0.6},
+        ])
+        other_work = dict(self.sample_fragment, id='test_fragment_3', work_id='Plato.Republic',
+                          citations=[], metadata={'provenance': 'Oxyrhynchus'})
+        for fragment in (self.sample_fragment, second, other_work):
+            self.assertTrue(self.db.insert_fragment(fragment))
+
+        by_work = self.db.get_fragments_for_works(['Aristotle.Physics', 'Plato.Republic', 'Lost.Work'])
+        self.assertEqual(set(by_work), {'Aristotle.Physics', 'Plato.Republic', 'Lost.Work'})
+        self.assertEqual(by_work['Lost.Work'], [])
+
+        physics = {f['id']: f for f in by_work['Aristotle.Physics']}
+        self.assertEqual(len(physics['test_fragment_1']['citations']), 1)
+        self.assertEqual([c['cited_author'] for c in physics['test_fragment_2']['citations']],
+                         ['Plato', 'Democritus'])
+
+        republic = by_work['Plato.Republic'][0]
+        self.assertEqual(republic['citations'], [])
+        self.assertEqual(republic['metadata'], {'provenance': 'Oxyrhynchus'})
+        self.assertEqual(self.db.get_fragments_by_work('Plato.Republic'), [republic])
+
+    def test_03_bulk_ingest(self):
+        """Test 3: Bulk ingest writes citations, streams JSONL and replaces cleanly."""
+        def generate(n):
+            for i in range(n):
+                yield dict(self.sample_fragment, id=f'bulk_{i}')
+
+        inserted = self.db.bulk_insert_fragments(generate(25), chunk_size=10)
+        self.assertEqual(inserted, 25)
+        fragments = self.db.get_fragments_by_work('Aristotle.Physics')
+        self.assertEqual(len(fragments), 25)
+        self.assertTrue(all(len(f['citations']) == 1 for f in fragments))
+
+        # JSONL dump, including one malformed record without text
+        jsonl_path = os.path.join(self.temp_dir, 'fragments.jsonl')
+        with open(jsonl_path, 'w') as f:
+            for i in range(5):
+                f.write(json.dumps(dict(self.sample_fragment, id=f'bulk_{i}')) + '\n')
+            f.write(json.dumps({'id': 'broken'}) + '\n')
+
+            f.write(json.dumps(dict(self.sample_fragment, id='fresh_1')) + '\n')
+
+        stats = self.db.ingest_jsonl(jsonl_path, chunk_size=2, track_new=True)
+        self.assertEqual(stats['new_ids'], {'fresh_1'})
+        self.assertEqual(stats['fragments'], 6)
+        self.assertEqual(stats['citations'], 6)
+        self.assertEqual(stats['skipped'], 1)
+        self.assertGreater(stats['rows_per_sec'], 0)
+
+        # Re-ingested fragments keep exactly one copy of their citations
+        self.assertEqual(self.db.ingest_jsonl(jsonl_path, track_new=True)['new_ids'], set())
+        fragments = self.db.get_fragments_by_work('Aristotle.Physics')
+        self.assertEqual(len(fragments), 26)
+        self.assertTrue(all(len(f['citations']) == 1 for f in fragments))
+
+        # Lines that are not fragment objects, or carry unusable citations,
+        # are skipped without aborting the ingest
+        with open(jsonl_path, 'w') as f:
+            f.write(json.dumps(['not', 'a', 'fragment']) + '\n')
+            f.write(json.dumps('bare string') + '\n')
+            f.write(json.dumps(dict(self.sample_fragment, id='bad_citation', citations=['Aristotle'])) + '\n')
+            f.write(json.dumps(dict(self.sample_fragment, id='null_citations', citations=None)) + '\n')
+        stats = self.db.ingest_jsonl(jsonl_path)
+        self.assertEqual(stats['fragments'], 1)
+        self.assertEqual(stats['citations'], 0)
+        self.assertEqual(stats['skipped'], 3)
+        stored = {f['id'] for f in self.db.get_fragments_by_work('Aristotle.Physics')}
+        self.assertIn('null_citations', stored)
+        self.assertNotIn('bad_citation', stored)
+
+    def test_04_write_behind_queue(self):
+        """Test 4: Queued confidence updates are committed in batches and on close."""
+        for i in range(12):
+            self.db.insert_work({'work_id': f'Author.Work{i}', 'author': 'Author'})
+
+        with self.db.write_behind(flush_interval=60.0, max_batch=5) as writer:
+            for i in range(12):
+                writer.update_work_confidence(f'Author.Work{i}', 0.5 + i / 100)
+            writer.flush()
+            self.assertEqual(writer.written, 12)
+            writer.update_work_confidence('Author.Work0', 0.99)
+        self.assertEqual(writer.written, 13)
+
+        df = self.db.get_works_by_priority(limit=100).set_index('work_id')
+        self.assertAlmostEqual(df.loc['Author.Work0', 'reconstruction_confidence'], 0.99)
+        self.assertAlmostEqual(df.loc['Author.Work11', 'reconstruction_confidence'], 0.61)
+
+    def test_05_search_text(self):
+        """Test 5: Full-text search ranks matches and follows inserts, replaces and deletes."""
+        self.db.bulk_insert_fragments([
+            self.sample_fragment,
+            dict(self.sample_fragment, id='plato_1', work_id='Plato.Republic',
+                 text='According to Plato, the ideal state must have philosophers as rulers.'),
+            dict(self.sample_fragment, id='greek_1', work_id='Unknown.Hymn',
+                 text='καὶ ὁ ποιητὴς μέγας ἦν καὶ φιλόσοφος'),
+        ])
+
+        hits = self.db.search_text('Aristotle')
+        self.assertEqual([h['id'] for h in hits], ['test_fragment_1'])
+        self.assertIn('rank', hits[0])
+
+        self.assertEqual(len(self.db.search_text('natural motion')), 1)
+        self.assertEqual(self.db.search_text('philosophers', work_id='Aristotle.Physics'), [])
+        self.assertEqual(len(self.db.search_text('plato OR aristotle', raw=True)), 2)
+
+        # Greek text is tokenized like any other script
+        self.assertEqual([h['id'] for h in self.db.search_text('ποιητὴς')], ['greek_1'])
+
+        # Replacing a fragment re-indexes its text
+        self.db.insert_fragment(dict(self.sample_fragment, text='Theophrastus on plants.'))
+        self.assertEqual(self.db.search_text('Aristotle'), [])
+        self.assertEqual(len(self.db.search_text('Theophrastus')), 1)
+
+        with self.db._connect() as conn:
+            conn.execute("DELETE FROM fragments WHERE id = 'plato_1'")
+        self.assertEqual(self.db.search_text('philosophers'), [])
+
+        # VACUUM compacts the gaps left above without moving the index keys
+        self.db._get_connection().execute("VACUUM")
+        self.assertEqual([h['id'] for h in self.db.search_text('ποιητὴς')], ['greek_1'])
+        self.assertEqual([h['id'] for h in self.db.search_text('Theophrastus')], ['test_fragment_1'])
+
+    def test_06_lazy_database_and_schema_version(self):
+        """Test 6: The shared instance opens on first use and DDL runs once per schema version."""
+        path = os.path.join(self.temp_dir, "shared.db")
+        previous_path = database._database_path
+        database.configure_database(path)
+        try:
+            self.assertFalse(os.path.exists(path))
+            self.assertEqual(database.db.get_reconstruction_stats()['total_fragments'], 0)
+            self.assertTrue(os.path.exists(path))
+            self.assertIs(database.get_database(), database.get_database())
+        finally:
+            database.get_database().close()
+            database._database = None
+            database._database_path = previous_path
+
+        conn = self.db._get_connection()
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        self.assertEqual(version, FragmentDatabase.SCHEMA_VERSION)
+
+        # Reopening a current database skips DDL but still detects the FTS index
+        reopened = FragmentDatabase(self.db.db_path)
+        self.assertEqual(reopened.fts_enabled, self.db.fts_enabled)
+        reopened.close()
+
+        # Opening a v4 database adds the confidence_history Beta columns
+        with self.db._connect() as conn:
+            conn.execute("ALTER TABLE confidence_history DROP COLUMN alpha")
+            conn.execute("ALTER TABLE confidence_history DROP COLUMN beta")
+            conn.execute("PRAGMA user_version = 4")
+        migrated = FragmentDatabase(self.db.db_path)
+        columns = {row[1] for row in migrated._get_connection().execute("PRAGMA table_info(confidence_history)")}
+        self.assertTrue({'alpha', 'beta'} <= columns)
+        migrated.close()
+
+        # A v5 fragments table, keyed by its implicit rowid, is copied under
+        # an explicit docid and its FTS index rebuilt
+        legacy_path = os.path.join(self.temp_dir, "legacy.db")
+        legacy = sqlite3.connect(legacy_path)
+        legacy.executescript("""
+            CREATE TABLE fragments (id TEXT PRIMARY KEY, text TEXT NOT NULL, source TEXT,
+                                    source_author TEXT, confidence REAL, position INTEGER,
+                                    work_id TEXT, language TEXT DEFAULT 'greek',
+                                    date_added TIMESTAMP DEFAULT CURRENT_TIMESTAMP, metadata TEXT);
+            CREATE VIRTUAL TABLE fragments_fts USING fts5(text, content='fragments', content_rowid='rowid');
+            CREATE TRIGGER fragments_fts_insert AFTER INSERT ON fragments BEGIN
+                INSERT INTO fragments_fts(rowid, text) VALUES (new.rowid, new.text);
+            END;
+            INSERT INTO fragments (id, text, work_id) VALUES ('old_1', 'Callimachus wrote the Pinakes', 'Callimachus.Pinakes');
+            INSERT INTO fragments_fts(fragments_fts) VALUES ('rebuild');
+            PRAGMA user_version = 5;
+        """)
+        legacy.close()
+        migrated = FragmentDatabase(legacy_path)
+        self.assertEqual([h['id'] for h in migrated.search_text('Pinakes')], ['old_1'])
+        migrated.insert_fragment(dict(self.sample_fragment, id='new_1'))
+        migrated._get_connection().execute("VACUUM")
+        self.assertEqual([h['id'] for h in migrated.search_text('Aristotle')], ['new_1'])
+        migrated.close()
+
+    def test_07_reconstructions(self):
+        """Test 7: Reconstructions are stored in batches and the latest per work is returned."""
+        def results(work_id, mean):
+            return {
+                'work_id': work_id,
+                'prior_confidence': 0.5,
+                'posterior_confidence': {'mean': mean, 'std': 0.05, 'ci_lower': mean - 0.1, 'ci_upper': mean + 0.1},
+                'fragments_used': 2,
+                'citations_used': 1,
+                'reconstruction': {1: 'First [confidence: 80.0%]', 1.5: '[LACUNA - missing text]', 10: 'Last'},
+                'metrics': {'text_coverage': 0.1},
+            }
+        history = [{'prior': 0.5, 'posterior_mean': 0.6, 'evidence_count': 2, 'timestamp': '2025-11-06 20:49:12',
+                    'alpha': 7.0, 'beta': 5.0}]
+
+        ids = self.db.save_reconstructions([
+            (results('Aristotle.Protrepticus', 0.6), history),
+            (results('Plato.Lost', 0.4), []),
+        ])
+        self.assertEqual(len(ids), 2)
+        self.db.save_reconstructions([(results('Aristotle.Protrepticus', 0.7), history * 2)])
+
+        latest = self.db.get_latest_reconstructions()
+        self.assertEqual(set(latest), {'Aristotle.Protrepticus', 'Plato.Lost'})
+
+        protrepticus = self.db.get_latest_reconstruction('Aristotle.Protrepticus')
+        self.assertAlmostEqual(protrepticus['posterior_confidence']['mean'], 0.7)
+        self.assertEqual(len(protrepticus['confidence_history']), 2)
+        self.assertEqual(protrepticus['confidence_history'][0]['alpha'], 7.0)
+        self.assertEqual(protrepticus['confidence_history'][0]['beta'], 5.0)
+        self.assertEqual(sorted(protrepticus['reconstruction']), [1, 1.5, 10])
+        self.assertEqual(latest['Plato.Lost']['confidence_history'], [])
+        self.assertIsNone(self.db.get_latest_reconstruction('Missing.Work'))
+
+
+    def test_08_run_manifest(self):
+        """Test 8: Completed works are journaled per run, in order, and never overwritten."""
+        with self.db.write_behind(flush_interval=60.0, max_batch=2) as writer:
+            writer.record_completion('run-a', 'Plato.Lost', 'hash1', 0.4, 2)
+            writer.record_completion('run-a', 'Aristotle.Protrepticus', 'hash2', 0.7, 3)
+            writer.record_completion('run-b', 'Plato.Lost', 'hash3', 0.5, 2)
+        self.assertEqual(writer.completions_written, 3)
+
+        # A duplicate completion keeps the original entry
+        self.db.record_run_completions([('run-a', 'Plato.Lost', 'changed', 0.9, 9)])
+
+        manifest = self.db.get_run_manifest('run-a')
+        self.assertEqual(manifest['work_id'].tolist(), ['Plato.Lost', 'Aristotle.Protrepticus'])
+        self.assertEqual(manifest['result_hash'].tolist(), ['hash1', 'hash2'])
+        self.assertEqual(len(self.db.get_run_manifest('run-b')), 1)
+        self.assertTrue(self.db.get_run_manifest('missing').empty)
+
+        # A work whose results fail to store is not marked complete, even
+        # when its completion is flushed in a later batch
+        unstorable = {'work_id': 'Galen.Lost', 'fragments_used': {'not': 'bindable'}}
+        with self.db.write_behind(flush_interval=60.0, max_batch=1) as writer:
+            writer.save_reconstruction(unstorable, [])
+            writer.record_completion('run-c', 'Galen.Lost', 'hash4', 0.3, 1)
+            writer.record_completion('run-c', 'Plato.Lost', 'hash5', 0.4, 2)
+        self.assertEqual(writer.failed_works, {'Galen.Lost'})
+        self.assertEqual(self.db.get_run_manifest('run-c')['work_id'].tolist(), ['Plato.Lost'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Test suite for the CALLIMACHINA JSON serializer.
+
+Tests cover:
+1. Numpy-aware encoding, compact mode and JSONL streaming
+"""
+
+import unittest
+import sys
+import os
+import json
+import shutil
+import tempfile
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
+
+try:
+    import serialization
+    IMPORT_SUCCESS = True
+except ImportError as e:
+    print(f"Import error: {e}")
+    IMPORT_SUCCESS = False
+
+
+class TestSerialization(unittest.TestCase):
+    """Test suite for the serialization module."""
+
+    def setUp(self):
+        """Create a scratch output directory."""
+        if not IMPORT_SUCCESS:
+            raise unittest.SkipTest("Failed to import serialization module")
+
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_01_numpy_encoding(self):
+        """Test 1: Numpy values encode natively in both modes and stream as JSONL."""
+        record = {
+            'work_id': 'Eratosthenes.Geographika',
+            'posterior_confidence': {'mean': np.float64(0.71), 'alpha': np.float32(7.5)},
+            'metrics': {'fragment_count': np.int64(12), 'has_arabic': np.bool_(True)},
+            'positions': np.arange(3),
+            'reconstruction': {1: 'text'},
+        }
+        expected = {
+            'work_id': 'Eratosthenes.Geographika',
+            'posterior_confidence': {'mean': 0.71, 'alpha': 7.5},
+            'metrics': {'fragment_count': 12, 'has_arabic': True},
+            'positions': [0, 1, 2],
+            'reconstruction': {'1': 'text'},
+        }
+
+        indented = serialization.dumps(record)
+        compact = serialization.dumps(record, compact=True)
+        self.assertEqual(json.loads(indented), expected)
+        self.assertEqual(json.loads(compact), expected)
+        self.assertIn('\n  ', indented)
+        self.assertNotIn(' ', compact.replace('Eratosthenes.Geographika', ''))
+
+        path = os.path.join(self.temp_dir, 'out', 'results.jsonl')
+        with serialization.JSONLWriter(path) as writer:
+            self.assertEqual(writer.write_many([record, record]), 2)
+        with serialization.JSONLWriter(path, append=True) as writer:
+            writer.write(record)
+
+        with open(path) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(all(json.loads(line) == expected for line in lines))
+        print(f"✓ Serialized numpy values ({len(compact)} bytes compact, {len(indented)} indented)")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,16 +9,66 @@ Creates Gephi-compatible graph files for scholarly analysis
 import json
 import yaml
 import re
+from array import array
 from datetime import datetime
-from typing import Dict, List, Set, Tuple, Any
+from typing import Dict, List, Tuple, Any, Iterator
 from collections import defaultdict
+from collections.abc import Sequence
 import xml.etree.ElementTree as ET
 
+import numpy as np
+
+EDGE_TYPES = ('cites', 'transmission')
+
+
+class EdgeView(Sequence):
+    """
+    Read-only list of edge dicts over NetworkBuilder's edge columns
+    
+    Dicts are built on access, so changes to them are not kept
+    """
+    
+    def __init__(self, builder: 'NetworkBuilder'):
+        self.builder = builder
+    
+    def __len__(self) -> int:
+        return len(self.builder._edge_source)
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self.builder._edge_dict(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('edge index out of range')
+        return self.builder._edge_dict(i)
+    
+    def __iter__(self) -> Iterator[Dict]:
+        return (self.builder._edge_dict(i) for i in range(len(self)))
+
+
 class NetworkBuilder:
     def __init__(self):
+        # Nodes are interned to integer ids (their position in node_ids);
+        # edges are stored as parallel columns and viewed as dicts on demand
+        self.node_ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._edge_source = array('q')
+        self._edge_target = array('q')
+        self._edge_type = array('B')  # index into EDGE_TYPES
+        self._edge_weight = array('d')
+        self._edge_confidence = array('d')
+        self._edge_citation_type = array('q')  # interned value ids
+        self._edge_date_range = array('q')
+        self._transmissions: Dict[int, Tuple[int, List[str]]] = {}  # edge -> (century gap, common works)
+        self._values: List[Any] = []
+        self._value_ids: Dict[Any, int] = {}
+        self.in_degree = np.zeros(0, dtype=np.int64)
+        self.out_degree = np.zeros(0, dtype=np.int64)
+        
         self.graph = {
             'nodes': {},
-            'edges': [],
+            'edges': EdgeView(self),
             'metadata': {
                 'created': datetime.now().isoformat(),
                 'format': 'citation_network',
@@ -27,6 +77,7 @@ class NetworkBuilder:
         }
         self.lost_works_index = {}
         self.citation_chains = defaultdict(list)
+        self.source_works = defaultdict(set)  # normalized source id -> ids of works it cites
         
         print("[NETWORK BUILDER] Initializing citation network system...")
     
@@ -54,7 +105,7 @@ class NetworkBuilder:
         work_id = lost_work['title'].replace(' ', '_').lower()
         
         # Add lost work node
-        self.graph['nodes'][work_id] = {
+        self._add_node(work_id, {
             'id': work_id,
             'label': lost_work['title'],
             'type': 'lost_work',
@@ -66,7 +117,7 @@ class NetworkBuilder:
             'fragments': lost_work.get('fragments', 0),
             'color': '#FF0000',  # Red for lost works
             'size': 20 + lost_work.get('priority_score', 0) / 5  # Size by importance
-        }
+        })
         
         # Store in index
         self.lost_works_index[work_id] = lost_work
@@ -82,7 +133,7 @@ class NetworkBuilder:
         
         # Add source node if not exists
         if source_id not in self.graph['nodes']:
-            self.graph['nodes'][source_id] = {
+            self._add_node(source_id, {
                 'id': source_id,
                 'label': source,
                 'type': 'citation_source',
@@ -90,24 +141,74 @@ class NetworkBuilder:
                 'language': citation.get('language', 'unknown'),
                 'color': '#4169E1',  # Blue for sources
                 'size': 15
-            }
+            })
         
         # Add citation edge
-        edge_id = f"{source_id}_to_{work_id}_{len(self.graph['edges'])}"
-        
-        edge = {
-            'id': edge_id,
-            'source': source_id,
-            'target': work_id,
+        confidence = citation.get('independence_score', 0.5)
+        self._add_edge(source_id, work_id, 'cites', confidence * 2, confidence=confidence,
+                       citation_type=citation.get('citation_type', 'unknown'),
+                       date_range=citation.get('date_range', 'unknown'))
+        self.citation_chains[work_id].append(citation)
+        self.source_works[source_id].add(work_id)
+    
+    def _add_node(self, node_id: str, node: Dict):
+        """Add or replace a node, keeping its integer id"""
+        if node_id not in self.node_ids:
+            self.node_ids[node_id] = len(self.node_ids)
+        self.graph['nodes'][node_id] = node
+    
+    def _intern(self, value: Any) -> int:
+        """Id of a repeated edge attribute value (citation type, date range)"""
+        if value not in self._value_ids:
+            self._value_ids[value] = len(self._values)
+            self._values.append(value)
+        return self._value_ids[value]
+    
+    def _add_edge(self, source_id: str, target_id: str, edge_type: str, weight: float,
+                  confidence: float = 0.0, citation_type: Any = None, date_range: Any = None) -> int:
+        """Append an edge to the columns and return its index"""
+        self._edge_source.append(self.node_ids[source_id])
+        self._edge_target.append(self.node_ids[target_id])
+        self._edge_type.append(EDGE_TYPES.index(edge_type))
+        self._edge_weight.append(weight)
+        self._edge_confidence.append(confidence)
+        self._edge_citation_type.append(self._intern(citation_type))
+        self._edge_date_range.append(self._intern(date_range))
+        return len(self._edge_source) - 1
+    
+    def _edge_dict(self, i: int) -> Dict:
+        """Edge i in the dict form used by exports"""
+        node_names = self._node_names()
+        source = node_names[self._edge_source[i]]
+        target = node_names[self._edge_target[i]]
+        if EDGE_TYPES[self._edge_type[i]] == 'transmission':
+            century_gap, common_works = self._transmissions[i]
+            return {
+                'id': f"transmission_{source}_to_{target}",
+                'source': source,
+                'target': target,
+                'type': 'transmission',
+                'relationship': 'temporal_succession',
+                'century_gap': century_gap,
+                'weight': len(common_works),
+                'common_works': common_works
+            }
+        return {
+            'id': f"{source}_to_{target}_{i}",
+            'source': source,
+            'target': target,
             'type': 'cites',
-            'citation_type': citation.get('citation_type', 'unknown'),
-            'confidence': citation.get('independence_score', 0.5),
-            'date_range': citation.get('date_range', 'unknown'),
-            'weight': citation.get('independence_score', 0.5) * 2
+            'citation_type': self._values[self._edge_citation_type[i]],
+            'confidence': self._edge_confidence[i],
+            'date_range': self._values[self._edge_date_range[i]],
+            'weight': self._edge_weight[i]
         }
-        
-        self.graph['edges'].append(edge)
-        self.citation_chains[work_id].append(citation)
+    
+    def _node_names(self) -> List[str]:
+        """Node id strings by integer id"""
+        if len(self._names) != len(self.node_ids):
+            self._names = list(self.node_ids)
+        return self._names
     
     def _add_transmission_edges(self):
         """Add edges showing transmission between sources"""
@@ -134,33 +235,13 @@ class NetworkBuilder:
             common_works = self._find_common_citations(source1['id'], source2['id'])
             
             if common_works:
-                edge_id = f"transmission_{source1['id']}_to_{source2['id']}"
-                
-                edge = {
-                    'id': edge_id,
-                    'source': source1['id'],
-                    'target': source2['id'],
-                    'type': 'transmission',
-                    'relationship': 'temporal_succession',
-                    'century_gap': century2 - century1,
-                    'weight': len(common_works),
-                    'common_works': common_works
-                }
-                
-                self.graph['edges'].append(edge)
+                edge = self._add_edge(source1['id'], source2['id'], 'transmission', len(common_works))
+                self._transmissions[edge] = (century2 - century1, common_works)
     
     def _find_common_citations(self, source1_id: str, source2_id: str) -> List[str]:
         """Find works commonly cited by two sources"""
-        works1 = set()
-        works2 = set()
-        
-        for work_id, citations in self.citation_chains.items():
-            sources = [c['source'].replace(' ', '_').lower() for c in citations]
-            if source1_id in sources:
-                works1.add(work_id)
-            if source2_id in sources:
-                works2.add(work_id)
-        
+        works1 = self.source_works.get(source1_id, set())
+        works2 = self.source_works.get(source2_id, set())
         return list(works1 & works2)
     
     def _extract_century(self, date_range: str) -> int:
@@ -198,24 +279,23 @@ class NetworkBuilder:
     
     def _calculate_network_metrics(self):
         """Calculate network centrality and importance metrics"""
-        # Calculate degree centrality for each node
-        degree_counts = defaultdict(int)
-        
-        for edge in self.graph['edges']:
-            degree_counts[edge['source']] += 1
-            degree_counts[edge['target']] += 1
-        
-        # Update nodes with centrality scores
-        for node_id, node in self.graph['nodes'].items():
-            node['degree_centrality'] = degree_counts.get(node_id, 0)
+        # Calculate degree centrality for each node from the edge columns
+        n_nodes = len(self.node_ids)
+        self.out_degree = np.bincount(np.frombuffer(self._edge_source, dtype=np.int64), minlength=n_nodes)
+        self.in_degree = np.bincount(np.frombuffer(self._edge_target, dtype=np.int64), minlength=n_nodes)
+        degrees = self.in_degree + self.out_degree
+        
+        # Update nodes with centrality scores (dict order is integer id order)
+        for node, degree in zip(self.graph['nodes'].values(), degrees.tolist()):
+            node['degree_centrality'] = degree
             
             # Identify key transmission nodes
-            if node['type'] == 'citation_source' and degree_counts.get(node_id, 0) > 3:
+            if node['type'] == 'citation_source' and degree > 3:
                 node['role'] = 'key_transmitter'
                 node['color'] = '#FFD700'  # Gold for key transmitters
             
             # Identify lost works with high citation density
-            if node['type'] == 'lost_work' and degree_counts.get(node_id, 0) > 5:
+            if node['type'] == 'lost_work' and degree > 5:
                 node['role'] = 'well_attested'
                 node['color'] = '#FF69B4'  # Pink for well-attested lost works
     